@@ -0,0 +1,50 @@
+#!venv/bin/python3
+"""The Mimeo Context Manager Lookup Benchmark module.
+
+This module is meant to be executed as a script, but you can also
+import its main() function to achieve the same goal.
+The goal is to measure a per-call cost of reaching the alive
+MimeoContextManager, as Mimeo renderers, decorators and utils do it several
+times for each node. The lookup is measured periodically, while thousands
+of configs are processed one by one in a single process. Its cost should
+stay flat, regardless of the number of configs already processed.
+"""
+from __future__ import annotations
+
+import timeit
+
+from mimeo.config import MimeoConfigFactory
+from mimeo.context import MimeoContextManager
+
+NUM_OF_CONFIGS: int = 10_000
+CHECKPOINT: int = 1_000
+LOOKUPS_PER_CHECKPOINT: int = 100_000
+
+
+def main():
+    """Measure the alive MimeoContextManager lookup cost."""
+    print(f"Processing {NUM_OF_CONFIGS} configs in a single process.")
+    mimeo_config = MimeoConfigFactory.parse({"_templates_": []})
+    for config_index in range(1, NUM_OF_CONFIGS + 1):
+        with MimeoContextManager(mimeo_config):
+            if config_index == 1 or config_index % CHECKPOINT == 0:
+                _measure_lookup(config_index)
+
+
+def _measure_lookup(
+        config_index: int,
+):
+    """Measure the lookup cost within an alive MimeoContextManager.
+
+    Parameters
+    ----------
+    config_index : int
+        A number of configs processed so far
+    """
+    total_time = timeit.timeit(MimeoContextManager, number=LOOKUPS_PER_CHECKPOINT)
+    per_call_ns = total_time / LOOKUPS_PER_CHECKPOINT * 1_000_000_000
+    print(f"Configs: {config_index:>6} | lookup: {per_call_ns:8.1f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
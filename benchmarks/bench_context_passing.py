@@ -0,0 +1,89 @@
+#!venv/bin/python3
+"""The Mimeo Context Passing Benchmark module.
+
+This module is meant to be executed as a script, but you can also
+import its main() function to achieve the same goal.
+The goal is to measure a per-call overhead removed by passing the current
+Mimeo Context explicitly. Context-dependent Mimeo Utils are rendered through
+the public API, where the context is injected by the @mimeo_context decorator,
+and through the internal path, where it is passed directly. Similarly, a data
+unit's iteration is incremented by the @mimeo_next_iteration decorator and
+directly.
+"""
+from __future__ import annotations
+
+import timeit
+from typing import Callable
+
+from mimeo.config import MimeoConfigFactory
+from mimeo.context import MimeoContextManager
+from mimeo.context.decorators import mimeo_next_iteration
+from mimeo.utils import AutoIncrementUtil, CurrentIterationUtil, KeyUtil
+
+NUM_OF_CALLS: int = 500_000
+
+
+def main():
+    """Measure the per-call overhead of injecting a Mimeo Context."""
+    print(f"Measuring {NUM_OF_CALLS} calls of each path.")
+    mimeo_config = MimeoConfigFactory.parse({"_templates_": []})
+    with MimeoContextManager(mimeo_config) as mimeo_manager:
+        context = mimeo_manager.get_context("SomeContext")
+        mimeo_manager.set_current_context(context)
+        context.next_iteration()
+        for mimeo_util in (KeyUtil(), CurrentIterationUtil(), AutoIncrementUtil()):
+            _compare(mimeo_util.KEY,
+                     mimeo_util.render,
+                     lambda util=mimeo_util: util.render_in_context(context))
+
+        @mimeo_next_iteration
+        def next_data_unit():
+            pass
+
+        _compare("next_iteration", next_data_unit, context.next_iteration)
+
+
+def _compare(
+        name: str,
+        decorated: Callable,
+        explicit: Callable,
+):
+    """Compare a per-call cost of a decorated and an explicit path.
+
+    Parameters
+    ----------
+    name : str
+        A name of the measured operation
+    decorated : Callable
+        A function reaching the current Mimeo Context through a decorator
+    explicit : Callable
+        A function having the Mimeo Context passed explicitly
+    """
+    decorated_ns = _measure(decorated)
+    explicit_ns = _measure(explicit)
+    print(f"{name:>16} | decorated: {decorated_ns:8.1f} ns/call | "
+          f"explicit: {explicit_ns:8.1f} ns/call | "
+          f"removed: {decorated_ns - explicit_ns:8.1f} ns/call")
+
+
+def _measure(
+        func: Callable,
+) -> float:
+    """Measure a per-call cost of a function.
+
+    Parameters
+    ----------
+    func : Callable
+        A function to measure
+
+    Returns
+    -------
+    float
+        A per-call cost in nanoseconds
+    """
+    total_time = timeit.timeit(func, number=NUM_OF_CALLS)
+    return total_time / NUM_OF_CALLS * 1_000_000_000
+
+
+if __name__ == "__main__":
+    main()
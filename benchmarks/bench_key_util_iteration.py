@@ -0,0 +1,61 @@
+#!venv/bin/python3
+"""The Key Mimeo Util Iteration Lookup Benchmark module.
+
+This module is meant to be executed as a script, but you can also
+import its main() function to achieve the same goal.
+The goal is to measure a per-call cost of rendering the Key Mimeo Util
+parametrized with a specific iteration, as it reaches the iteration
+in a Mimeo Context. The lookup is measured periodically, while a million
+iterations are initialized in a single context. Its cost should stay flat,
+regardless of the number of iterations already initialized.
+"""
+from __future__ import annotations
+
+import random
+import timeit
+
+from mimeo.config import MimeoConfigFactory
+from mimeo.context import MimeoContextManager
+from mimeo.utils import KeyUtil
+
+NUM_OF_ITERATIONS: int = 1_000_000
+CHECKPOINT: int = 100_000
+LOOKUPS_PER_CHECKPOINT: int = 100_000
+
+
+def main():
+    """Measure the Key Mimeo Util iteration lookup cost."""
+    print(f"Initializing {NUM_OF_ITERATIONS} iterations in a single context.")
+    mimeo_config = MimeoConfigFactory.parse({"_templates_": []})
+    with MimeoContextManager(mimeo_config) as mimeo_manager:
+        context = mimeo_manager.get_context("SomeContext")
+        mimeo_manager.set_current_context(context)
+        for iteration_id in range(1, NUM_OF_ITERATIONS + 1):
+            context.next_iteration()
+            if iteration_id == 1 or iteration_id % CHECKPOINT == 0:
+                _measure_lookup(iteration_id)
+
+
+def _measure_lookup(
+        num_of_iterations: int,
+):
+    """Measure the lookup cost within a context having iterations initialized.
+
+    Parameters
+    ----------
+    num_of_iterations : int
+        A number of iterations initialized so far
+    """
+    rng = random.Random(num_of_iterations)
+    key_utils = [KeyUtil(iteration=rng.randint(1, num_of_iterations))
+                 for _ in range(LOOKUPS_PER_CHECKPOINT)]
+    key_utils_iter = iter(key_utils)
+    total_time = timeit.timeit(lambda: next(key_utils_iter).render(),
+                               number=LOOKUPS_PER_CHECKPOINT)
+    per_call_ns = total_time / LOOKUPS_PER_CHECKPOINT * 1_000_000_000
+    print(f"Iterations: {num_of_iterations:>8} | "
+          f"lookup: {per_call_ns:8.1f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!venv/bin/python3
+"""The Mimeo DB Lookup Benchmark module.
+
+This module is meant to be executed as a script, but you can also
+import its main() function to achieve the same goal.
+The goal is to measure a per-call cost of each MimeoDB lookup type. Country
+lookups are served by dict indexes built once, when countries are loaded,
+so their cost is compared with a linear scan over all countries - the way
+they were resolved before. The last country in CSV data is looked up,
+as it is the worst case for a linear scan.
+"""
+from __future__ import annotations
+
+import timeit
+from typing import Callable
+
+from mimeo.database import Country, MimeoDB
+
+NUM_OF_CALLS: int = 100_000
+
+
+def main():
+    """Measure the per-call cost of MimeoDB lookups."""
+    print(f"Measuring {NUM_OF_CALLS} calls of each lookup type.")
+    mimeo_db = MimeoDB()
+    country = mimeo_db.get_countries()[-1]
+
+    _compare("iso_3",
+             lambda: mimeo_db.get_country_by_iso_3(country.iso_3),
+             lambda: _scan(mimeo_db, lambda c: c.iso_3 == country.iso_3))
+    _compare("iso_2",
+             lambda: mimeo_db.get_country_by_iso_2(country.iso_2),
+             lambda: _scan(mimeo_db, lambda c: c.iso_2 == country.iso_2))
+    _compare("name",
+             lambda: mimeo_db.get_country_by_name(country.name),
+             lambda: _scan(mimeo_db, lambda c: c.name == country.name))
+    _compare("any (CountryUtil)",
+             lambda: mimeo_db.get_country(country.name),
+             lambda: _scan(mimeo_db,
+                           lambda c: country.name in [c.iso_3, c.iso_2, c.name]))
+    _measure_only("cities_of", lambda: mimeo_db.get_cities_of(country.name))
+    _measure_only("currency_of", lambda: mimeo_db.get_currency_of(country.name))
+    _measure_only("first_names_by_sex", lambda: mimeo_db.get_first_names_by_sex("F"))
+
+
+def _scan(
+        mimeo_db: MimeoDB,
+        predicate: Callable[[Country], bool],
+) -> Country | None:
+    """Find a country with a linear scan.
+
+    Parameters
+    ----------
+    mimeo_db : MimeoDB
+        A Mimeo DB instance
+    predicate : Callable[[Country], bool]
+        A condition a country needs to meet
+
+    Returns
+    -------
+    Country | None
+        The first country meeting the condition or None
+    """
+    return next(filter(predicate, mimeo_db.get_countries()), None)
+
+
+def _compare(
+        name: str,
+        indexed: Callable,
+        scan: Callable,
+):
+    """Compare a per-call cost of an indexed lookup and a linear scan.
+
+    Parameters
+    ----------
+    name : str
+        A name of the lookup type
+    indexed : Callable
+        A function using a dict index
+    scan : Callable
+        A function scanning all countries
+    """
+    indexed_ns = _measure(indexed)
+    scan_ns = _measure(scan)
+    print(f"{name:>18} | indexed: {indexed_ns:9.1f} ns/call | "
+          f"scan: {scan_ns:9.1f} ns/call | "
+          f"speedup: {scan_ns / indexed_ns:6.1f}x")
+
+
+def _measure_only(
+        name: str,
+        lookup: Callable,
+):
+    """Print a per-call cost of a lookup.
+
+    Parameters
+    ----------
+    name : str
+        A name of the lookup type
+    lookup : Callable
+        A function to measure
+    """
+    print(f"{name:>18} | indexed: {_measure(lookup):9.1f} ns/call")
+
+
+def _measure(
+        func: Callable,
+) -> float:
+    """Measure a per-call cost of a function.
+
+    Parameters
+    ----------
+    func : Callable
+        A function to measure
+
+    Returns
+    -------
+    float
+        A per-call cost in nanoseconds
+    """
+    func()
+    total_time = timeit.timeit(func, number=NUM_OF_CALLS)
+    return total_time / NUM_OF_CALLS * 1_000_000_000
+
+
+if __name__ == "__main__":
+    main()
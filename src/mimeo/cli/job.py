@@ -72,11 +72,13 @@ class MimeoJob:
         config_paths = self._get_config_paths(self._args.paths)
         for config_path in config_paths:
             mimeo_config = self._get_mimeo_config(config_path, self._args)
-            Mimeograph.process(mimeo_config)
+            Mimeograph.process(mimeo_config, processes=self._args.processes)
 
     def _process_in_parallel(self):
         config_paths = self._get_config_paths(self._args.paths)
-        with Mimeograph() as mimeo:
+        with Mimeograph(chunk_size=self._args.chunk_size,
+                        processes=self._args.processes,
+                        generator_workers=self._args.generators) as mimeo:
             for config_path in config_paths:
                 mimeo_config = self._get_mimeo_config(config_path, self._args)
                 mimeo.submit((config_path, mimeo_config))
@@ -11,7 +11,7 @@ from __future__ import annotations
 
 import json
 import logging
-from argparse import ArgumentParser, Namespace
+from argparse import ArgumentParser, ArgumentTypeError, Namespace
 from pathlib import Path
 from typing import ClassVar
 
@@ -82,6 +82,8 @@ class MimeoArgumentParser(ArgumentParser):
           --http-envs-file PATH
                                 use a custom environments file
                                 (by default: mimeo.envs.json)
+          -s SEED, --seed SEED
+                                overwrite the seed property
           --raw
                                 same as -o stdout
                                 overwrite the output/direction property to stdout
@@ -93,6 +95,9 @@ class MimeoArgumentParser(ArgumentParser):
 
         Other arguments:
           --sequentially        process Mimeo Configurations in a single thread
+          --chunk-size SIZE     stream data to consumers in chunks of SIZE data units
+          --processes NUM       generate data of a Mimeo Configuration in NUM processes
+          --generators NUM      generate data of NUM Mimeo Configurations at once
         """
         super().__init__(
             prog="mimeo",
@@ -209,6 +214,11 @@ class MimeoArgumentParser(ArgumentParser):
             type=str,
             metavar="PATH",
             help=f"use a custom environments file (by default: {DEFAULT_ENVS_PATH})")
+        mimeo_config_args.add_argument(
+            "-s",
+            "--seed",
+            type=int,
+            help="overwrite the seed property")
         mimeo_config_args.add_argument(
             "--raw",
             action="store_true",
@@ -243,6 +253,52 @@ class MimeoArgumentParser(ArgumentParser):
             "--sequentially",
             action="store_true",
             help="process Mimeo Configurations in a single thread")
+        other_args.add_argument(
+            "--chunk-size",
+            type=self._positive_int,
+            metavar="SIZE",
+            help="stream data to consumers in chunks of SIZE data units")
+        other_args.add_argument(
+            "--processes",
+            type=int,
+            metavar="NUM",
+            help="generate data of a Mimeo Configuration in NUM processes")
+        other_args.add_argument(
+            "--generators",
+            type=self._positive_int,
+            default=1,
+            metavar="NUM",
+            help="generate data of NUM Mimeo Configurations at once")
+
+    @staticmethod
+    def _positive_int(
+            value: str,
+    ) -> int:
+        """Convert an argument value to a positive integer.
+
+        Parameters
+        ----------
+        value : str
+            An argument value
+
+        Returns
+        -------
+        int
+            The argument value converted to an integer
+
+        Raises
+        ------
+        ArgumentTypeError
+            If the argument value is not a positive integer
+        """
+        try:
+            num = int(value)
+        except ValueError:
+            num = 0
+        if num < 1:
+            msg = f"invalid positive int value: '{value}'"
+            raise ArgumentTypeError(msg)
+        return num
 
 
 class MimeoConfigParser:
@@ -304,6 +360,9 @@ class MimeoConfigParser:
         "http_password": {
             "entry_path": [cc.OUTPUT_KEY, cc.OUTPUT_PASSWORD_KEY],
         },
+        "seed": {
+            "entry_path": [cc.SEED_KEY],
+        },
     }
 
     def __init__(
@@ -3,6 +3,8 @@
 It contains the following modules:
 * mimeo_config
     The Mimeo Configuration module
+* special_fields_graph
+    The Mimeo Special Fields Graph module
 * constants
     The Mimeo Configuration Constants module
 * exc
@@ -14,14 +16,17 @@ root Mimeo Configuration component and a factory:
     A MimeoDTO class representing Mimeo Configuration
 * MimeoConfigFactory
     A factory class to instantiate a MimeoConfig
+* SpecialFieldsGraph
+    A class representing dependencies of Mimeo Special Fields
 
 To use this package, simply import it:
-    from mimeo.config import MimeoConfigFactory, MimeoConfig
+    from mimeo.config import MimeoConfigFactory, MimeoConfig, SpecialFieldsGraph
     from mimeo.config import constants as cc
     from mimeo.config.exc import UnsupportedPropertyValueError
 """
 from __future__ import annotations
 
 from .mimeo_config import MimeoConfig, MimeoConfigFactory
+from .special_fields_graph import SpecialFieldsGraph
 
-__all__ = ["MimeoConfig", "MimeoConfigFactory"]
+__all__ = ["MimeoConfig", "MimeoConfigFactory", "SpecialFieldsGraph"]
@@ -95,6 +95,7 @@ REQUIRED_REFS_DETAILS: tuple = tuple(
 REFS_DETAIL_CONTEXT: str = _refs_details["context"]["key"]
 REFS_DETAIL_FIELD: str = _refs_details["field"]["key"]
 REFS_DETAIL_TYPE: str = _refs_details["type"]["key"]
+REFS_DETAIL_CAPACITY: str = _refs_details["capacity"]["key"]
 
 # ------------------------------------ refs types ------------------------------------ #
 _refs_types: dict = _refs_details["type"]["values"]
@@ -106,6 +107,12 @@ REFS_TYPE_PARALLEL: str = _refs_details["type"]["values"]["parallel"]
 # ------------------------------ refs forbidden names -------------------------------- #
 REFS_FORBIDDEN_NAMES: tuple = tuple(_refs_constants["forbidden-names"])
 
+########################################################################################
+#                                      MIMEO SEED                                      #
+########################################################################################
+_seed_constants: dict = _cc["seed"]
+SEED_KEY: str = _seed_constants["key"]
+
 ########################################################################################
 #                                   MIMEO TEMPLATES                                    #
 ########################################################################################
@@ -160,10 +167,12 @@ __all__ = [
     "REFS_DETAIL_CONTEXT",
     "REFS_DETAIL_FIELD",
     "REFS_DETAIL_TYPE",
+    "REFS_DETAIL_CAPACITY",
     "SUPPORTED_REFS_TYPES",
     "REFS_TYPE_ANY",
     "REFS_TYPE_PARALLEL",
     "REFS_FORBIDDEN_NAMES",
+    "SEED_KEY",
     "TEMPLATES_KEY",
     "TEMPLATES_XML_TEMPLATE_TAG",
     "TEMPLATES_COUNT_KEY",
@@ -7,6 +7,8 @@ It contains all custom exceptions related to Mimeo Configuration:
         A custom Exception class for missing required properties.
     * InvalidIndentError
         A custom Exception class for invalid indent configuration.
+    * InvalidSeedError
+        A custom Exception class for invalid seed configuration.
     * InvalidVarsError
         A custom Exception class for invalid vars' configuration.
     * InvalidRefsError
@@ -113,6 +115,28 @@ class InvalidIndentError(Exception):
         super().__init__(f"Provided indent [{indent}] is negative!")
 
 
+class InvalidSeedError(Exception):
+    """A custom Exception class for invalid seed configuration.
+
+    Raised when a configured seed is not an integer.
+    """
+
+    def __init__(
+            self,
+            seed: Any,
+    ):
+        """Initialize InvalidSeedError exception with details.
+
+        Extends Exception constructor with a custom message.
+
+        Parameters
+        ----------
+        seed : Any
+            A configured seed
+        """
+        super().__init__(f"Provided seed [{seed}] is not an integer!")
+
+
 class InvalidVarsError(Exception):
     """A custom Exception class for invalid vars' configuration.
 
@@ -214,12 +238,15 @@ class InvalidRefsError(Exception):
             An error code for refs with missing required details
         ERR_4: str
             An error code for refs having same name as a Mimeo Util or a Mimeo Var
+        ERR_5: str
+            An error code for refs having an invalid capacity
         """
 
         ERR_1: str = "REFS_NOT_A_DICT"
         ERR_2: str = "REF_NOT_A_DICT"
         ERR_3: str = "MISSING_DETAILS"
         ERR_4: str = "FORBIDDEN_NAME"
+        ERR_5: str = "INVALID_CAPACITY"
 
     def __init__(
             self,
@@ -280,6 +307,11 @@ class InvalidRefsError(Exception):
             return ("A reference can't be configured using name of Mimeo Utils "
                     "or existing Vars. Please rename following refs: "
                     f"[{references}]")
+        if code == cls.Code.ERR_5:
+            references = ", ".join(details["refs"])
+            return ("A reference's capacity needs to be a positive integer and can be "
+                    "configured only for 'any' refs. Please fix following refs: "
+                    f"[{references}]")
 
         msg = f"Provided error code is not a {cls.__name__}.Code enum!"
         raise ValueError(msg)
@@ -27,7 +27,7 @@ from mimeo.config import constants as cc
 from mimeo.config.exc import (InvalidIndentError, InvalidMimeoConfigError,
                               InvalidMimeoModelError,
                               InvalidMimeoTemplateError, InvalidRefsError,
-                              InvalidVarsError,
+                              InvalidSeedError, InvalidVarsError,
                               MimeoConfigurationNotFoundError,
                               MissingRequiredPropertyError,
                               UnsupportedMimeoConfigSourceError,
@@ -472,6 +472,8 @@ class MimeoConfig(MimeoDTO):
         A Mimeo Configuration vars setting
     refs : dict, default {}
         A Mimeo Configuration refs setting
+    seed : int | None, default None
+        A seed of random values generators
     templates : list
         A Mimeo Templates setting
     """
@@ -493,6 +495,7 @@ class MimeoConfig(MimeoDTO):
         self.output: MimeoOutput = MimeoOutput(config.get(cc.OUTPUT_KEY, {}))
         self.vars: dict = self._get_vars(config)
         self.refs: dict = self._get_refs(config)
+        self.seed: int | None = self._get_seed(config)
         self.templates: list[MimeoTemplate] = self._get_templates(config)
 
     @classmethod
@@ -530,6 +533,32 @@ class MimeoConfig(MimeoDTO):
                 raise InvalidVarsError(InvalidVarsError.Code.ERR_3, var=var)
         return variables
 
+    @staticmethod
+    def _get_seed(
+            config: dict,
+    ) -> int | None:
+        """Extract a seed from the source dictionary.
+
+        Parameters
+        ----------
+        config : dict
+            A source config dictionary
+
+        Returns
+        -------
+        seed : int | None
+            The customized seed or None by default
+
+        Raises
+        ------
+        InvalidSeedError
+            If the customized seed is not an integer
+        """
+        seed = config.get(cc.SEED_KEY)
+        if seed is not None and (not isinstance(seed, int) or isinstance(seed, bool)):
+            raise InvalidSeedError(seed)
+        return seed
+
     @classmethod
     def _get_refs(
             cls,
@@ -554,6 +583,8 @@ class MimeoConfig(MimeoDTO):
             (2) any ref is not a dictionary or
             (3) some refs does not have required details (context, field, type)
             (4) some refs are configured using names of Mimeo Utils or Vars
+            (5) some refs have a capacity not being a positive integer or
+            configured for a non-'any' type
         UnsupportedPropertyValueError
             If the configured reference type is not supported
         """
@@ -588,9 +619,41 @@ class MimeoConfig(MimeoDTO):
             raise InvalidRefsError(
                 InvalidRefsError.Code.ERR_4,
                 refs=forbidden_names_references)
+        invalid_capacity_references = [
+            name for name, reference in references.items()
+            if not cls._is_valid_ref_capacity(reference)]
+        if len(invalid_capacity_references) > 0:
+            raise InvalidRefsError(
+                InvalidRefsError.Code.ERR_5,
+                refs=invalid_capacity_references)
 
         return references
 
+    @staticmethod
+    def _is_valid_ref_capacity(
+            reference: dict,
+    ) -> bool:
+        """Verify if a reference's capacity is configured properly.
+
+        A capacity is optional. When configured, it needs to be a positive
+        integer, and the reference needs to be of the 'any' type.
+
+        Parameters
+        ----------
+        reference : dict
+            A reference's details
+
+        Returns
+        -------
+        bool
+            True if the capacity is not configured or is valid. Otherwise, False.
+        """
+        capacity = reference.get(cc.REFS_DETAIL_CAPACITY)
+        if capacity is None:
+            return True
+        return (isinstance(capacity, int) and not isinstance(capacity, bool) and
+                capacity > 0 and reference[cc.REFS_DETAIL_TYPE] == cc.REFS_TYPE_ANY)
+
     @classmethod
     def _get_templates(
             cls,
@@ -1183,6 +1246,13 @@ class MimeoModel(MimeoDTO):
         A template data
     context_name : str
         A context name (root_name by default)
+
+    Methods
+    -------
+    get_nested_templates(
+        templates: list
+    ) -> list[MimeoTemplate]
+        Get Mimeo Templates parsed for a nested _templates_ node.
     """
 
     def __init__(
@@ -1202,6 +1272,71 @@ class MimeoModel(MimeoDTO):
         self.root_name: str = MimeoModel._get_root_name(model)
         self.root_data: dict = model.get(self.root_name)
         self.context_name: str = MimeoModel._get_context_name(model, self.root_name)
+        self._nested_templates: dict[int, list[MimeoTemplate]] = (
+            MimeoModel._get_nested_templates(self.root_data))
+
+    def __getstate__(
+            self,
+    ) -> dict:
+        """Get the model's state to pickle.
+
+        Nested templates are excluded, as they are indexed by ids of source
+        _templates_ nodes, which do not survive pickling.
+
+        Returns
+        -------
+        dict
+            The model's state
+        """
+        state = self.__dict__.copy()
+        del state["_nested_templates"]
+        return state
+
+    def __setstate__(
+            self,
+            state: dict,
+    ):
+        """Restore the model's state from pickle.
+
+        Nested templates are parsed again for the unpickled model's data.
+
+        Parameters
+        ----------
+        state : dict
+            The model's state
+        """
+        self.__dict__.update(state)
+        self._nested_templates = MimeoModel._get_nested_templates(self.root_data)
+
+    def get_nested_templates(
+            self,
+            templates: list,
+    ) -> list[MimeoTemplate]:
+        """Get Mimeo Templates parsed for a nested _templates_ node.
+
+        Nested templates are parsed once, when the model is initialized.
+        A _templates_ node not belonging to the model is parsed on demand.
+
+        Parameters
+        ----------
+        templates : list
+            A source _templates_ node of the model
+
+        Returns
+        -------
+        list[MimeoTemplate]
+            Nested Mimeo Templates
+
+        Raises
+        ------
+        InvalidMimeoTemplateError
+            If the source _templates_ node is parsed on demand and any of templates
+            doesn't include count or model properties
+        """
+        nested_templates = self._nested_templates.get(id(templates))
+        if nested_templates is None:
+            nested_templates = [MimeoTemplate(template) for template in templates]
+        return nested_templates
 
     @staticmethod
     def _get_root_name(
@@ -1261,6 +1396,46 @@ class MimeoModel(MimeoDTO):
             raise InvalidMimeoModelError(InvalidMimeoModelError.Code.ERR_3, model=model)
         return context_name
 
+    @staticmethod
+    def _get_nested_templates(
+            root_data: dict | list | str | int | float | bool | None,
+    ) -> dict[int, list[MimeoTemplate]]:
+        """Extract nested Mimeo Templates from the model's data.
+
+        It traverses the model's data and parses every _templates_ node, except
+        for the ones included in nested templates (they are parsed by nested
+        models).
+
+        Parameters
+        ----------
+        root_data : dict | list | str | int | float | bool | None
+            A template data
+
+        Returns
+        -------
+        dict[int, list[MimeoTemplate]]
+            Nested Mimeo Templates indexed by an id of the source _templates_ node
+
+        Raises
+        ------
+        InvalidMimeoTemplateError
+            If any of nested templates doesn't include count or model properties
+        """
+        nested_templates = {}
+        nodes = [root_data]
+        while len(nodes) > 0:
+            node = nodes.pop()
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    if key == cc.TEMPLATES_KEY and isinstance(value, list):
+                        nested_templates[id(value)] = [MimeoTemplate(template)
+                                                       for template in value]
+                    else:
+                        nodes.append(value)
+            elif isinstance(node, list):
+                nodes.extend(node)
+        return nested_templates
+
     @staticmethod
     def _is_not_configuration_key(
             dict_key: str,
@@ -0,0 +1,210 @@
+"""The Mimeo Special Fields Graph module.
+
+It exports only one class:
+    * SpecialFieldsGraph
+        A class representing dependencies of Mimeo Special Fields.
+"""
+from __future__ import annotations
+
+import re
+from typing import Any, ClassVar, Pattern
+
+from mimeo.config import constants as cc
+from mimeo.config.mimeo_config import MimeoConfig, MimeoModel
+
+
+class SpecialFieldsGraph:
+    """A class representing dependencies of Mimeo Special Fields.
+
+    A Mimeo Configuration is analyzed once, to find special fields defined
+    in every Mimeo Context, and nodes referencing them. Mimeo Vars used in
+    a node are followed, so special fields referenced in their values are
+    attributed to the node as well. When a special field reference could be
+    formed only while rendering (e.g. {:{VAR}:}), the graph is incomplete,
+    and all special fields are considered referenced.
+
+    Attributes
+    ----------
+    definitions : dict[str, list[str]]
+        Special fields defined in each context
+    references : dict[str, dict[str, list[str]]]
+        Paths of nodes referencing special fields, grouped by context and field
+    is_complete : bool
+        A flag indicating if all special field references have been found
+
+    Methods
+    -------
+    is_referenced(context_name: str, field_name: str) -> bool
+        Verify if a special field is referenced in a context.
+    has_references(context_name: str) -> bool
+        Verify if any special field is referenced in a context.
+    """
+
+    _DEFINITION_PATTERN: ClassVar[Pattern] = re.compile(
+        "^:((?:[a-zA-Z]+:)?[-_a-zA-Z0-9]+):$")
+    _REFERENCE_PATTERN: ClassVar[Pattern] = re.compile(
+        "{:((?:[a-zA-Z]+:)?[-_a-zA-Z0-9]+):}")
+    _VAR_PATTERN: ClassVar[Pattern] = re.compile("{([A-Z_0-9]+)}")
+
+    def __init__(
+            self,
+            mimeo_config: MimeoConfig,
+    ):
+        """Initialize SpecialFieldsGraph class.
+
+        Parameters
+        ----------
+        mimeo_config : MimeoConfig
+            A Mimeo Configuration to analyze
+        """
+        self.definitions: dict[str, list[str]] = {}
+        self.references: dict[str, dict[str, list[str]]] = {}
+        self.is_complete: bool = True
+        self._vars: dict = mimeo_config.vars
+        for template in mimeo_config.templates:
+            self._analyze_model(template.model)
+
+    def is_referenced(
+            self,
+            context_name: str,
+            field_name: str,
+    ) -> bool:
+        """Verify if a special field is referenced in a context.
+
+        Parameters
+        ----------
+        context_name : str
+            A context name
+        field_name : str
+            A special field name
+
+        Returns
+        -------
+        bool
+            True if the special field is referenced in the context, the context
+            has not been analyzed or the graph is incomplete. Otherwise, False.
+        """
+        references = self.references.get(context_name)
+        return not self.is_complete or references is None or field_name in references
+
+    def has_references(
+            self,
+            context_name: str,
+    ) -> bool:
+        """Verify if any special field is referenced in a context.
+
+        Parameters
+        ----------
+        context_name : str
+            A context name
+
+        Returns
+        -------
+        bool
+            True if any special field is referenced in the context, the context
+            has not been analyzed or the graph is incomplete. Otherwise, False.
+        """
+        references = self.references.get(context_name)
+        return not self.is_complete or references is None or len(references) > 0
+
+    def _analyze_model(
+            self,
+            model: MimeoModel,
+    ):
+        """Analyze a Mimeo Model with its nested templates.
+
+        Parameters
+        ----------
+        model : MimeoModel
+            A Mimeo Model to analyze
+        """
+        self.definitions.setdefault(model.context_name, [])
+        self.references.setdefault(model.context_name, {})
+        self._analyze_node(model, model.root_name, model.root_data, model.root_name)
+
+    def _analyze_node(
+            self,
+            model: MimeoModel,
+            name: str | None,
+            value: Any,
+            path: str,
+    ):
+        """Analyze a single node of a Mimeo Model.
+
+        This is a recursive function collecting special fields defined and
+        referenced in the node and its descendants.
+
+        Parameters
+        ----------
+        model : MimeoModel
+            A Mimeo Model the node belongs to
+        name : str | None
+            A node's name
+        value : Any
+            A node's value
+        path : str
+            A node's path in the Mimeo Model
+        """
+        if name is not None and self._DEFINITION_PATTERN.match(name):
+            definitions = self.definitions[model.context_name]
+            field_name = name[1:][:-1]
+            if field_name not in definitions:
+                definitions.append(field_name)
+
+        if isinstance(value, dict) and cc.MODEL_MIMEO_UTIL_KEY not in value:
+            for child_name, child_value in value.items():
+                if child_name == cc.TEMPLATES_KEY and isinstance(child_value, list):
+                    for template in model.get_nested_templates(child_value):
+                        self._analyze_model(template.model)
+                else:
+                    self._analyze_node(model, child_name, child_value,
+                                       f"{path}/{child_name}")
+        elif isinstance(value, list):
+            for child_value in value:
+                self._analyze_node(model, None, child_value, path)
+        else:
+            references = self.references[model.context_name]
+            for field_name in self._get_referenced_fields(value, frozenset()):
+                references.setdefault(field_name, []).append(path)
+
+    def _get_referenced_fields(
+            self,
+            value: Any,
+            visited_vars: frozenset[str],
+    ) -> set[str]:
+        """Get special fields referenced in a value.
+
+        Mimeo Vars used in the value are followed. When a special field reference
+        could be formed only while rendering, the graph is marked as incomplete.
+
+        Parameters
+        ----------
+        value : Any
+            A node's value or a Mimeo Var value
+        visited_vars : frozenset[str]
+            Names of Mimeo Vars already followed
+
+        Returns
+        -------
+        set[str]
+            Names of special fields referenced
+        """
+        if isinstance(value, dict):
+            value = list(value.values())
+        if isinstance(value, list):
+            return set().union(*(self._get_referenced_fields(item, visited_vars)
+                                 for item in value))
+        if not isinstance(value, str) or "{" not in value:
+            return set()
+
+        fields = set(self._REFERENCE_PATTERN.findall(value))
+        remaining = self._REFERENCE_PATTERN.sub("", value)
+        var_names = self._VAR_PATTERN.findall(remaining)
+        if ("{:" in remaining or ":}" in remaining or
+                (var_names and "{" in self._VAR_PATTERN.sub("", remaining))):
+            self.is_complete = False
+        for var in var_names:
+            if var in self._vars and var not in visited_vars:
+                fields |= self._get_referenced_fields(self._vars[var],
+                                                      visited_vars | {var})
+        return fields
@@ -51,6 +51,7 @@ class FileConsumer(Consumer):
         """
         self.directory: str = output.directory_path
         self.output_path_tmplt: str = f"{self.directory}/{output.file_name}"
+        self._count: int = 0
 
     async def consume(
             self,
@@ -60,22 +61,23 @@ class FileConsumer(Consumer):
 
         It is an implementation of Consumer's abstract method.
         If the output directory does not exist it is created.
-        Every file name has an index inside its path.
+        Every file name has an index inside its path. Indexes are continued
+        across consume() calls of the same instance, so data can be consumed
+        in chunks.
 
         Parameters
         ----------
         data : Collection | Generator
             Stringified data generated by Mimeo
         """
-        count = 0
         for data_unit in data:
             logger.fine("Consuming data [%s]", data_unit)
             if not Path(self.directory).exists():
                 logger.info("Creating output directory [%s]", self.directory)
                 Path(self.directory).mkdir(parents=True, exist_ok=True)
 
-            count += 1
-            file_name = self.output_path_tmplt.format(count)
+            self._count += 1
+            file_name = self.output_path_tmplt.format(self._count)
 
             logger.info("Writing data into file [%s]", file_name)
             async with aiofiles.open(file_name, mode="w") as file:
@@ -9,6 +9,12 @@ It contains the following modules:
     The Mimeo Context module.
 * mimeo_iteration
     The Mimeo Iteration module.
+* reference_stores
+    The Mimeo Reference Stores module.
+* random_engines
+    The Mimeo Random Engines module.
+* permutations
+    The Mimeo Permutations module.
 * decorators
     The Mimeo Context Decorators module.
 * exc
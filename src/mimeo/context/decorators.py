@@ -1,5 +1,7 @@
 """The Mimeo Context Decorators module.
 
+The decorators are a compatibility layer for the public API. While generating
+data, a Mimeo Context is passed explicitly instead.
 It defines the following decorators:
 
 - @mimeo_context:
@@ -48,7 +50,7 @@ def mimeo_context(
             *args,
             **kwargs,
     ):
-        if any(isinstance(arg, MimeoContext) for arg in args) or "context" in kwargs:
+        if "context" in kwargs or any(isinstance(arg, MimeoContext) for arg in args):
             result = func(*args, **kwargs)
         else:
             current_ctx = MimeoContextManager().get_current_context()
@@ -6,12 +6,16 @@ It exports only one class:
 """
 from __future__ import annotations
 
+import os
 import random
+import uuid
 
 from mimeo.context import MimeoIteration
 from mimeo.context.exc import (ContextIterationNotFoundError,
                                MinimumIdentifierReachedError,
                                UninitializedContextIterationError)
+from mimeo.context.permutations import IndexPermutation
+from mimeo.context.random_engines import RandomEngine, RandomEngineFactory
 from mimeo.database import MimeoDB
 from mimeo.database.exc import DataNotFoundError, OutOfStockError
 
@@ -27,9 +31,23 @@ class MimeoContext:
 
     Attributes
     ----------
+    COUNTRIES : str
+        A name of the unique countries' indexes pool
+    CITIES : str
+        A name of the unique cities' indexes pool
+    CURRENCIES : str
+        A name of the unique currencies' indexes pool
+    FIRST_NAMES : str
+        A name of the unique first names' indexes pool
+    LAST_NAMES : str
+        A name of the unique last names' indexes pool
     name : str
         A context name (a model's root name if not explicitly
         defined in a Mimeo Configuration)
+    rng : random.Random
+        A random values generator of the context
+    random_engine : RandomEngine
+        A random engine of the context drawing blocks of values
 
     Methods
     -------
@@ -47,6 +65,8 @@ class MimeoContext:
         Return a specific iteration from the context.
     clear_iterations()
         Clear out all context iterations.
+    retain_iterations(num_of_iterations: int | None)
+        Limit a number of the most recent iterations kept in the context.
     next_country_index() -> int
         Provide next unique country index.
     next_city_index(country: str = None) -> int
@@ -57,15 +77,31 @@ class MimeoContext:
         Provide next unique first name index.
     next_last_name_index() -> int
         Provide next unique last name index.
+    assign_shard(
+        unique_slices: dict[str, tuple[int, int, int]],
+        id_offset: int = 0,
+        iteration_offset: int = 0
+    )
+        Assign the context to a shard of data generated in parallel.
+    get_unique_pool_key(pool: str, scope: str | None = None) -> str
+        Get a key of a unique values pool.
     """
 
+    COUNTRIES: str = "countries"
+    CITIES: str = "cities"
+    CURRENCIES: str = "currencies"
+    FIRST_NAMES: str = "first_names"
+    LAST_NAMES: str = "last_names"
+
     _ALL: str = "_ALL_"
     _INITIAL_COUNT: str = "init-count"
     _INDEXES: str = "indexes"
+    _KEYS_BATCH_SIZE: int = 256
 
     def __init__(
             self,
             name: str,
+            seed: int | str | None = None,
     ):
         """Initialize MimeoContext class.
 
@@ -73,15 +109,28 @@ class MimeoContext:
         ----------
         name : str
             A context name
+        seed : int | str | None, default None
+            A seed of the context's random values generator. When it is not
+            provided, the generator is seeded from an operating system source.
         """
         self.name: str = name
+        self.rng: random.Random = random.Random(seed)
+        self.random_engine: RandomEngine = RandomEngineFactory.get_random_engine(
+            self.rng, seed)
+        self._keys_rng: random.Random | None = (
+            random.Random(f"{seed}:keys") if seed is not None else None)
+        self._keys_buffer: bytes = b""
+        self._keys_position: int = 0
         self._id: int = 0
         self._iterations: list[MimeoIteration] = []
-        self._countries_indexes: list[int] | None = None
+        self._retained_iterations: int | None = None
+        self._countries_indexes: IndexPermutation | None = None
         self._cities_indexes: dict = {}
-        self._currencies_indexes: list[int] | None = None
+        self._currencies_indexes: IndexPermutation | None = None
         self._first_names_indexes: dict = {}
-        self._last_names_indexes: list[int] | None = None
+        self._last_names_indexes: IndexPermutation | None = None
+        self._unique_slices: dict[str, tuple[int, int, int]] | None = None
+        self._iteration_offset: int = 0
 
     def next_id(
             self,
@@ -142,7 +191,9 @@ class MimeoContext:
         """Initialize a next iteration within the context.
 
         To initialize the iteration, it gets the last iteration id and
-        provides its incrementation.
+        provides its incrementation. The iteration key is generated only
+        when it is accessed. When the number of retained iterations is
+        limited, the oldest iteration is dropped.
 
         Returns
         -------
@@ -150,11 +201,15 @@ class MimeoContext:
             The initialized iteration
         """
         if len(self._iterations) == 0:
-            next_iteration_id = 1
+            next_iteration_id = self._iteration_offset + 1
         else:
             next_iteration_id = self._iterations[-1].id + 1
-        next_iteration = MimeoIteration(next_iteration_id)
+        next_iteration = MimeoIteration(next_iteration_id,
+                                        key_factory=self._next_iteration_key)
         self._iterations.append(next_iteration)
+        if (self._retained_iterations is not None and
+                len(self._iterations) > self._retained_iterations):
+            del self._iterations[0]
         return next_iteration
 
     def curr_iteration(
@@ -182,9 +237,17 @@ class MimeoContext:
     ) -> MimeoIteration:
         """Return a specific iteration from the context.
 
+        Iteration ids are dense and increasing, so the iteration is
+        accessed directly by its position.
+
+        Parameters
+        ----------
+        iteration_id : int
+            An iteration id
+
         Returns
         -------
-        int
+        MimeoIteration
             A specific iteration
 
         Raises
@@ -193,10 +256,11 @@ class MimeoContext:
             If the context does not have an iteration with the id
             provided
         """
-        iteration = next(filter(lambda i: i.id == iteration_id, self._iterations), None)
-        if iteration is None:
-            raise ContextIterationNotFoundError(iteration_id, self.name)
-        return iteration
+        if len(self._iterations) > 0 and isinstance(iteration_id, (int, float)):
+            index = iteration_id - self._iterations[0].id
+            if 0 <= index < len(self._iterations) and index % 1 == 0:
+                return self._iterations[int(index)]
+        raise ContextIterationNotFoundError(iteration_id, self.name)
 
     def clear_iterations(
             self,
@@ -209,15 +273,34 @@ class MimeoContext:
         """
         self._iterations = []
 
+    def retain_iterations(
+            self,
+            num_of_iterations: int | None,
+    ):
+        """Limit a number of the most recent iterations kept in the context.
+
+        It is meant to be used when past iterations cannot be referenced,
+        so they don't need to be kept in memory.
+
+        Parameters
+        ----------
+        num_of_iterations : int | None
+            A number of the most recent iterations to keep
+            (all iterations are kept when None)
+        """
+        self._retained_iterations = num_of_iterations
+        if num_of_iterations is not None:
+            del self._iterations[:-num_of_iterations]
+
     def next_country_index(
             self,
     ) -> int:
         """Provide next unique country index.
 
         When used for the first time in the specific context
-        it populates internal countries' indexes list. This approach
+        it initializes a lazy permutation of countries' indexes. This approach
         ensures country uniqueness without time-consuming operations.
-        Each time it verifies if the internal list still contains some
+        Each time it verifies if the permutation still provides some
         indexes.
         This method is used by the Country Mimeo Util to get a country
         entry at a specific index in database.
@@ -244,11 +327,11 @@ class MimeoContext:
         """Provide next unique city index.
 
         When used for the first time in the specific context
-        it populates internal cities' indexes map. Each `country` key
-        has its own list initialized as same as country-agnostic one.
-        This approach ensures city uniqueness without time-consuming
-        operations. Each time it verifies if the internal list still
-        contains some indexes.
+        it initializes a lazy permutation of cities' indexes. Each `country`
+        key has its own permutation initialized as same as country-agnostic
+        one. This approach ensures city uniqueness without time-consuming
+        operations. Each time it verifies if the permutation still
+        provides some indexes.
         This method is used by the City Mimeo Util to get a city entry
         at a specific index in database.
 
@@ -283,9 +366,9 @@ class MimeoContext:
         """Provide next unique currency index.
 
         When used for the first time in the specific context
-        it populates internal currencies' indexes list. This approach
+        it initializes a lazy permutation of currencies' indexes. This approach
         ensures country uniqueness without time-consuming operations.
-        Each time it verifies if the internal list still contains some
+        Each time it verifies if the permutation still provides some
         indexes.
         This method is used by the Currency Mimeo Util to get a currency
         entry at a specific index in database.
@@ -312,11 +395,11 @@ class MimeoContext:
         """Provide next unique first name index.
 
         When used for the first time in the specific context
-        it populates internal first names' indexes map. Each `sex` key
-        has its own list initialized as same as sex-agnostic one.
+        it initializes a lazy permutation of first names' indexes. Each `sex`
+        key has its own permutation initialized as same as sex-agnostic one.
         This approach ensures forename uniqueness without
-        time-consuming operations. Each time it verifies if the internal
-        list still contains some indexes.
+        time-consuming operations. Each time it verifies if the permutation
+        still provides some indexes.
         This method is used by the First Name Mimeo Util to get a
         first name entry at a specific index in database.
 
@@ -350,9 +433,9 @@ class MimeoContext:
         """Provide next unique last name index.
 
         When used for the first time in the specific context
-        it populates internal last names' indexes list. This approach
+        it initializes a lazy permutation of last names' indexes. This approach
         ensures surnames uniqueness without time-consuming operations.
-        Each time it verifies if the internal list still contains some
+        Each time it verifies if the permutation still provides some
         indexes.
         This method is used by the Last Name Mimeo Util to get a
         last name entry at a specific index in database.
@@ -372,17 +455,125 @@ class MimeoContext:
 
         return self._last_names_indexes.pop()
 
+    def assign_shard(
+            self,
+            unique_slices: dict[str, tuple[int, int, int]],
+            id_offset: int = 0,
+            iteration_offset: int = 0,
+    ):
+        """Assign the context to a shard of data generated in parallel.
+
+        Every shard of a Mimeo Configuration is generated in a separate process
+        with its own context. To keep values unique across shards, identifiers
+        start from the offset provided and indexes of every unique values pool
+        are limited to a slice proportional to the pool's values consumed
+        in the shard. Pools without a slice are not consumed in the shard,
+        so no indexes are assigned to them.
+
+        Parameters
+        ----------
+        unique_slices : dict[str, tuple[int, int, int]]
+            Unique values consumed before the shard, before the end of the shard
+            and in total (in all shards), per pool key
+        id_offset : int, default 0
+            A number of identifiers consumed by previous shards
+        iteration_offset : int, default 0
+            A number of iterations processed by previous shards
+        """
+        self._unique_slices = unique_slices
+        self._id = id_offset
+        self._iteration_offset = iteration_offset
+
+    @staticmethod
+    def get_unique_pool_key(
+            pool: str,
+            scope: str | None = None,
+    ) -> str:
+        """Get a key of a unique values pool.
+
+        Cities and first names are unique within a separate pool for every
+        country and sex parametrized.
+
+        Parameters
+        ----------
+        pool : str
+            A name of the unique values pool
+        scope : str | None, default None
+            A country of cities or a sex of first names, if parametrized
+
+        Returns
+        -------
+        str
+            A key of the unique values pool
+        """
+        return pool if scope is None else f"{pool}:{scope}"
+
+    def _next_iteration_key(
+            self,
+    ) -> str:
+        """Generate a next iteration key.
+
+        Keys are taken from a buffer of random bytes, filled in batches
+        from an operating system source, or from a dedicated random values
+        generator when the context is seeded.
+
+        Returns
+        -------
+        str
+            A random UUID value
+        """
+        if self._keys_position == len(self._keys_buffer):
+            size = 16 * self._KEYS_BATCH_SIZE
+            self._keys_buffer = (
+                os.urandom(size) if self._keys_rng is None
+                else self._keys_rng.getrandbits(8 * size).to_bytes(size, "little"))
+            self._keys_position = 0
+        start = self._keys_position
+        self._keys_position += 16
+        return str(uuid.UUID(bytes=self._keys_buffer[start:start + 16], version=4))
+
+    def _sample_indexes(
+            self,
+            pool: str,
+            num_of_entries: int,
+    ) -> IndexPermutation:
+        """Sample indexes assigned to the context in a random order.
+
+        Indexes are provided lazily by a permutation keyed with the context's
+        random values generator, so they are not materialized.
+
+        Parameters
+        ----------
+        pool : str
+            A key of the unique values pool
+        num_of_entries : int
+            A number of database entries
+
+        Returns
+        -------
+        IndexPermutation
+            Shuffled indexes of the context's shard
+        """
+        if self._unique_slices is None:
+            indexes = range(num_of_entries)
+        else:
+            start, stop, total = self._unique_slices.get(pool, (0, 0, 1))
+            indexes = range(num_of_entries * start // total,
+                            num_of_entries * stop // total)
+        return IndexPermutation(indexes, self.rng)
+
     def _initialize_countries_indexes(
             self,
     ):
         """Initialize countries' indexes with unique integers.
 
-        The list length and range depends on the number of country
+        The permutation length and range depends on the number of country
         records in database.
         """
         if self._countries_indexes is None:
             num_of_entries = MimeoDB.NUM_OF_COUNTRIES
-            countries_indexes = random.sample(range(num_of_entries), num_of_entries)
+            countries_indexes = self._sample_indexes(MimeoContext.COUNTRIES,
+                                                      num_of_entries)
             self._countries_indexes = countries_indexes
 
     def _initialize_cities_indexes(
@@ -391,7 +582,7 @@ class MimeoContext:
     ):
         """Initialize cities' indexes with unique integers.
 
-        The list length and range depends on the number of city
+        The permutation length and range depends on the number of city
         records in database for the `country`.
 
         Raises
@@ -404,7 +595,7 @@ class MimeoContext:
             if country == MimeoContext._ALL:
                 num_of_entries = MimeoDB.NUM_OF_CITIES
             else:
-                country_cities = MimeoDB().get_cities_of(country)
+                country_cities = MimeoDB().get_cities_view_of(country)
                 num_of_entries = len(country_cities)
                 if num_of_entries == 0:
                     raise DataNotFoundError(DataNotFoundError.Code.ERR_2,
@@ -412,7 +603,10 @@ class MimeoContext:
                                             param_name="country",
                                             param_val=country)
 
-            cities_indexes = random.sample(range(num_of_entries), num_of_entries)
+            scope = None if country == MimeoContext._ALL else country
+            cities_indexes = self._sample_indexes(
+                MimeoContext.get_unique_pool_key(MimeoContext.CITIES, scope),
+                num_of_entries)
             self._cities_indexes[country] = {
                 MimeoContext._INITIAL_COUNT: num_of_entries,
                 MimeoContext._INDEXES: cities_indexes,
@@ -423,12 +617,13 @@ class MimeoContext:
     ):
         """Initialize currencies' indexes with unique integers.
 
-        The list length and range depends on the number of currency
+        The permutation length and range depends on the number of currency
         records in database.
         """
         if self._currencies_indexes is None:
             num_of_entries = MimeoDB.NUM_OF_CURRENCIES
-            currencies_indexes = random.sample(range(num_of_entries), num_of_entries)
+            currencies_indexes = self._sample_indexes(MimeoContext.CURRENCIES,
+                                                       num_of_entries)
             self._currencies_indexes = currencies_indexes
 
     def _initialize_first_names_indexes(
@@ -437,7 +632,7 @@ class MimeoContext:
     ):
         """Initialize first names' indexes with integers.
 
-        The list length and range depends on the number of first name
+        The permutation length and range depends on the number of first name
         records in database for the `sex`.
 
         Raises
@@ -452,7 +647,10 @@ class MimeoContext:
                 first_names_for_sex = MimeoDB().get_first_names_by_sex(sex)
                 num_of_entries = len(first_names_for_sex)
 
-            first_names_indexes = random.sample(range(num_of_entries), num_of_entries)
+            scope = None if sex == MimeoContext._ALL else sex
+            first_names_indexes = self._sample_indexes(
+                MimeoContext.get_unique_pool_key(MimeoContext.FIRST_NAMES, scope),
+                num_of_entries)
             self._first_names_indexes[sex] = {
                 MimeoContext._INITIAL_COUNT: num_of_entries,
                 MimeoContext._INDEXES: first_names_indexes,
@@ -463,12 +661,13 @@ class MimeoContext:
     ):
         """Initialize last names' indexes with unique integers.
 
-        The list length and range depends on the number of last name
+        The permutation length and range depends on the number of last name
         records in database.
         """
         if self._last_names_indexes is None:
             num_of_entries = MimeoDB.NUM_OF_LAST_NAMES
-            last_names_indexes = random.sample(range(num_of_entries), num_of_entries)
+            last_names_indexes = self._sample_indexes(MimeoContext.LAST_NAMES,
+                                                       num_of_entries)
             self._last_names_indexes = last_names_indexes
 
     def _validate_countries(
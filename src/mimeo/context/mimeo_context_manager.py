@@ -6,17 +6,24 @@ It exports only one class:
 """
 from __future__ import annotations
 
+import logging
 import random
 from types import TracebackType
+from typing import ClassVar, Iterable
 
-from mimeo.config import MimeoConfig
+from mimeo.config import MimeoConfig, SpecialFieldsGraph
 from mimeo.config import constants as cc
 from mimeo.context import MimeoContext
 from mimeo.context.exc import (InvalidReferenceValueError,
                                NoCorrespondingReferenceError,
                                NonPopulatedReferenceError,
                                ReferenceNotFoundError, VarNotFoundError)
-from mimeo.meta import Alive, OnlyOneAlive
+from mimeo.context.random_engines import RandomEngine, RandomEngineFactory
+from mimeo.context.reference_stores import (AnyReferenceStore,
+                                            ParallelReferenceStore)
+from mimeo.meta import Alive, LRUCache, OnlyOneAlive
+
+logger = logging.getLogger(__name__)
 
 
 class MimeoContextManager(Alive, metaclass=OnlyOneAlive):
@@ -39,14 +46,32 @@ class MimeoContextManager(Alive, metaclass=OnlyOneAlive):
         Set the current Mimeo Context.
     get_var(self, variable_name: str) -> str | int | bool | dict
         Return a specific Mimeo Var value.
+    get_random(self) -> random.Random
+        Return a random values generator of the current Mimeo Context.
+    get_random_engine(self) -> RandomEngine
+        Return a random engine of the current Mimeo Context.
+    get_utils_cache(self) -> LRUCache
+        Return a cache of Mimeo Util instances.
+    get_special_fields_graph(self) -> SpecialFieldsGraph
+        Return dependencies of Mimeo Special Fields.
+    keep_iterations_history(self, context_names: Iterable[str] | None)
+        Keep past iterations only in specific contexts.
     cache_ref(self, field_name: str, field_value: str | int | float | bool)
         Cache a field's value in references.
     get_ref(self, ref_name: str) -> str | int | float | bool
         Get a reference value.
     get_ref_names(self) -> list[str]
         Get reference names.
+    get_refs_memory_usage(self) -> dict[str, int]
+        Estimate memory used by each reference's values.
+    has_ref(self, ref_name: str) -> bool
+        Verify if a reference is configured.
+    is_referenced(self, context_name: str, field_name: str) -> bool
+        Verify if a field is cached in any reference.
     """
 
+    _UTILS_CACHE_SIZE: ClassVar[int] = 1_000
+
     def __init__(
             self,
             mimeo_config: MimeoConfig | None = None,
@@ -62,15 +87,27 @@ class MimeoContextManager(Alive, metaclass=OnlyOneAlive):
         self._mimeo_config: MimeoConfig = mimeo_config
         self._vars: dict = {}
         self._refs: dict = {}
+        self._refs_index: dict[tuple[str, str], list[str]] = {}
+        self._ref_names: frozenset[str] = frozenset()
         self._contexts: dict = {}
         self._current_context: MimeoContext | None = None
+        self._rng: random.Random | None = None
+        self._random_engine: RandomEngine | None = None
+        self._utils_cache: LRUCache | None = None
+        self._special_fields_graph: SpecialFieldsGraph | None = None
+        self._contexts_with_history: frozenset[str] | None = None
 
     def __enter__(
             self,
     ) -> MimeoContextManager:
         """Enter the MimeoContextManager instance.
 
-        Extends Alive __enter__ function and initializes vars.
+        Extends Alive __enter__ function and initializes vars, refs, a cache of
+        Mimeo Util instances, a random values generator and a random engine
+        seeded with the Mimeo Configuration's seed. Each ref gets a store
+        depending on its type. Refs are indexed by their source context and
+        field, so that caching a field's value does not need to scan all of
+        them. Special fields dependencies are analyzed once as well.
 
         Returns
         -------
@@ -79,7 +116,20 @@ class MimeoContextManager(Alive, metaclass=OnlyOneAlive):
         """
         super().__enter__()
         self._vars = self._mimeo_config.vars
-        self._refs = {ref: [] for ref in self._mimeo_config.refs}
+        self._refs = {}
+        self._refs_index = {}
+        for ref_name, ref_meta in self._mimeo_config.refs.items():
+            self._refs[ref_name] = self._create_ref_store(ref_meta)
+            ref_source = (ref_meta[cc.REFS_DETAIL_CONTEXT],
+                          ref_meta[cc.REFS_DETAIL_FIELD])
+            self._refs_index.setdefault(ref_source, []).append(ref_name)
+        self._ref_names = frozenset(self._mimeo_config.refs)
+        self._rng = random.Random(self._mimeo_config.seed)
+        self._random_engine = RandomEngineFactory.get_random_engine(
+            self._rng, self._mimeo_config.seed)
+        self._utils_cache = LRUCache(self._UTILS_CACHE_SIZE)
+        self._special_fields_graph = SpecialFieldsGraph(self._mimeo_config)
+        self._contexts_with_history = None
         return self
 
     def __exit__(
@@ -91,7 +141,8 @@ class MimeoContextManager(Alive, metaclass=OnlyOneAlive):
         """Exit the MimeoContextManager instance.
 
         Extends Alive __enter__ function and removes internal
-        attributes.
+        attributes. Before that, memory used by each reference's values
+        is logged at DEBUG level.
 
         Parameters
         ----------
@@ -107,9 +158,14 @@ class MimeoContextManager(Alive, metaclass=OnlyOneAlive):
         None
             A None value
         """
+        if logger.isEnabledFor(logging.DEBUG):
+            for ref_name, nbytes in self.get_refs_memory_usage().items():
+                logger.debug("Ref [%s] uses [%s] bytes", ref_name, nbytes)
         super().__exit__(exc_type, exc_val, exc_tb)
         self._vars = None
         self._contexts = None
+        self._utils_cache = None
+        self._special_fields_graph = None
 
     def get_context(
             self,
@@ -117,7 +173,11 @@ class MimeoContextManager(Alive, metaclass=OnlyOneAlive):
     ) -> MimeoContext:
         """Return a Mimeo Context with a specific name.
 
-        If the context does not exist, it is initialized.
+        If the context does not exist, it is initialized. When the Mimeo
+        Configuration has a seed, each context gets its own random values
+        generator seeded with the configured seed and the context's name.
+        Thanks to that, values generated in a context do not depend on
+        values generated in others.
 
         Parameters
         ----------
@@ -136,7 +196,11 @@ class MimeoContextManager(Alive, metaclass=OnlyOneAlive):
         """
         super().assert_alive()
         if context not in self._contexts:
-            self._contexts[context] = MimeoContext(context)
+            seed = self._mimeo_config.seed
+            context_seed = f"{seed}:{context}" if seed is not None else None
+            self._contexts[context] = MimeoContext(context, context_seed)
+            self._contexts[context].retain_iterations(
+                self._get_retained_iterations(context))
         return self._contexts[context]
 
     def get_current_context(
@@ -231,12 +295,10 @@ class MimeoContextManager(Alive, metaclass=OnlyOneAlive):
         """
         if isinstance(field_value, (dict, list)):
             raise InvalidReferenceValueError(field_value)
-        ref_names = [ref_name
-                     for ref_name, ref_meta in self._mimeo_config.refs.items()
-                     if ref_meta[cc.REFS_DETAIL_CONTEXT] == self._current_context.name
-                     and ref_meta[cc.REFS_DETAIL_FIELD] == field_name]
-        for ref_name in ref_names:
-            self._refs[ref_name].append(field_value)
+        ref_names = self._refs_index.get((self._current_context.name, field_name))
+        if ref_names is not None:
+            for ref_name in ref_names:
+                self._refs[ref_name].append(field_value)
 
     def get_ref(
             self,
@@ -245,8 +307,8 @@ class MimeoContextManager(Alive, metaclass=OnlyOneAlive):
         """Get a reference value.
 
         It provides a reference value depending on its type. For 'any' returns a value
-        on any index. For 'parallel' it uses a value produced in a corresponding
-        iteration for a source context.
+        on any index of the values sampled. For 'parallel' it uses a value produced
+        in a corresponding iteration for a source context.
 
         Parameters
         ----------
@@ -282,9 +344,120 @@ class MimeoContextManager(Alive, metaclass=OnlyOneAlive):
             if index >= len(values):
                 raise NoCorrespondingReferenceError(ref_name, curr_iter)
         else:
-            index = random.randrange(0, len(values))
+            index = self.get_random().randrange(0, len(values))
         return values[index]
 
+    def get_random(
+            self,
+    ) -> random.Random:
+        """Return a random values generator of the current Mimeo Context.
+
+        When there's no current context, the generator of the Mimeo Context
+        Manager is returned.
+
+        Returns
+        -------
+        random.Random
+            A random values generator
+
+        Raises
+        ------
+        InstanceNotAliveError
+            If the MimeoContextManager instance is not alive
+        """
+        super().assert_alive()
+        if self._current_context is not None:
+            return self._current_context.rng
+        return self._rng
+
+    def get_random_engine(
+            self,
+    ) -> RandomEngine:
+        """Return a random engine of the current Mimeo Context.
+
+        When there's no current context, the engine of the Mimeo Context
+        Manager is returned.
+
+        Returns
+        -------
+        RandomEngine
+            A random engine drawing blocks of values
+
+        Raises
+        ------
+        InstanceNotAliveError
+            If the MimeoContextManager instance is not alive
+        """
+        super().assert_alive()
+        if self._current_context is not None:
+            return self._current_context.random_engine
+        return self._random_engine
+
+    def get_utils_cache(
+            self,
+    ) -> LRUCache:
+        """Return a cache of Mimeo Util instances.
+
+        The cache is scoped to a single Mimeo Configuration processing.
+
+        Returns
+        -------
+        LRUCache
+            A cache of Mimeo Util instances
+
+        Raises
+        ------
+        InstanceNotAliveError
+            If the MimeoContextManager instance is not alive
+        """
+        super().assert_alive()
+        return self._utils_cache
+
+    def get_special_fields_graph(
+            self,
+    ) -> SpecialFieldsGraph:
+        """Return dependencies of Mimeo Special Fields.
+
+        Returns
+        -------
+        SpecialFieldsGraph
+            Special fields defined and referenced in the Mimeo Configuration
+
+        Raises
+        ------
+        InstanceNotAliveError
+            If the MimeoContextManager instance is not alive
+        """
+        super().assert_alive()
+        return self._special_fields_graph
+
+    def keep_iterations_history(
+            self,
+            context_names: Iterable[str] | None,
+    ):
+        """Keep past iterations only in specific contexts.
+
+        Other contexts keep the current iteration only. By default, all
+        contexts keep past iterations.
+
+        Parameters
+        ----------
+        context_names : Iterable[str] | None
+            Names of contexts which past iterations can be referenced
+            (all of them when None)
+
+        Raises
+        ------
+        InstanceNotAliveError
+            If the MimeoContextManager instance is not alive
+        """
+        super().assert_alive()
+        self._contexts_with_history = (frozenset(context_names)
+                                       if context_names is not None
+                                       else None)
+        for context_name, context in self._contexts.items():
+            context.retain_iterations(self._get_retained_iterations(context_name))
+
     def get_ref_names(
             self,
     ) -> list[str]:
@@ -297,3 +470,97 @@ class MimeoContextManager(Alive, metaclass=OnlyOneAlive):
         """
         return list(self._mimeo_config.refs.keys())
 
+    def get_refs_memory_usage(
+            self,
+    ) -> dict[str, int]:
+        """Estimate memory used by each reference's values.
+
+        Returns
+        -------
+        dict[str, int]
+            A number of bytes used by each reference's store
+        """
+        return {ref_name: store.nbytes() for ref_name, store in self._refs.items()}
+
+    def has_ref(
+            self,
+            ref_name: str,
+    ) -> bool:
+        """Verify if a reference is configured.
+
+        Parameters
+        ----------
+        ref_name : str
+            A reference name
+
+        Returns
+        -------
+        bool
+            True if the reference is configured. Otherwise, False.
+        """
+        return ref_name in self._ref_names
+
+    def is_referenced(
+            self,
+            context_name: str,
+            field_name: str,
+    ) -> bool:
+        """Verify if a field is cached in any reference.
+
+        Parameters
+        ----------
+        context_name : str
+            A context name
+        field_name : str
+            A field name
+
+        Returns
+        -------
+        bool
+            True if any reference has context and field configured to the ones
+            provided. Otherwise, False.
+        """
+        return (context_name, field_name) in self._refs_index
+
+    def _get_retained_iterations(
+            self,
+            context_name: str,
+    ) -> int | None:
+        """Get a number of iterations retained in a context.
+
+        Parameters
+        ----------
+        context_name : str
+            A context name
+
+        Returns
+        -------
+        int | None
+            1 if past iterations of the context cannot be referenced.
+            Otherwise, None.
+        """
+        if (self._contexts_with_history is None or
+                context_name in self._contexts_with_history):
+            return None
+        return 1
+
+    def _create_ref_store(
+            self,
+            ref_meta: dict,
+    ) -> AnyReferenceStore | ParallelReferenceStore:
+        """Create a store for a reference's values.
+
+        Parameters
+        ----------
+        ref_meta : dict
+            A reference's details
+
+        Returns
+        -------
+        AnyReferenceStore | ParallelReferenceStore
+            A store suitable for the reference's type
+        """
+        if ref_meta[cc.REFS_DETAIL_TYPE] == cc.REFS_TYPE_PARALLEL:
+            return ParallelReferenceStore()
+        return AnyReferenceStore(self.get_random,
+                                 ref_meta.get(cc.REFS_DETAIL_CAPACITY))
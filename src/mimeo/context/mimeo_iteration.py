@@ -7,6 +7,7 @@ It exports only one class:
 from __future__ import annotations
 
 import uuid
+from typing import Callable
 
 from mimeo.context.exc import (InvalidSpecialFieldNameError,
                                InvalidSpecialFieldValueError,
@@ -19,6 +20,7 @@ class MimeoIteration:
     Each iteration has its own id (an ordinal number in a context),
     a key being a unique value across all iterations, and
     it stores special fields that could be ingested in other fields.
+    The key is generated lazily, when it is accessed for the first time.
 
     Attributes
     ----------
@@ -38,6 +40,8 @@ class MimeoIteration:
     def __init__(
             self,
             identifier: int,
+            key: str | None = None,
+            key_factory: Callable[[], str] | None = None,
     ):
         """Initialize MimeoIteration class.
 
@@ -45,11 +49,34 @@ class MimeoIteration:
         ----------
         identifier : int
             An ordinal number in a Mimeo Context
+        key : str | None, default None
+            An UUID value of the iteration
+        key_factory : Callable[[], str] | None, default None
+            A function generating the key when it is not provided
+            (a random UUID by default)
         """
         self.id: identifier = identifier
-        self.key: str = str(uuid.uuid4())
+        self._key: str | None = key
+        self._key_factory: Callable[[], str] | None = key_factory
         self._special_fields: dict = {}
 
+    @property
+    def key(
+            self,
+    ) -> str:
+        """Return the iteration's key, generating it on first access.
+
+        Returns
+        -------
+        str
+            An UUID value unique across all templates
+        """
+        if self._key is None:
+            self._key = (self._key_factory() if self._key_factory is not None
+                         else str(uuid.uuid4()))
+            self._key_factory = None
+        return self._key
+
     def add_special_field(
             self,
             field_name: str,
@@ -0,0 +1,119 @@
+"""The Mimeo Permutations module.
+
+It exports only one class:
+    * IndexPermutation
+        A class providing unique indexes of a range in a random order.
+"""
+from __future__ import annotations
+
+import random
+from typing import ClassVar
+
+
+class IndexPermutation:
+    """A class providing unique indexes of a range in a random order.
+
+    Indexes are not materialized. The n-th index is computed by a keyed
+    Feistel network - a bijection over the smallest power of 4 covering
+    the range's length. Positions mapped outside the range are mapped again
+    (cycle-walking) until they fall into it, so every index is provided
+    exactly once in constant memory.
+
+    Methods
+    -------
+    pop() -> int
+        Provide the next unique index.
+    """
+
+    _ROUNDS: ClassVar[int] = 8
+    _MULTIPLIER_1: ClassVar[int] = 0xBF58476D1CE4E5B9
+    _MULTIPLIER_2: ClassVar[int] = 0x94D049BB133111EB
+    _MASK_64: ClassVar[int] = 0xFFFFFFFFFFFFFFFF
+
+    def __init__(
+            self,
+            population: range,
+            rng: random.Random,
+    ):
+        """Initialize IndexPermutation class.
+
+        Parameters
+        ----------
+        population : range
+            A range of indexes to permute
+        rng : random.Random
+            A random values generator used to draw the permutation's keys
+        """
+        self._population: range = population
+        self._length: int = len(population)
+        self._position: int = 0
+        self._half_bits: int = max(1, ((self._length - 1).bit_length() + 1) // 2)
+        self._half_mask: int = (1 << self._half_bits) - 1
+        self._keys: tuple[int, ...] = tuple(rng.getrandbits(64)
+                                            for _ in range(self._ROUNDS))
+
+    def __len__(
+            self,
+    ) -> int:
+        """Return a number of indexes not provided yet.
+
+        Returns
+        -------
+        int
+            A number of remaining indexes
+        """
+        return self._length - self._position
+
+    def pop(
+            self,
+    ) -> int:
+        """Provide the next unique index.
+
+        Returns
+        -------
+        int
+            An index of the range not provided so far
+
+        Raises
+        ------
+        IndexError
+            If all indexes have been provided already
+        """
+        if self._position >= self._length:
+            msg = "pop from an exhausted permutation"
+            raise IndexError(msg)
+
+        position = self._encrypt(self._position)
+        while position >= self._length:
+            position = self._encrypt(position)
+        self._position += 1
+        return self._population[position]
+
+    def _encrypt(
+            self,
+            position: int,
+    ) -> int:
+        """Map a position with the Feistel network.
+
+        Each round mixes a half of the position with a round key using
+        the SplitMix64 finalizer.
+
+        Parameters
+        ----------
+        position : int
+            A position lower than 4 to the power of half bits
+
+        Returns
+        -------
+        int
+            A mapped position
+        """
+        half_bits, half_mask = self._half_bits, self._half_mask
+        multiplier_1, multiplier_2 = self._MULTIPLIER_1, self._MULTIPLIER_2
+        mask_64 = self._MASK_64
+        left, right = position >> half_bits, position & half_mask
+        for key in self._keys:
+            mixed = ((right ^ key) * multiplier_1) & mask_64
+            mixed = ((mixed ^ (mixed >> 31)) * multiplier_2) & mask_64
+            left, right = right, left ^ ((mixed >> 32) & half_mask)
+        return (left << half_bits) | right
@@ -0,0 +1,389 @@
+"""The Mimeo Random Engines module.
+
+It exports classes drawing blocks of random values:
+    * RandomEngine
+        A superclass for all random engines.
+    * PythonRandomEngine
+        A RandomEngine implementation based on the random module.
+    * NumpyRandomEngine
+        A RandomEngine implementation based on a NumPy Generator.
+    * RandomEngineFactory
+        A Factory class instantiating the fastest RandomEngine available.
+"""
+from __future__ import annotations
+
+import random
+from abc import ABCMeta, abstractmethod
+from typing import Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+class RandomEngine(metaclass=ABCMeta):
+    """A superclass for all random engines.
+
+    A random engine draws whole blocks of random values at once. It is used
+    to render Mimeo Util values in batches, while single values are drawn
+    with a random.Random instance.
+
+    Methods
+    -------
+    integers(start: int, stop: int, size: int) -> list[int]
+        Draw random integers from a range.
+    choices(population: Sequence, size: int) -> list
+        Draw random items from a population.
+    strings(alphabet: str, length: int, size: int) -> list[str]
+        Draw random strings of characters from an alphabet.
+    """
+
+    @abstractmethod
+    def integers(
+            self,
+            start: int,
+            stop: int,
+            size: int,
+    ) -> list[int]:
+        """Draw random integers from a range.
+
+        Parameters
+        ----------
+        start : int
+            A lower bound of integers (inclusive)
+        stop : int
+            An upper bound of integers (exclusive)
+        size : int
+            A number of integers to draw
+
+        Returns
+        -------
+        list[int]
+            Random integers
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def strings(
+            self,
+            alphabet: str,
+            length: int,
+            size: int,
+    ) -> list[str]:
+        """Draw random strings of characters from an alphabet.
+
+        Parameters
+        ----------
+        alphabet : str
+            Characters to draw from
+        length : int
+            A length of each string
+        size : int
+            A number of strings to draw
+
+        Returns
+        -------
+        list[str]
+            Random strings
+        """
+        raise NotImplementedError
+
+    def choices(
+            self,
+            population: Sequence,
+            size: int,
+    ) -> list:
+        """Draw random items from a population.
+
+        Parameters
+        ----------
+        population : Sequence
+            Items to draw from
+        size : int
+            A number of items to draw
+
+        Returns
+        -------
+        list
+            Random items
+        """
+        return [population[index]
+                for index in self.integers(0, len(population), size)]
+
+
+class PythonRandomEngine(RandomEngine):
+    """A RandomEngine implementation based on the random module.
+
+    Values are drawn from a random.Random instance, so they are the same
+    as the ones drawn one by one with this instance.
+
+    Methods
+    -------
+    integers(start: int, stop: int, size: int) -> list[int]
+        Draw random integers from a range.
+    choices(population: Sequence, size: int) -> list
+        Draw random items from a population.
+    strings(alphabet: str, length: int, size: int) -> list[str]
+        Draw random strings of characters from an alphabet.
+    """
+
+    def __init__(
+            self,
+            rng: random.Random,
+    ):
+        """Initialize PythonRandomEngine class.
+
+        Parameters
+        ----------
+        rng : random.Random
+            A random values generator
+        """
+        self._rng: random.Random = rng
+
+    def integers(
+            self,
+            start: int,
+            stop: int,
+            size: int,
+    ) -> list[int]:
+        """Draw random integers from a range.
+
+        Parameters
+        ----------
+        start : int
+            A lower bound of integers (inclusive)
+        stop : int
+            An upper bound of integers (exclusive)
+        size : int
+            A number of integers to draw
+
+        Returns
+        -------
+        list[int]
+            Random integers
+        """
+        randrange = self._rng.randrange
+        return [randrange(start, stop) for _ in range(size)]
+
+    def choices(
+            self,
+            population: Sequence,
+            size: int,
+    ) -> list:
+        """Draw random items from a population.
+
+        Overrides RandomEngine's implementation to draw all items
+        in a single call.
+
+        Parameters
+        ----------
+        population : Sequence
+            Items to draw from
+        size : int
+            A number of items to draw
+
+        Returns
+        -------
+        list
+            Random items
+        """
+        return self._rng.choices(population, k=size)
+
+    def strings(
+            self,
+            alphabet: str,
+            length: int,
+            size: int,
+    ) -> list[str]:
+        """Draw random strings of characters from an alphabet.
+
+        Characters of all strings are drawn in a single call.
+
+        Parameters
+        ----------
+        alphabet : str
+            Characters to draw from
+        length : int
+            A length of each string
+        size : int
+            A number of strings to draw
+
+        Returns
+        -------
+        list[str]
+            Random strings
+        """
+        if length == 0:
+            return [""] * size
+        text = "".join(self._rng.choices(alphabet, k=length * size))
+        return [text[start:start + length]
+                for start in range(0, length * size, length)]
+
+
+class NumpyRandomEngine(PythonRandomEngine):
+    """A RandomEngine implementation based on a NumPy Generator.
+
+    Blocks of values are drawn as NumPy arrays and converted to Python
+    objects at once. Integers exceeding the 64-bit range and non-ASCII
+    alphabets are not supported by arrays used, so they are drawn with
+    the PythonRandomEngine's implementation.
+
+    Methods
+    -------
+    integers(start: int, stop: int, size: int) -> list[int]
+        Draw random integers from a range.
+    choices(population: Sequence, size: int) -> list
+        Draw random items from a population.
+    strings(alphabet: str, length: int, size: int) -> list[str]
+        Draw random strings of characters from an alphabet.
+    """
+
+    _INT64_MIN: int = -(2 ** 63)
+    _INT64_MAX: int = 2 ** 63 - 1
+
+    def __init__(
+            self,
+            rng: random.Random,
+            seed: int | str | None = None,
+    ):
+        """Initialize NumpyRandomEngine class.
+
+        Parameters
+        ----------
+        rng : random.Random
+            A random values generator used for unsupported values
+        seed : int | str | None, default None
+            A seed of the NumPy Generator. When it is not provided,
+            the generator is seeded from an operating system source.
+        """
+        super().__init__(rng)
+        numpy_seed = (random.Random(f"{seed}:numpy").getrandbits(128)
+                      if seed is not None else None)
+        self._generator: np.random.Generator = np.random.default_rng(numpy_seed)
+
+    def integers(
+            self,
+            start: int,
+            stop: int,
+            size: int,
+    ) -> list[int]:
+        """Draw random integers from a range.
+
+        Overrides PythonRandomEngine's implementation to draw integers
+        within the 64-bit range as an array.
+
+        Parameters
+        ----------
+        start : int
+            A lower bound of integers (inclusive)
+        stop : int
+            An upper bound of integers (exclusive)
+        size : int
+            A number of integers to draw
+
+        Returns
+        -------
+        list[int]
+            Random integers
+        """
+        if start < self._INT64_MIN or stop - 1 > self._INT64_MAX:
+            return super().integers(start, stop, size)
+        return self._generator.integers(start, stop, size=size,
+                                        dtype=np.int64, endpoint=False).tolist()
+
+    def choices(
+            self,
+            population: Sequence,
+            size: int,
+    ) -> list:
+        """Draw random items from a population.
+
+        Overrides PythonRandomEngine's implementation to draw indexes
+        as an array.
+
+        Parameters
+        ----------
+        population : Sequence
+            Items to draw from
+        size : int
+            A number of items to draw
+
+        Returns
+        -------
+        list
+            Random items
+        """
+        return RandomEngine.choices(self, population, size)
+
+    def strings(
+            self,
+            alphabet: str,
+            length: int,
+            size: int,
+    ) -> list[str]:
+        """Draw random strings of characters from an alphabet.
+
+        Overrides PythonRandomEngine's implementation to draw characters
+        of ASCII alphabets as a bytes array.
+
+        Parameters
+        ----------
+        alphabet : str
+            Characters to draw from
+        length : int
+            A length of each string
+        size : int
+            A number of strings to draw
+
+        Returns
+        -------
+        list[str]
+            Random strings
+        """
+        if length == 0 or not alphabet.isascii():
+            return super().strings(alphabet, length, size)
+        characters = np.frombuffer(alphabet.encode("ascii"), dtype=np.uint8)
+        indexes = self._generator.integers(0, len(characters), size=length * size)
+        text = characters[indexes].tobytes().decode("ascii")
+        return [text[start:start + length]
+                for start in range(0, length * size, length)]
+
+
+class RandomEngineFactory:
+    """A Factory class instantiating the fastest RandomEngine available.
+
+    A NumpyRandomEngine is used when NumPy is installed. Otherwise,
+    a PythonRandomEngine is used.
+
+    Methods
+    -------
+    get_random_engine(
+        rng: random.Random,
+        seed: int | str | None = None
+    ) -> RandomEngine
+        Initialize the fastest RandomEngine available.
+    """
+
+    @staticmethod
+    def get_random_engine(
+            rng: random.Random,
+            seed: int | str | None = None,
+    ) -> RandomEngine:
+        """Initialize the fastest RandomEngine available.
+
+        Parameters
+        ----------
+        rng : random.Random
+            A random values generator
+        seed : int | str | None, default None
+            A seed of the random engine (used by a NumpyRandomEngine only)
+
+        Returns
+        -------
+        RandomEngine
+            A RandomEngine's implementation instance
+        """
+        if np is not None:
+            return NumpyRandomEngine(rng, seed)
+        return PythonRandomEngine(rng)
@@ -0,0 +1,267 @@
+"""The Mimeo Reference Stores module.
+
+It exports classes storing values of Mimeo Refs:
+    * AnyReferenceStore
+        A class storing a uniform sample of values for 'any' references.
+    * ParallelReferenceStore
+        A class storing all values of 'parallel' references compactly.
+"""
+from __future__ import annotations
+
+import random
+import sys
+from array import array
+from typing import Callable, ClassVar
+
+
+class AnyReferenceStore:
+    """A class storing a uniform sample of values for 'any' references.
+
+    An 'any' reference provides random values only, so it does not need to
+    keep all of them. When a capacity is configured, the store keeps at most
+    that many values using reservoir sampling: every value cached so far has
+    the same chance to be in the store. Otherwise, all values are kept.
+
+    Attributes
+    ----------
+    capacity : int | None
+        A maximum number of values kept
+    seen : int
+        A number of values cached so far
+
+    Methods
+    -------
+    append(value: str | int | float | bool)
+        Cache a value.
+    nbytes() -> int
+        Estimate memory used by stored values.
+    """
+
+    def __init__(
+            self,
+            rng: Callable[[], random.Random],
+            capacity: int | None = None,
+    ):
+        """Initialize AnyReferenceStore class.
+
+        Parameters
+        ----------
+        rng : Callable[[], random.Random]
+            A function providing a random values generator used for sampling
+        capacity : int | None, default None
+            A maximum number of values kept (unlimited if None)
+        """
+        self.capacity: int | None = capacity
+        self.seen: int = 0
+        self._rng: Callable[[], random.Random] = rng
+        self._values: list = []
+
+    def __len__(
+            self,
+    ) -> int:
+        """Return a number of values stored.
+
+        Returns
+        -------
+        int
+            A number of values stored
+        """
+        return len(self._values)
+
+    def __getitem__(
+            self,
+            index: int,
+    ) -> str | int | float | bool:
+        """Return a value stored at a specific index.
+
+        Parameters
+        ----------
+        index : int
+            A value's index
+
+        Returns
+        -------
+        str | int | float | bool
+            A stored value
+        """
+        return self._values[index]
+
+    def append(
+            self,
+            value: str | int | float | bool,
+    ):
+        """Cache a value.
+
+        When the store is full, the value replaces a random one with probability
+        equal to the capacity divided by a number of values seen.
+
+        Parameters
+        ----------
+        value : str | int | float | bool
+            A value to cache
+        """
+        self.seen += 1
+        if self.capacity is None or len(self._values) < self.capacity:
+            self._values.append(value)
+        else:
+            index = self._rng().randrange(0, self.seen)
+            if index < self.capacity:
+                self._values[index] = value
+
+    def nbytes(
+            self,
+    ) -> int:
+        """Estimate memory used by stored values.
+
+        Returns
+        -------
+        int
+            A number of bytes used by the list and the values it stores
+        """
+        return sys.getsizeof(self._values) + sum(map(sys.getsizeof, self._values))
+
+
+class ParallelReferenceStore:
+    """A class storing all values of 'parallel' references compactly.
+
+    A 'parallel' reference needs a value of every iteration, so all values
+    are kept in order. As long as they are of the same type, they are stored
+    in a typed array: numbers and booleans directly, strings encoded in a
+    single bytes buffer with an array of their end offsets. Once a value
+    of a different type (or a number exceeding 64 bits) is cached, values
+    are moved into a list.
+
+    Methods
+    -------
+    append(value: str | int | float | bool)
+        Cache a value.
+    nbytes() -> int
+        Estimate memory used by stored values.
+    """
+
+    _TYPECODES: ClassVar[dict[type, str]] = {
+        bool: "b",
+        int: "q",
+        float: "d",
+    }
+
+    def __init__(
+            self,
+    ):
+        """Initialize ParallelReferenceStore class."""
+        self._type: type | None = None
+        self._values: array | bytearray | list | None = None
+        self._offsets: array | None = None
+
+    def __len__(
+            self,
+    ) -> int:
+        """Return a number of values stored.
+
+        Returns
+        -------
+        int
+            A number of values stored
+        """
+        if self._offsets is not None:
+            return len(self._offsets)
+        return len(self._values) if self._values is not None else 0
+
+    def __getitem__(
+            self,
+            index: int,
+    ) -> str | int | float | bool:
+        """Return a value stored at a specific index.
+
+        Parameters
+        ----------
+        index : int
+            A value's index
+
+        Returns
+        -------
+        str | int | float | bool
+            A stored value
+        """
+        if self._type is None:
+            return self._values[index]
+        if self._offsets is not None:
+            start = self._offsets[index - 1] if index > 0 else 0
+            end = self._offsets[index]
+            return self._values[start:end].decode("utf-8", "surrogatepass")
+        return self._type(self._values[index])
+
+    def append(
+            self,
+            value: str | int | float | bool,
+    ):
+        """Cache a value.
+
+        Parameters
+        ----------
+        value : str | int | float | bool
+            A value to cache
+        """
+        if self._values is None:
+            self._init_values(type(value))
+        elif self._type is not None and type(value) is not self._type:
+            self._to_list()
+
+        if self._type is None:
+            self._values.append(value)
+        elif self._offsets is not None:
+            self._values += value.encode("utf-8", "surrogatepass")
+            self._offsets.append(len(self._values))
+        else:
+            try:
+                self._values.append(value)
+            except OverflowError:
+                self._to_list()
+                self._values.append(value)
+
+    def nbytes(
+            self,
+    ) -> int:
+        """Estimate memory used by stored values.
+
+        Returns
+        -------
+        int
+            A number of bytes used by buffers or the list and the values it stores
+        """
+        if self._values is None:
+            return 0
+        if self._type is None:
+            return sys.getsizeof(self._values) + sum(map(sys.getsizeof, self._values))
+        if self._offsets is not None:
+            return sys.getsizeof(self._values) + sys.getsizeof(self._offsets)
+        return sys.getsizeof(self._values)
+
+    def _init_values(
+            self,
+            value_type: type,
+    ):
+        """Initialize a storage suitable for values of a specific type.
+
+        Parameters
+        ----------
+        value_type : type
+            A type of the first value cached
+        """
+        if value_type is str:
+            self._type = str
+            self._values = bytearray()
+            self._offsets = array("Q")
+        elif value_type in self._TYPECODES:
+            self._type = value_type
+            self._values = array(self._TYPECODES[value_type])
+        else:
+            self._values = []
+
+    def _to_list(
+            self,
+    ):
+        """Move values stored so far into a list."""
+        self._values = [self[index] for index in range(len(self))]
+        self._type = None
+        self._offsets = None
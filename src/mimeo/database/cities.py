@@ -105,6 +105,8 @@ class CitiesDB:
         Get all cities.
     get_cities_of(country_iso3: str) -> list[City]
         Get cities of a specific country.
+    get_cities_view_of(country_iso3: str) -> tuple[City, ...]
+        Get a read-only view of cities of a specific country.
     get_city_at(index: int) -> City
         Get a city at `index` position.
     """
@@ -113,7 +115,7 @@ class CitiesDB:
     _CITIES_DB: str = "cities.csv"
     _CITIES_DF: DataFrame = None
     _CITIES: ClassVar[list] = None
-    _COUNTRY_CITIES: ClassVar[dict] = {}
+    _COUNTRY_CITIES: ClassVar[dict] = None
 
     def get_city_at(
             self,
@@ -159,7 +161,28 @@ class CitiesDB:
         list[City]
             List of cities filtered by country
         """
-        return CitiesDB._get_country_cities(country_iso3).copy()
+        return list(CitiesDB._get_country_cities(country_iso3))
+
+    def get_cities_view_of(
+            self,
+            country_iso3: str,
+    ) -> tuple[City, ...]:
+        """Get a read-only view of cities of a specific country.
+
+        In contrast to get_cities_of() method, cities are not copied,
+        so the cost of a call does not depend on a number of cities.
+
+        Parameters
+        ----------
+        country_iso3 : str
+            A country ISO3 code to filter cities
+
+        Returns
+        -------
+        tuple[City, ...]
+            Cities filtered by country
+        """
+        return CitiesDB._get_country_cities(country_iso3)
 
     def get_cities(
             self,
@@ -177,11 +200,12 @@ class CitiesDB:
     def _get_country_cities(
             cls,
             country_iso3: str,
-    ) -> list[City]:
+    ) -> tuple[City, ...]:
         """Get cities of a specific country from cache.
 
-        The country's cities list is initialized for the first time
-        and cached in internal class attribute.
+        Cities of all countries are grouped for the first time in a single
+        pass and cached in internal class attribute as tuples, so they can
+        be shared safely.
 
         Parameters
         ----------
@@ -190,14 +214,16 @@ class CitiesDB:
 
         Returns
         -------
-        list[City]
-            List of cities filtered by country
+        tuple[City, ...]
+            Cities filtered by country
         """
-        if country_iso3 not in cls._COUNTRY_CITIES:
-            cities = cls._get_cities()
-            cities = filter(lambda c: c.country == country_iso3, cities)
-            cls._COUNTRY_CITIES[country_iso3] = list(cities)
-        return cls._COUNTRY_CITIES[country_iso3]
+        if cls._COUNTRY_CITIES is None:
+            country_cities = {}
+            for city in cls._get_cities():
+                country_cities.setdefault(city.country, []).append(city)
+            cls._COUNTRY_CITIES = {country: tuple(cities)
+                                   for country, cities in country_cities.items()}
+        return cls._COUNTRY_CITIES.get(country_iso3, ())
 
     @classmethod
     def _get_cities(
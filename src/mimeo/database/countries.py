@@ -104,12 +104,18 @@ class CountriesDB:
         Get a country having a specific ISO2 code.
     get_country_by_name(name: str) -> Country
         Get a country having a specific name.
+    get_country(country: str) -> Country
+        Get a country having a specific ISO3 code, ISO2 code or name.
     """
 
     NUM_OF_RECORDS: int = 239
     _COUNTRIES_DB: str = "countries.csv"
     _COUNTRIES_DF: DataFrame = None
     _COUNTRIES: ClassVar[list] = None
+    _COUNTRIES_BY_ISO_3: ClassVar[dict] = None
+    _COUNTRIES_BY_ISO_2: ClassVar[dict] = None
+    _COUNTRIES_BY_NAME: ClassVar[dict] = None
+    _COUNTRIES_BY_ANY: ClassVar[dict] = None
 
     def get_country_at(
             self,
@@ -155,8 +161,8 @@ class CountriesDB:
         Country
             A specific country or None
         """
-        countries = CountriesDB._get_countries()
-        return next(filter(lambda country: country.iso_3 == iso_3, countries), None)
+        CountriesDB._get_countries()
+        return CountriesDB._COUNTRIES_BY_ISO_3.get(iso_3)
 
     def get_country_by_iso_2(
             self,
@@ -174,8 +180,8 @@ class CountriesDB:
         Country
             A specific country or None
         """
-        countries = CountriesDB._get_countries()
-        return next(filter(lambda country: country.iso_2 == iso_2, countries), None)
+        CountriesDB._get_countries()
+        return CountriesDB._COUNTRIES_BY_ISO_2.get(iso_2)
 
     def get_country_by_name(
             self,
@@ -193,8 +199,29 @@ class CountriesDB:
         Country
             A specific country or None
         """
-        countries = CountriesDB._get_countries()
-        return next(filter(lambda country: country.name == name, countries), None)
+        CountriesDB._get_countries()
+        return CountriesDB._COUNTRIES_BY_NAME.get(name)
+
+    def get_country(
+            self,
+            country: str,
+    ) -> Country:
+        """Get a country having a specific ISO3 code, ISO2 code or name.
+
+        When several countries match, the first one in CSV data is returned.
+
+        Parameters
+        ----------
+        country : str
+            An ISO3 code, ISO2 code or name to find a country
+
+        Returns
+        -------
+        Country
+            A specific country or None
+        """
+        CountriesDB._get_countries()
+        return CountriesDB._COUNTRIES_BY_ANY.get(country)
 
     def get_countries(
             self,
@@ -215,7 +242,8 @@ class CountriesDB:
         """Get all countries from cache.
 
         The countries list is initialized for the first time and cached
-        in internal class attribute.
+        in internal class attribute, together with indexes of countries
+        by ISO3 code, ISO2 code, name and any of them.
 
         Returns
         -------
@@ -223,8 +251,19 @@ class CountriesDB:
             List of all countries
         """
         if cls._COUNTRIES is None:
-            cls._COUNTRIES = [Country(row.ISO_3, row.ISO_2, row.NAME)
-                              for row in cls._get_countries_df().itertuples()]
+            countries = [Country(row.ISO_3, row.ISO_2, row.NAME)
+                         for row in cls._get_countries_df().itertuples()]
+            cls._COUNTRIES_BY_ISO_3 = {}
+            cls._COUNTRIES_BY_ISO_2 = {}
+            cls._COUNTRIES_BY_NAME = {}
+            cls._COUNTRIES_BY_ANY = {}
+            for country in countries:
+                cls._COUNTRIES_BY_ISO_3.setdefault(country.iso_3, country)
+                cls._COUNTRIES_BY_ISO_2.setdefault(country.iso_2, country)
+                cls._COUNTRIES_BY_NAME.setdefault(country.name, country)
+                for detail in (country.iso_3, country.iso_2, country.name):
+                    cls._COUNTRIES_BY_ANY.setdefault(detail, country)
+            cls._COUNTRIES = countries
         return cls._COUNTRIES
 
     @classmethod
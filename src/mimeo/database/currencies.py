@@ -172,13 +172,15 @@ class CurrenciesDB:
     ) -> Currency | None:
         """Get currency of a specific country from cache.
 
-        The country's currency is initialized for the first time and cached in internal
-        class attribute.
+        The country's currency is found for the first time and cached in internal
+        class attribute, so every country is looked up once. A currency is used
+        in a country when the country name is a part of its countries. When
+        a country uses several currencies, the first one in CSV data is used.
 
         Parameters
         ----------
         country_name : str
-            A country ISO3 code to filter currencies
+            A country name to find a currency
 
         Returns
         -------
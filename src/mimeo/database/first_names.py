@@ -98,7 +98,7 @@ class FirstNamesDB:
     __FIRST_NAMES_DB: str = "forenames.csv"
     __FIRST_NAMES_DF: DataFrame = None
     __FIRST_NAMES: ClassVar[list] = None
-    __NAMES_FOR_SEX: ClassVar[dict] = {}
+    __NAMES_FOR_SEX: ClassVar[dict] = None
 
     def get_first_name_at(
             self,
@@ -172,8 +172,8 @@ class FirstNamesDB:
     ) -> list[FirstName]:
         """Get first names for a specific sex from cache.
 
-        The first names list for sex is initialized for the first time
-        and cached in internal class attribute.
+        First names of all sexes are grouped for the first time in a single
+        pass and cached in internal class attribute.
 
         Parameters
         ----------
@@ -185,10 +185,12 @@ class FirstNamesDB:
         list[FirstName]
             List of first names filtered by sex
         """
-        if sex not in cls.__NAMES_FOR_SEX:
-            first_names = cls._get_first_names()
-            cls.__NAMES_FOR_SEX[sex] = list(filter(lambda n: n.sex == sex, first_names))
-        return cls.__NAMES_FOR_SEX[sex]
+        if cls.__NAMES_FOR_SEX is None:
+            names_for_sex = {}
+            for first_name in cls._get_first_names():
+                names_for_sex.setdefault(first_name.sex, []).append(first_name)
+            cls.__NAMES_FOR_SEX = names_for_sex
+        return cls.__NAMES_FOR_SEX.get(sex, [])
 
     @classmethod
     def _get_first_names(
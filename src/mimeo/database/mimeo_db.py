@@ -40,6 +40,8 @@ class MimeoDB:
         Get all cities.
     get_cities_of(country: str) -> list[City]
         Get cities of a specific country.
+    get_cities_view_of(country: str) -> tuple[City, ...]
+        Get a read-only view of cities of a specific country.
     get_city_at(index: int) -> City
         Get a city at `index` position.
     get_currencies() -> list[Currency]
@@ -58,6 +60,8 @@ class MimeoDB:
         Get a country having a specific ISO2 code.
     get_country_by_name(name: str) -> Country
         Get a country having a specific name.
+    get_country(country: str) -> Country
+        Get a country having a specific ISO3 code, ISO2 code or name.
     get_first_names() -> list[FirstName]
         Get all first names.
     get_first_names_by_sex(sex: str) -> list[FirstName]
@@ -107,7 +111,7 @@ class MimeoDB:
         CitiesDB and CountriesDB to allow for any country detail
         providing. It can be ISO3 code, ISO2 code and name.
         First it will find the specific country and extract its
-        ISO3 code to use in CitiesDB.get_cities_of() call.
+        ISO3 code to use in CitiesDB.get_cities_view_of() call.
 
         Parameters
         ----------
@@ -119,13 +123,32 @@ class MimeoDB:
         list[City]
             List of cities filtered by country
         """
-        countries = filter(
-            lambda c: country in [c.iso_3, c.iso_2, c.name],
-            self.get_countries())
-        country = next(countries, None)
+        return list(self.get_cities_view_of(country))
+
+    def get_cities_view_of(
+            self,
+            country: str,
+    ) -> tuple[City, ...]:
+        """Get a read-only view of cities of a specific country.
+
+        In contrast to get_cities_of() method, cities are not copied,
+        so the cost of a call does not depend on a number of cities.
+        It is meant for internal callers rendering data.
+
+        Parameters
+        ----------
+        country : str
+            A country ISO3 / ISO2 code or name to filter cities
+
+        Returns
+        -------
+        tuple[City, ...]
+            Cities filtered by country
+        """
+        country = self._countries_db.get_country(country)
         if country is None:
-            return []
-        return self._cities_db.get_cities_of(country.iso_3)
+            return ()
+        return self._cities_db.get_cities_view_of(country.iso_3)
 
     def get_city_at(
             self,
@@ -207,10 +230,7 @@ class MimeoDB:
         Currency
             A currency used in a specific country
         """
-        countries = filter(
-            lambda c: country in [c.iso_3, c.iso_2, c.name],
-            self.get_countries())
-        country = next(countries, None)
+        country = self._countries_db.get_country(country)
         if country is None:
             return None
         return self._currencies_db.get_currency_of(country.name)
@@ -304,6 +324,24 @@ class MimeoDB:
         """
         return self._countries_db.get_country_by_name(name)
 
+    def get_country(
+            self,
+            country: str,
+    ) -> Country:
+        """Get a country having a specific ISO3 code, ISO2 code or name.
+
+        Parameters
+        ----------
+        country : str
+            An ISO3 code, ISO2 code or name to find a country
+
+        Returns
+        -------
+        Country
+            A specific country or None
+        """
+        return self._countries_db.get_country(country)
+
     def get_first_names(
             self,
     ) -> list[FirstName]:
@@ -3,11 +3,15 @@
 It contains all custom exceptions related to the highest Mimeograph level:
     * NotRunningMimeograph
         A custom Exception class for not running Mimeograph instance.
+    * InvalidMimeographParameterError
+        A custom Exception class for invalid Mimeograph parameters.
 """
 
 
 from __future__ import annotations
 
+from typing import Any
+
 
 class NotRunningMimeographError(Exception):
     """A custom Exception class for not running Mimeograph instance.
@@ -23,3 +27,29 @@ class NotRunningMimeographError(Exception):
         Extends Exception constructor with a constant message.
         """
         super().__init__("The Mimeograph instance is not running!")
+
+
+class InvalidMimeographParameterError(Exception):
+    """A custom Exception class for invalid Mimeograph parameters.
+
+    Raised when a Mimeograph parameter expected to be a positive integer is
+    lower than 1.
+    """
+
+    def __init__(
+            self,
+            param: str,
+            value: Any,
+    ):
+        """Initialize InvalidMimeographParameterError exception with details.
+
+        Extends Exception constructor with a custom message.
+
+        Parameters
+        ----------
+        param : str
+            A Mimeograph parameter name
+        value : Any
+            A provided parameter value
+        """
+        super().__init__(f"Provided {param} [{value}] is not a positive integer!")
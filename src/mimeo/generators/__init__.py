@@ -7,8 +7,16 @@ It contains modules supporting the Mimeo Config output formats:
     The Mimeo Generator Factory module.
 * json_generator
     The Mimeo JSON Generator module.
+* json_writer
+    The Mimeo JSON Writer module.
 * xml_generator
     The Mimeo XML Generator module.
+* xml_writer
+    The Mimeo XML Writer module.
+* plan
+    The Mimeo Template Plan module.
+* sharding
+    The Mimeo Sharding module.
 * exc
     The Mimeo Generators Exceptions module.
 
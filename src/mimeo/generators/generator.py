@@ -9,14 +9,15 @@ from __future__ import annotations
 import logging
 import xml.etree.ElementTree as ElemTree
 from abc import ABCMeta, abstractmethod
-from typing import Any, Iterator
+from typing import Any, ClassVar, Iterator
 
-from mimeo.config.mimeo_config import MimeoTemplate
+from mimeo.config import constants as cc
+from mimeo.config.mimeo_config import MimeoConfig, MimeoModel, MimeoTemplate
 from mimeo.context import MimeoContext, MimeoContextManager
-from mimeo.context.decorators import (mimeo_clear_iterations, mimeo_context,
-                                      mimeo_context_switch,
-                                      mimeo_next_iteration)
-from mimeo.utils import MimeoRenderer
+from mimeo.generators.plan import (AtomicNode, DictNode, ListNode,
+                                   LiteralValue, PlanNode, PlanValue,
+                                   StaticNode, TemplatePlan, UtilValue)
+from mimeo.utils import KeyUtil
 
 logger = logging.getLogger(__name__)
 
@@ -38,8 +39,22 @@ class Generator(metaclass=ABCMeta):
         data_unit: Any
     ) -> str
         Stringify data generated by the generate() method.
+    generate_stringified(
+        templates: list | Iterator[MimeoTemplate]
+    ) -> Iterator[str]
+        Generate stringified data based on the Mimeo Configuration.
+    compile_template(
+        template: MimeoTemplate
+    ) -> TemplatePlan
+        Compile a Mimeo Template into a TemplatePlan.
+    retain_iterations(
+        mimeo_config: MimeoConfig
+    )
+        Keep only iterations that can be referenced in Mimeo Contexts.
     """
 
+    _BATCH_SIZE: ClassVar[int] = 256
+
     @classmethod
     def __subclasshook__(
             cls,
@@ -108,6 +123,29 @@ class Generator(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    def generate_stringified(
+            self,
+            templates: list | Iterator[MimeoTemplate],
+    ) -> Iterator[str]:
+        """Generate stringified data based on the Mimeo Configuration.
+
+        By default, it stringifies data units generated by the generate() method.
+        Subclasses can override it to produce text without building data units
+        first.
+
+        Parameters
+        ----------
+        templates : list | Iterator[MimeoTemplate]
+            A collection of Mimeo Templates to process
+
+        Returns
+        -------
+        Iterator[str]
+            Iterator for stringified data units
+        """
+        for data_unit in self.generate(templates):
+            yield self.stringify(data_unit)
+
     @classmethod
     @abstractmethod
     def _pre_process_node(
@@ -117,7 +155,7 @@ class Generator(metaclass=ABCMeta):
         """Pre-process node's metadata.
 
         This function adjusts existing node's metadata and completes it with custom
-        properties.
+        properties. It is used once per node, while compiling a Mimeo Template.
 
         Parameters
         ----------
@@ -136,18 +174,21 @@ class Generator(metaclass=ABCMeta):
     def _process_complex_value(
             cls,
             parent: ElemTree.Element | dict | list | None,
-            node_meta: dict,
+            node: PlanNode,
+            context: MimeoContext,
     ) -> ElemTree.Element | dict | list | None:
-        """Process a node with a complex value.
+        """Process a compiled node with a complex value.
 
-        The node is processed accordingly to its value type.
+        The node is processed accordingly to its type.
 
         Parameters
         ----------
         parent : ElemTree.Element | dict | list | None
             A parent node
-        node_meta : dict
-            Node's metadata
+        node : PlanNode
+            A compiled node
+        context : MimeoContext
+            The current Mimeo Context
 
         Returns
         -------
@@ -161,9 +202,10 @@ class Generator(metaclass=ABCMeta):
     def _process_atomic_value(
             cls,
             parent: ElemTree.Element | dict | list | None,
-            node_meta: dict,
+            node: AtomicNode,
+            context: MimeoContext,
     ) -> ElemTree.Element | dict | list | None:
-        """Process a node with an atomic value.
+        """Process a compiled node with an atomic value.
 
         A parametrized Mimeo Util is considered as an atomic value as representing one.
         It renders a value for the node.
@@ -172,8 +214,10 @@ class Generator(metaclass=ABCMeta):
         ----------
         parent : ElemTree.Element | dict | list | None
             A parent node
-        node_meta : dict
-            Node's metadata
+        node : AtomicNode
+            A compiled node
+        context : MimeoContext
+            The current Mimeo Context
 
         Returns
         -------
@@ -183,109 +227,439 @@ class Generator(metaclass=ABCMeta):
         raise NotImplementedError
 
     @classmethod
-    @mimeo_context_switch
-    @mimeo_clear_iterations
-    def _process_single_template(
+    def _compile_complex_value(
+            cls,
+            node_meta: dict,
+            model: MimeoModel | None = None,
+    ) -> PlanNode:
+        """Compile a node with a complex value.
+
+        It is a method to implement in subclasses, as a complex value structure
+        depends on the output format.
+
+        Parameters
+        ----------
+        node_meta : dict
+            Pre-processed node's metadata
+        model : MimeoModel | None, default None
+            A Mimeo Model the node belongs to
+
+        Returns
+        -------
+        PlanNode
+            A compiled node
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def compile_template(
             cls,
             template: MimeoTemplate,
-            parent: ElemTree.Element | dict | list | None = None,
-    ) -> list[ElemTree.Element | dict]:
-        """Process a single Mimeo Template.
+    ) -> TemplatePlan:
+        """Compile a Mimeo Template into a TemplatePlan.
 
-        This function is used recursively when a Mimeo Configuration
-        contains nested templates.
-        It repeats same processing operation so many times as it is
-        configured in the `count` property of a Mimeo Configuration.
-        Before the template execution it switches context managed by
-        MimeoContextManager and also clears iterations as nested
-        templates would collect iterations from previous parent's
-        iterations.
+        The Mimeo Template's model is traversed only once, and every node is
+        classified upfront. Thanks to that, each iteration simply executes the plan.
+        Static subtrees are prebuilt at this stage, so they are not processed
+        node by node in every iteration. Batchable Mimeo Utils render their values
+        for a block of iterations at once, not exceeding the template's count.
 
         Parameters
         ----------
         template : MimeoTemplate
-            A single Mimeo Template to process
+            A Mimeo Template to compile
+
+        Returns
+        -------
+        TemplatePlan
+            A compiled Mimeo Template
+        """
+        logger.debug("Compiling template [%s]", template)
+        node_meta = cls._node_meta(
+            template.model.root_name,
+            template.model.root_data)
+        root = cls._compile_node(node_meta, template.model)
+        root = cls._fold_static_nodes(root, template.model.context_name)
+        cls._set_batch_size(root, min(cls._BATCH_SIZE, template.count))
+        return TemplatePlan(template, root)
+
+    @classmethod
+    def retain_iterations(
+            cls,
+            mimeo_config: MimeoConfig,
+    ):
+        """Keep only iterations that can be referenced in Mimeo Contexts.
+
+        Past iterations can be referenced only by the Key Mimeo Util
+        parametrized with an iteration. A Mimeo Configuration is analyzed
+        to find contexts targeted this way, and all other contexts keep their
+        current iteration only. When a targeted context cannot be determined
+        statically, all contexts keep past iterations.
+
+        Parameters
+        ----------
+        mimeo_config : MimeoConfig
+            A Mimeo Configuration being generated
+
+        Raises
+        ------
+        InstanceNotAliveError
+            If the MimeoContextManager instance is not alive
+        """
+        context_names = set()
+        is_determined = cls._collect_iterations_targets(
+            mimeo_config.vars, None, context_names)
+        for template in mimeo_config.templates:
+            is_determined = is_determined and cls._collect_iterations_targets(
+                template.model.root_data, template.model, context_names)
+        logger.debug("Contexts keeping past iterations: [%s]",
+                     context_names if is_determined else "all")
+        MimeoContextManager().keep_iterations_history(
+            context_names if is_determined else None)
+
+    @classmethod
+    def _collect_iterations_targets(
+            cls,
+            value: Any,
+            model: MimeoModel | None,
+            context_names: set[str],
+    ) -> bool:
+        """Collect contexts which past iterations are referenced in a value.
+
+        This is a recursive function traversing a value with nested
+        Mimeo Templates.
+
+        Parameters
+        ----------
+        value : Any
+            A value to traverse
+        model : MimeoModel | None
+            A Mimeo Model the value belongs to (None for Mimeo Vars)
+        context_names : set[str]
+            Names of contexts collected so far
+
+        Returns
+        -------
+        bool
+            True if all referenced contexts have been determined statically.
+            Otherwise, False.
+        """
+        if isinstance(value, list):
+            return all(cls._collect_iterations_targets(item, model, context_names)
+                       for item in value)
+        if not isinstance(value, dict):
+            return True
+
+        util = value.get(cc.MODEL_MIMEO_UTIL_KEY)
+        if (isinstance(util, dict) and
+                util.get(cc.MODEL_MIMEO_UTIL_NAME_KEY) == KeyUtil.KEY and
+                "iteration" in util):
+            target = util.get("context", model.context_name if model else None)
+            if not isinstance(target, str) or "{" in target:
+                return False
+            context_names.add(target)
+
+        for key, child in value.items():
+            if key == cc.TEMPLATES_KEY and isinstance(child, list) and model:
+                children = [(nested.model.root_data, nested.model)
+                            for nested in model.get_nested_templates(child)]
+            else:
+                children = [(child, model)]
+            if not all(cls._collect_iterations_targets(child_value, child_model,
+                                                       context_names)
+                       for child_value, child_model in children):
+                return False
+        return True
+
+    @classmethod
+    def _compile_nested_templates(
+            cls,
+            templates: list,
+            model: MimeoModel | None = None,
+    ) -> list[TemplatePlan]:
+        """Compile nested Mimeo Templates.
+
+        Nested templates are taken from the Mimeo Model when it is provided,
+        as they are parsed already while initializing Mimeo Configuration.
+
+        Parameters
+        ----------
+        templates : list
+            A source _templates_ node
+        model : MimeoModel | None, default None
+            A Mimeo Model the _templates_ node belongs to
+
+        Returns
+        -------
+        list[TemplatePlan]
+            Compiled nested Mimeo Templates
+        """
+        if model is not None:
+            nested_templates = model.get_nested_templates(templates)
+        else:
+            nested_templates = [MimeoTemplate(template) for template in templates]
+        return [cls.compile_template(template) for template in nested_templates]
+
+    @classmethod
+    def _compile_node(
+            cls,
+            node_meta: dict,
+            model: MimeoModel | None = None,
+    ) -> PlanNode:
+        """Compile a single template's node.
+
+        This is a recursive function that traverses Mimeo Template and compiles nodes
+        based on node's metadata. First, element is pre-processed, in meaning
+        of metadata being adjusted. Then, element is compiled accordingly to its value
+        type. Special fields not referenced anywhere are compiled as regular nodes,
+        and values of a context not referencing any special field are not checked
+        for them.
+
+        Parameters
+        ----------
+        node_meta : dict
+            Node's metadata
+        model : MimeoModel | None, default None
+            A Mimeo Model the node belongs to
+
+        Returns
+        -------
+        PlanNode
+            A compiled node
+        """
+        node_meta = cls._pre_process_node(node_meta)
+        if cls._is_complex(node_meta):
+            return cls._compile_complex_value(node_meta, model)
+
+        special = bool(node_meta["special"])
+        has_special_fields = True
+        if model is not None:
+            graph = MimeoContextManager().get_special_fields_graph()
+            special = special and graph.is_referenced(model.context_name,
+                                                      node_meta["name"])
+            has_special_fields = graph.has_references(model.context_name)
+
+        attrs = node_meta["attrs"]
+        return AtomicNode(
+            name=node_meta["name"],
+            value=PlanValue.compile(node_meta["value"], has_special_fields),
+            special=special,
+            attrs=dict(attrs) if attrs is not None else None)
+
+    @classmethod
+    def _fold_static_nodes(
+            cls,
+            node: PlanNode,
+            context_name: str,
+    ) -> PlanNode:
+        """Replace the largest static subtrees with prebuilt StaticNodes.
+
+        Parameters
+        ----------
+        node : PlanNode
+            A compiled node
+        context_name : str
+            A context name of the compiled Mimeo Template
+
+        Returns
+        -------
+        PlanNode
+            The compiled node with static subtrees folded
+        """
+        if isinstance(node, (DictNode, ListNode)):
+            if cls._is_static(node, context_name):
+                return StaticNode(
+                    node.name,
+                    cls._build_static_fragment(node),
+                    node.attrs)
+            node.children = [cls._fold_static_nodes(child, context_name)
+                             for child in node.children]
+        return node
+
+    @classmethod
+    def _set_batch_size(
+            cls,
+            node: PlanNode,
+            batch_size: int,
+    ):
+        """Set a number of values rendered at once by Mimeo Utils of a node.
+
+        Nested templates are not affected, as they are compiled separately.
+
+        Parameters
+        ----------
+        node : PlanNode
+            A compiled node
+        batch_size : int
+            A number of values rendered at once
+        """
+        if isinstance(node, AtomicNode):
+            if isinstance(node.value, UtilValue):
+                node.value.set_batch_size(batch_size)
+        elif isinstance(node, (DictNode, ListNode)):
+            for child in node.children:
+                cls._set_batch_size(child, batch_size)
+
+    @classmethod
+    def _build_static_fragment(
+            cls,
+            node: DictNode | ListNode,
+    ) -> Any:
+        """Build a static subtree once.
+
+        It is a method to implement in subclasses, as a prebuilt subtree
+        depends on the output format.
+
+        Parameters
+        ----------
+        node : DictNode | ListNode
+            A compiled static node
+
+        Returns
+        -------
+        Any
+            A prebuilt subtree
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _is_static(
+            node: PlanNode,
+            context_name: str,
+    ) -> bool:
+        """Verify if a compiled node is static.
+
+        Parameters
+        ----------
+        node : PlanNode
+            A compiled node
+        context_name : str
+            A context name of the compiled Mimeo Template
+
+        Returns
+        -------
+        bool
+            True if the node and all its descendants have raw values only, are not
+            special fields and are not cached in any reference. Otherwise, False.
+
+        Raises
+        ------
+        InstanceNotAliveError
+            If the MimeoContextManager instance is not alive
+        """
+        if isinstance(node, AtomicNode):
+            return (isinstance(node.value, LiteralValue) and
+                    not node.special and
+                    not MimeoContextManager().is_referenced(context_name, node.name))
+        if isinstance(node, (DictNode, ListNode)):
+            return all(Generator._is_static(child, context_name)
+                       for child in node.children)
+        return False
+
+    @classmethod
+    def _generate_from_plans(
+            cls,
+            plans: list[TemplatePlan],
+            parent: ElemTree.Element | dict | list | None = None,
+    ) -> Iterator[ElemTree.Element | dict]:
+        """Generate data based on already compiled Mimeo Templates.
+
+        Parameters
+        ----------
+        plans : list[TemplatePlan]
+            Compiled Mimeo Templates
         parent : ElemTree.Element | dict | list | None, default None
-            A parent node for processing nested templates
+            A parent node for the currently processed template.
 
         Returns
         -------
-        list[ElemTree.Element | dict]
-            A list of generated data units
+        Iterator[ElemTree.Element | dict]
+            Iterator for generated nodes
         """
-        logger.debug("Reading template [%s]", template)
-        return [cls._process_single_data_unit(template, parent)
-                for _ in iter(range(template.count))]
+        for plan in plans:
+            yield from cls._process_single_template(plan.template, plan, parent)
 
     @classmethod
-    @mimeo_next_iteration
-    def _process_single_data_unit(
+    def _process_single_template(
             cls,
             template: MimeoTemplate,
+            plan: TemplatePlan,
             parent: ElemTree.Element | dict | list | None = None,
-    ) -> ElemTree.Element | dict:
-        """Process a single data unit from the template.
+    ) -> Iterator[ElemTree.Element | dict]:
+        """Process a single Mimeo Template.
 
         This function is used recursively when a Mimeo Configuration
         contains nested templates.
-        It processes a single data unit. The reason why it is separated
-        from the _process_node() function is the @mimeo_next_iteration
-        decorator. The _process_node() function is recursively called
-        by itself, and it produces data for a single iteration.
-        The purpose of this function is to increment iteration before
-        processing node.
+        It repeats same processing operation so many times as it is
+        configured in the `count` property of a Mimeo Configuration.
+        Before the template execution it clears iterations of the template's
+        context, as nested templates would collect iterations from previous
+        parent's iterations. The context is switched around every data unit
+        and passed explicitly down the compiled nodes, so it is not looked up
+        for each of them.
+        Data units are yielded one by one, so they don't need to be kept
+        in memory altogether.
 
         Parameters
         ----------
         template : MimeoTemplate
             A single Mimeo Template to process
+        plan : TemplatePlan
+            The compiled Mimeo Template
         parent : ElemTree.Element | dict | list | None, default None
             A parent node for processing nested templates
 
         Returns
         -------
-        ElemTree.Element | dict
-            A single data unit generated within a single template
-            iteration.
+        Iterator[ElemTree.Element | dict]
+            Iterator for generated data units
         """
-        node_meta = cls._node_meta(
-            template.model.root_name,
-            template.model.root_data)
-        return cls._process_node(parent, node_meta)
+        mimeo_manager = MimeoContextManager()
+        context = mimeo_manager.get_context(template.model.context_name)
+        context.clear_iterations()
+        logger.debug("Reading template [%s]", template)
+        for _ in range(template.count):
+            prev_context = mimeo_manager.get_current_context()
+            mimeo_manager.set_current_context(context)
+            try:
+                context.next_iteration()
+                data_unit = cls._process_node(parent, plan.root, context)
+            finally:
+                mimeo_manager.set_current_context(prev_context)
+            yield data_unit
 
     @classmethod
     def _process_node(
             cls,
             parent: ElemTree.Element | dict | list | None,
-            node_meta: dict,
+            node: PlanNode,
+            context: MimeoContext,
     ) -> ElemTree.Element | dict:
-        """Process a single template's node.
+        """Process a single compiled node.
 
-        This is a recursive function that traverses Mimeo Template and generates nodes
-        based on node's metadata. First, element is pre-processed, in meaning
-        of metadata being adjusted. Then, element is processed accordingly to its value
-        type.
+        This is a recursive function that executes a compiled Mimeo Template and
+        generates nodes accordingly to their types.
 
         Parameters
         ----------
         parent : ElemTree.Element | dict | list | None
             A parent node
-        node_meta : dict
-            Node's metadata
+        node : PlanNode
+            A compiled node
+        context : MimeoContext
+            The current Mimeo Context
 
         Returns
         -------
         ElemTree.Element | dict
             A single data unit generated within a single template iteration.
         """
-        logger.fine("Rendering element - parent [%s], node_meta [%s]",
+        logger.fine("Rendering element - parent [%s], node [%s]",
                     parent if not isinstance(parent, ElemTree.Element) else parent.tag,
-                    node_meta)
-        node_meta = cls._pre_process_node(node_meta)
-
-        if cls._is_complex(node_meta):
-            return cls._process_complex_value(parent, node_meta)
-        return cls._process_atomic_value(parent, node_meta)
+                    node.name)
+        if isinstance(node, AtomicNode):
+            return cls._process_atomic_value(parent, node, context)
+        return cls._process_complex_value(parent, node, context)
 
     @staticmethod
     def _is_complex(
@@ -344,10 +718,9 @@ class Generator(metaclass=ABCMeta):
         }
 
     @staticmethod
-    @mimeo_context
     def _render_atomic_value(
-            node_meta: dict,
-            context: MimeoContext | None = None,
+            node: AtomicNode,
+            context: MimeoContext,
     ) -> Any:
         """Render an atomic value for a node.
 
@@ -356,18 +729,18 @@ class Generator(metaclass=ABCMeta):
 
         Parameters
         ----------
-        node_meta : dict
-            Node's metadata
-        context
-            The current Mimeo Context (injected by MimeoContextManager)
+        node : AtomicNode
+            A compiled node
+        context : MimeoContext
+            The current Mimeo Context
 
         Returns
         -------
         value : Any
             A rendered value
         """
-        value = MimeoRenderer.render(node_meta["value"])
-        MimeoContextManager().cache_ref(node_meta["name"], value)
-        if node_meta["special"]:
-            context.curr_iteration().add_special_field(node_meta["name"], value)
+        value = node.value.render(context)
+        MimeoContextManager().cache_ref(node.name, value)
+        if node.special:
+            context.curr_iteration().add_special_field(node.name, value)
         return value
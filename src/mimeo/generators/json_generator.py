@@ -6,13 +6,18 @@ It exports only one class:
 """
 from __future__ import annotations
 
+import copy
 import json
 import logging
 from typing import Iterator
 
 from mimeo.config import constants as cc
-from mimeo.config.mimeo_config import MimeoConfig, MimeoTemplate
+from mimeo.config.mimeo_config import MimeoConfig, MimeoModel, MimeoTemplate
+from mimeo.context import MimeoContext
 from mimeo.generators import Generator
+from mimeo.generators.json_writer import JSONTextWriter
+from mimeo.generators.plan import (AtomicNode, DictNode, ListNode, PlanNode,
+                                   StaticNode, TemplatesNode)
 from mimeo.utils import MimeoRenderer
 
 logger = logging.getLogger(__name__)
@@ -35,6 +40,10 @@ class JSONGenerator(Generator):
         data: json
     ) -> str
         Stringify data generated by the generate() method.
+    generate_stringified(
+        templates: list | Iterator[MimeoTemplate]
+    ) -> Iterator[str]
+        Generate JSON text based on the Mimeo Configuration.
     """
 
     def __init__(
@@ -78,8 +87,8 @@ class JSONGenerator(Generator):
             Iterator for generated nodes
         """
         for template in templates:
-            for data_unit in cls._process_single_template(template, parent):
-                yield data_unit
+            plan = cls.compile_template(template)
+            yield from cls._process_single_template(template, plan, parent)
 
     def stringify(
             self,
@@ -102,27 +111,62 @@ class JSONGenerator(Generator):
 
         return json.dumps(data_unit)
 
+    def generate_stringified(
+            self,
+            templates: list | Iterator[MimeoTemplate],
+    ) -> Iterator[str]:
+        """Generate JSON text based on the Mimeo Configuration.
+
+        Overrides Generator's implementation by writing JSON text directly while
+        executing compiled Mimeo Templates, without building intermediate dicts
+        and lists. The text is the same as stringify() would produce for a data
+        unit generated by the generate() method.
+
+        Parameters
+        ----------
+        templates : list | Iterator[MimeoTemplate]
+            A collection of Mimeo Templates to process
+
+        Returns
+        -------
+        Iterator[str]
+            Iterator for stringified data units
+        """
+        writer = JSONTextWriter(self._indent)
+        for template in templates:
+            plan = self.compile_template(template)
+            if self._has_duplicate_names(plan.root):
+                for data_unit in self._process_single_template(template, plan):
+                    yield self.stringify(data_unit)
+                continue
+            for _ in self._process_single_template(template, plan, writer):
+                yield writer.getvalue()
+
     @classmethod
     def _process_node(
             cls,
-            parent: dict | list | None,
-            node_meta: dict,
-    ) -> dict | list:
-        """Process a single template's node.
+            parent: dict | list | JSONTextWriter | None,
+            node: PlanNode,
+            context: MimeoContext,
+    ) -> dict | list | JSONTextWriter:
+        """Process a single compiled node.
 
         Extends Generator's implementation by setting a parent node when it is None.
         It is required for JSON format to initialize an object.
+        When the parent node is a JSONTextWriter, a data unit is written as text.
 
         Parameters
         ----------
-        parent : dict | list | None
+        parent : dict | list | JSONTextWriter | None
             A parent node
-        node_meta : dict
-            Node's metadata
+        node : PlanNode
+            A compiled node
+        context : MimeoContext
+            The current Mimeo Context
 
         Returns
         -------
-        dict | list
+        dict | list | JSONTextWriter
             A single data unit generated within a single template iteration.
 
         Raises
@@ -132,8 +176,68 @@ class JSONGenerator(Generator):
         SpecialFieldNotFoundError
             If a special field does not exist.
         """
+        if isinstance(parent, JSONTextWriter):
+            parent.write_item()
+            parent.begin("{")
+            cls._write_node(parent, node, context)
+            parent.end("}")
+            return parent
+
         parent = parent if parent is not None else {}
-        return super()._process_node(parent, node_meta)
+        return super()._process_node(parent, node, context)
+
+    @classmethod
+    def _write_node(
+            cls,
+            writer: JSONTextWriter,
+            node: PlanNode,
+            context: MimeoContext,
+    ):
+        """Write a single compiled node as JSON text.
+
+        This is a recursive function rendering nodes in the same order as
+        the _process_node() function does.
+
+        Parameters
+        ----------
+        writer : JSONTextWriter
+            A JSON text writer
+        node : PlanNode
+            A compiled node
+        context : MimeoContext
+            The current Mimeo Context
+
+        Raises
+        ------
+        InvalidSpecialFieldValueError
+            If a special field value is dict or list
+        SpecialFieldNotFoundError
+            If a special field does not exist.
+        """
+        if isinstance(node, TemplatesNode):
+            # data units of nested templates are direct items of a parent list
+            if node.name is not None:
+                writer.write_item(node.name)
+                writer.begin("[")
+            for _ in cls._generate_from_plans(node.plans, writer):
+                pass
+            if node.name is not None:
+                writer.end("]")
+            return
+
+        writer.write_item(node.name)
+        if isinstance(node, AtomicNode):
+            value = cls._render_atomic_value(node, context)
+            writer.write_value(value)
+            logger.fine("Rendered value [%s]", value)
+        elif isinstance(node, StaticNode):
+            writer.write_static(node.fragment, node.texts)
+        else:
+            opening, closing = ("{", "}") if isinstance(node, DictNode) else ("[", "]")
+            writer.begin(opening)
+            for child in node.children:
+                cls._write_node(writer, child, context)
+            writer.end(closing)
 
     @classmethod
     def _pre_process_node(
@@ -174,24 +278,105 @@ class JSONGenerator(Generator):
             is_mimeo_util=is_mimeo_util,
             is_special_field=is_special_field)
 
+    @classmethod
+    def _compile_complex_value(
+            cls,
+            node_meta: dict,
+            model: MimeoModel | None = None,
+    ) -> DictNode | ListNode | TemplatesNode:
+        """Compile a node with a complex value.
+
+        The node is compiled accordingly to its value type.
+        When the type is dict, and it includes the _templates_ property, nested
+        templates are compiled into plans.
+
+        Parameters
+        ----------
+        node_meta : dict
+            Pre-processed node's metadata
+        model : MimeoModel | None, default None
+            A Mimeo Model the node belongs to
+
+        Returns
+        -------
+        DictNode | ListNode | TemplatesNode
+            A compiled node
+        """
+        name = node_meta["name"]
+        value = node_meta["value"]
+        if isinstance(value, dict) and cc.TEMPLATES_KEY not in value:
+            return DictNode(
+                name,
+                [cls._compile_node(cls._node_meta(child_tag, child_value), model)
+                 for child_tag, child_value in value.items()])
+        if isinstance(value, list):
+            return ListNode(
+                name,
+                [cls._compile_node(cls._node_meta(None, child), model)
+                 for child in value])
+        return TemplatesNode(
+            name,
+            cls._compile_nested_templates(value[cc.TEMPLATES_KEY], model))
+
+    @classmethod
+    def _build_static_fragment(
+            cls,
+            node: DictNode | ListNode | AtomicNode,
+    ) -> dict | list | str | int | float | bool | None:
+        """Build a static subtree once.
+
+        The prebuilt subtree is copied into every data unit generated as dicts,
+        and serialized once for data units written as JSON text.
+
+        Parameters
+        ----------
+        node : DictNode | ListNode | AtomicNode
+            A compiled static node
+
+        Returns
+        -------
+        dict | list | str | int | float | bool | None
+            A prebuilt subtree
+
+        Examples
+        --------
+        node = cls._compile_node(cls._node_meta(
+            name="SomeField",
+            value={"SomeChild1": 1, "SomeChild2": [True, False]},
+        ))
+        cls._build_static_fragment(node)
+        ->
+        {
+          "SomeChild1": 1,
+          "SomeChild2": [True, False],
+        }
+        """
+        if isinstance(node, DictNode):
+            return {child.name: cls._build_static_fragment(child)
+                    for child in node.children}
+        if isinstance(node, ListNode):
+            return [cls._build_static_fragment(child) for child in node.children]
+        return node.value.render()
+
     @classmethod
     def _process_complex_value(
             cls,
             parent: dict | list,
-            node_meta: dict,
+            node: PlanNode,
+            context: MimeoContext,
     ) -> dict | list:
-        """Process a node with a complex value.
+        """Process a compiled node with a complex value.
 
-        The node is processed accordingly to its value type.
-        When the type is dict, and it includes the _templates_ property, node
-        is processed in a special way.
+        The node is processed accordingly to its type.
 
         Parameters
         ----------
         parent : dict | list
             A parent node
-        node_meta : dict
-            Node's metadata
+        node : PlanNode
+            A compiled node
+        context : MimeoContext
+            The current Mimeo Context
 
         Returns
         -------
@@ -205,22 +390,22 @@ class JSONGenerator(Generator):
         SpecialFieldNotFoundError
             If a special field does not exist.
         """
-        if (isinstance(node_meta["value"], dict) and
-                cc.TEMPLATES_KEY not in node_meta["value"]):
-            func = cls._process_dict_value
-        elif isinstance(node_meta["value"], list):
-            func = cls._process_list_value
-        else:
-            func = cls._process_templates_value
-        return func(parent, node_meta)
+        if isinstance(node, DictNode):
+            return cls._process_dict_value(parent, node, context)
+        if isinstance(node, ListNode):
+            return cls._process_list_value(parent, node, context)
+        if isinstance(node, StaticNode):
+            return cls._process_static_value(parent, node)
+        return cls._process_templates_value(parent, node)
 
     @classmethod
     def _process_dict_value(
             cls,
             parent: dict | list,
-            node_meta: dict,
+            node: DictNode,
+            context: MimeoContext,
     ) -> dict | list:
-        """Process a node with a dictionary value.
+        """Process a compiled node with a dictionary value.
 
         It iterates through the dictionary items and processes each of them.
 
@@ -228,8 +413,10 @@ class JSONGenerator(Generator):
         ----------
         parent : dict | list
             A parent node
-        node_meta : dict
-            Node's metadata
+        node : DictNode
+            A compiled node
+        context : MimeoContext
+            The current Mimeo Context
 
         Returns
         -------
@@ -246,11 +433,11 @@ class JSONGenerator(Generator):
         Examples
         --------
         parent = {}
-        node_meta = cls._node_meta(
+        node = cls._compile_node(cls._node_meta(
             name="SomeField",
             value={"SomeChild1": 1, "SomeChild2": 2},
-        )
-        cls._process_dict_value(parent, node_meta)
+        ))
+        cls._process_dict_value(parent, node, context)
         ->
         {
           "SomeField": {
@@ -260,11 +447,11 @@ class JSONGenerator(Generator):
         }
 
         parent = []
-        node_meta = cls._node_meta(
+        node = cls._compile_node(cls._node_meta(
             name=None,
             value={"SomeChild1": 1, "SomeChild2": 2},
-        )
-        cls._process_dict_value(parent, node_meta)
+        ))
+        cls._process_dict_value(parent, node, context)
         ->
         [
           {
@@ -273,18 +460,19 @@ class JSONGenerator(Generator):
           },
         ]
         """
-        element = cls._create_node(parent, node_meta)
-        for child_tag, child_value in node_meta["value"].items():
-            cls._process_node(element, cls._node_meta(child_tag, child_value))
+        element = cls._create_node(parent, node)
+        for child in node.children:
+            cls._process_node(element, child, context)
         return parent
 
     @classmethod
     def _process_list_value(
             cls,
             parent: dict | list,
-            node_meta: dict,
+            node: ListNode,
+            context: MimeoContext,
     ) -> dict | list:
-        """Process a node with a list value.
+        """Process a compiled node with a list value.
 
         It iterates through the list items and processes each of them: generates
         a child element for each value as direct children of the parent.
@@ -293,8 +481,10 @@ class JSONGenerator(Generator):
         ----------
         parent : dict | list
             A parent node
-        node_meta : dict
-            Node's metadata
+        node : ListNode
+            A compiled node
+        context : MimeoContext
+            The current Mimeo Context
 
         Returns
         -------
@@ -311,15 +501,15 @@ class JSONGenerator(Generator):
         Examples
         --------
         parent = {}
-        node_meta = cls._node_meta(
+        node = cls._compile_node(cls._node_meta(
             name="SomeField",
             value=[
                 'value-1',
                 {'SomeChild1': True, 'SomeChild2': False},
                 {'_mimeo_util': {'_name': 'auto_increment', 'pattern': '{}'}}
             ],
-        )
-        cls._process_list_value_with_atomic_children(parent, node_meta)
+        ))
+        cls._process_list_value(parent, node, context)
         ->
         {
           "SomeField": [
@@ -333,15 +523,15 @@ class JSONGenerator(Generator):
         }
 
         parent = []
-        node_meta = cls._node_meta(
+        node = cls._compile_node(cls._node_meta(
             name=None,
             value=[
                 'value-1',
                 {'SomeChild1': True, 'SomeChild2': False},
                 {'_mimeo_util': {'_name': 'auto_increment', 'pattern': '{}'}}
             ],
-        )
-        cls._process_list_value_with_atomic_children(parent, node_meta)
+        ))
+        cls._process_list_value(parent, node, context)
         ->
         [
           [
@@ -354,19 +544,48 @@ class JSONGenerator(Generator):
           ],
         ]
         """
-        element = cls._create_node(parent, node_meta)
-        for child in node_meta["value"]:
-            node_meta = cls._node_meta(None, child)
-            cls._process_node(element, node_meta)
+        element = cls._create_node(parent, node)
+        for child in node.children:
+            cls._process_node(element, child, context)
+        return parent
+
+    @classmethod
+    def _process_static_value(
+            cls,
+            parent: dict | list,
+            node: StaticNode,
+    ) -> dict | list:
+        """Process a compiled node with a prebuilt static subtree.
+
+        It attaches a copy of the prebuilt subtree to the parent without
+        processing it node by node, so data units do not share mutable values.
+
+        Parameters
+        ----------
+        parent : dict | list
+            A parent node
+        node : StaticNode
+            A compiled node
+
+        Returns
+        -------
+        dict | list
+            A processed node
+        """
+        fragment = copy.deepcopy(node.fragment)
+        if isinstance(parent, dict):
+            parent[node.name] = fragment
+        else:
+            parent.append(fragment)
         return parent
 
     @classmethod
     def _process_templates_value(
             cls,
             parent: dict | list,
-            node_meta: dict,
+            node: TemplatesNode,
     ) -> dict | list:
-        """Process a node with a dictionary value storing templates.
+        """Process a compiled node with nested templates.
 
         It iterates through the templates and generates data based on them.
         If parent is a dict, the property name will take a value of an array.
@@ -376,8 +595,8 @@ class JSONGenerator(Generator):
         ----------
         parent : dict | None
             A parent node
-        node_meta : dict
-            Node's metadata
+        node : TemplatesNode
+            A compiled node
 
         Returns
         -------
@@ -394,7 +613,7 @@ class JSONGenerator(Generator):
         Examples
         --------
         parent = []
-        node_meta = cls._node_meta(
+        node = cls._compile_node(cls._node_meta(
             name=None,
             value={"_templates_": [
                 {
@@ -408,8 +627,8 @@ class JSONGenerator(Generator):
                   }
                 }
             ]},
-        )
-        cls._process_templates_value(parent, node_meta)
+        ))
+        cls._process_templates_value(parent, node)
         ->
         [
           {
@@ -430,7 +649,7 @@ class JSONGenerator(Generator):
         ]
 
         parent = {}
-        node_meta = cls._node_meta(
+        node = cls._compile_node(cls._node_meta(
             name="SomeField",
             value={"_templates_": [
                 {
@@ -444,8 +663,8 @@ class JSONGenerator(Generator):
                   }
                 }
             ]},
-        )
-        cls._process_templates_value(parent, node_meta)
+        ))
+        cls._process_templates_value(parent, node)
         ->
         {
           "SomeField": [
@@ -467,23 +686,22 @@ class JSONGenerator(Generator):
           ],
         }
         """
-        templates = (MimeoTemplate(template)
-                     for template in node_meta["value"][cc.TEMPLATES_KEY])
         target = parent
         if isinstance(parent, dict):
-            parent[node_meta["name"]] = []
-            target = parent[node_meta["name"]]
+            parent[node.name] = []
+            target = parent[node.name]
 
-        target.extend(cls.generate(templates))
+        target.extend(cls._generate_from_plans(node.plans))
         return parent
 
     @classmethod
     def _process_atomic_value(
             cls,
             parent: dict | list,
-            node_meta: dict,
+            node: AtomicNode,
+            context: MimeoContext,
     ) -> dict | list:
-        """Process a node with an atomic value.
+        """Process a compiled node with an atomic value.
 
         A parametrized Mimeo Util is considered as an atomic value as representing one.
         It renders a value for the node.
@@ -492,8 +710,10 @@ class JSONGenerator(Generator):
         ----------
         parent : dict | list
             A parent node
-        node_meta : dict
-            Node's metadata
+        node : AtomicNode
+            A compiled node
+        context : MimeoContext
+            The current Mimeo Context
 
         Returns
         -------
@@ -510,39 +730,72 @@ class JSONGenerator(Generator):
         Examples
         --------
         parent = {}
-        node_meta = cls._node_meta(
+        node = cls._compile_node(cls._node_meta(
             name="SomeField",
             value="value-1",
-        )
-        cls._process_atomic_value(parent, node_meta)
+        ))
+        cls._process_atomic_value(parent, node, context)
         ->
         {
           "SomeField": "value-1"
         }
 
         parent = []
-        node_meta = cls._node_meta(
+        node = cls._compile_node(cls._node_meta(
             name=None,
             value="value-1",
-        )
-        cls._process_atomic_value(parent, node_meta)
+        ))
+        cls._process_atomic_value(parent, node, context)
         ->
         [
           "value-1"
         ]
         """
-        value = super()._render_atomic_value(node_meta)
+        value = super()._render_atomic_value(node, context)
         if isinstance(parent, dict):
-            parent[node_meta["name"]] = value
+            parent[node.name] = value
         elif isinstance(parent, list):
             parent.append(value)
         logger.fine("Rendered value [%s]", value)
         return parent
 
+    @staticmethod
+    def _has_duplicate_names(
+            node: PlanNode,
+    ) -> bool:
+        """Verify if a compiled node has children of the same name.
+
+        It may happen when a special field has the same name as its sibling.
+        Such nodes overwrite each other in a dict, so they can't be written
+        as JSON text directly.
+
+        Parameters
+        ----------
+        node : PlanNode
+            A compiled node
+
+        Returns
+        -------
+        bool
+            True if the node or any of its descendants has children of the same
+            name. Otherwise, False.
+        """
+        if isinstance(node, TemplatesNode):
+            return any(JSONGenerator._has_duplicate_names(plan.root)
+                       for plan in node.plans)
+        if not isinstance(node, (DictNode, ListNode)):
+            return False
+        if isinstance(node, DictNode):
+            names = [child.name for child in node.children]
+            if len(names) != len(set(names)):
+                return True
+        return any(JSONGenerator._has_duplicate_names(child)
+                   for child in node.children)
+
     @staticmethod
     def _create_node(
             parent: dict | list,
-            node_meta: dict,
+            node: PlanNode,
     ) -> dict | list:
         """Create an JSON element based on the `parent` and entry value types.
 
@@ -550,8 +803,8 @@ class JSONGenerator(Generator):
         ----------
         parent : dict | list
             A parent node
-        node_meta : dict
-            Node's metadata
+        node : PlanNode
+            A compiled node
 
         Returns
         -------
@@ -561,49 +814,49 @@ class JSONGenerator(Generator):
         Examples
         --------
         parent = {}
-        node_meta = cls._node_meta(
+        node = cls._compile_node(cls._node_meta(
             name="SomeEntity",
             value={"SomeField": "value-1"},
-        )
-        node = cls._create_node(parent, node_meta)
+        ))
+        new_node = cls._create_node(parent, node)
         ->
         parent: {"SomeEntity": {}}
-        node: {}
+        new_node: {}
 
         parent = []
-        node_meta = cls._node_meta(
+        node = cls._compile_node(cls._node_meta(
             name=None,
             value={"SomeField": "value-1"},
-        )
-        node = cls._create_node(parent, node_meta)
+        ))
+        new_node = cls._create_node(parent, node)
         ->
         parent: [{}]
-        node: {}
+        new_node: {}
 
         parent = []
-        node_meta = cls._node_meta(
+        node = cls._compile_node(cls._node_meta(
             name=None,
             value=["value-1"],
-        )
-        node = cls._create_node(parent, node_meta)
+        ))
+        new_node = cls._create_node(parent, node)
         ->
         parent: [[]]
-        node: []
+        new_node: []
 
         parent = {}
-        node_meta = cls._node_meta(
+        node = cls._compile_node(cls._node_meta(
             name="SomeEntity",
             value=["value-1"],
-        )
-        node = cls._create_node(parent, node_meta)
+        ))
+        new_node = cls._create_node(parent, node)
         ->
         parent: {"SomeEntity": []}
-        node: []
+        new_node: []
         """
-        new_node = {} if isinstance(node_meta["value"], dict) else []
+        new_node = {} if isinstance(node, DictNode) else []
         if isinstance(parent, list):
             parent.append(new_node)
             return parent[-1]
 
-        parent[node_meta["name"]] = new_node
-        return parent[node_meta["name"]]
+        parent[node.name] = new_node
+        return parent[node.name]
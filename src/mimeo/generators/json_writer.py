@@ -0,0 +1,212 @@
+"""The Mimeo JSON Writer module.
+
+It exports only one class:
+    * JSONTextWriter
+        A class writing JSON text directly, without intermediate objects.
+"""
+from __future__ import annotations
+
+import json
+from json.encoder import encode_basestring_ascii
+from typing import Any
+
+
+class JSONTextWriter:
+    """A class writing JSON text directly, without intermediate objects.
+
+    It is used by JSONGenerator to emit a data unit as text while executing
+    a compiled Mimeo Template. Rendered values are escaped and written into
+    a buffer, in the same layout as json.dumps() would produce for the
+    corresponding dict.
+
+    Methods
+    -------
+    begin(bracket: str)
+        Open a JSON object or array.
+    end(bracket: str)
+        Close the recently opened JSON object or array.
+    write_item(key: str | None = None)
+        Start a new item of the currently opened JSON object or array.
+    write_value(value: Any)
+        Write an atomic value.
+    write_static(fragment: Any, texts: dict[int, str])
+        Write a prebuilt static subtree.
+    getvalue() -> str
+        Return text written so far and clear the buffer.
+    """
+
+    def __init__(
+            self,
+            indent: int | None = None,
+    ):
+        """Initialize JSONTextWriter class.
+
+        Parameters
+        ----------
+        indent : int | None, default None
+            An indent applied in JSON text (ignored when 0)
+        """
+        self._indent: int | None = indent if indent else None
+        self._item_separator: str = "," if self._indent is not None else ", "
+        self._parts: list[str] = []
+        self._levels: list[bool] = []
+        self._new_lines: list[str] = []
+
+    def begin(
+            self,
+            bracket: str,
+    ):
+        """Open a JSON object or array.
+
+        Parameters
+        ----------
+        bracket : str
+            An opening bracket
+        """
+        self._parts.append(bracket)
+        self._levels.append(False)
+
+    def end(
+            self,
+            bracket: str,
+    ):
+        """Close the recently opened JSON object or array.
+
+        Parameters
+        ----------
+        bracket : str
+            A closing bracket
+        """
+        has_items = self._levels.pop()
+        if has_items and self._indent is not None:
+            self._parts.append(self._new_line(len(self._levels)))
+        self._parts.append(bracket)
+
+    def write_item(
+            self,
+            key: str | None = None,
+    ):
+        """Start a new item of the currently opened JSON object or array.
+
+        It writes an item separator (if needed), an indentation and a key.
+
+        Parameters
+        ----------
+        key : str | None, default None
+            A key of the item (None for array items)
+        """
+        if self._levels:
+            if self._levels[-1]:
+                self._parts.append(self._item_separator)
+            else:
+                self._levels[-1] = True
+            if self._indent is not None:
+                self._parts.append(self._new_line(len(self._levels)))
+        if key is not None:
+            self._parts.append(encode_basestring_ascii(key))
+            self._parts.append(": ")
+
+    def write_value(
+            self,
+            value: Any,
+    ):
+        """Write an atomic value.
+
+        Strings, integers, booleans and nulls are written directly. Other values
+        are serialized with json.dumps().
+
+        Parameters
+        ----------
+        value : Any
+            A value to write
+        """
+        if isinstance(value, str):
+            self._parts.append(encode_basestring_ascii(value))
+        elif value is None:
+            self._parts.append("null")
+        elif value is True:
+            self._parts.append("true")
+        elif value is False:
+            self._parts.append("false")
+        elif type(value) is int:
+            self._parts.append(int.__repr__(value))
+        else:
+            self._parts.append(self._dumps(value))
+
+    def write_static(
+            self,
+            fragment: Any,
+            texts: dict[int, str],
+    ):
+        """Write a prebuilt static subtree.
+
+        The subtree's text is serialized once for each indentation level
+        and cached in the dict provided, owned by the subtree's plan node.
+
+        Parameters
+        ----------
+        fragment : Any
+            A prebuilt static subtree
+        texts : dict[int, str]
+            The subtree's texts serialized so far, by indentation level
+        """
+        level = len(self._levels)
+        text = texts.get(level)
+        if text is None:
+            text = texts[level] = self._dumps(fragment)
+        self._parts.append(text)
+
+    def getvalue(
+            self,
+    ) -> str:
+        """Return text written so far and clear the buffer.
+
+        Returns
+        -------
+        str
+            JSON text
+        """
+        text = "".join(self._parts)
+        self._parts.clear()
+        return text
+
+    def _dumps(
+            self,
+            value: Any,
+    ) -> str:
+        """Serialize a value at the current indentation level.
+
+        Parameters
+        ----------
+        value : Any
+            A value to serialize
+
+        Returns
+        -------
+        str
+            JSON text
+        """
+        text = json.dumps(value, indent=self._indent)
+        if self._indent is not None and self._levels:
+            text = text.replace("\n", self._new_line(len(self._levels)))
+        return text
+
+    def _new_line(
+            self,
+            level: int,
+    ) -> str:
+        """Get a new line with an indentation of a specific level.
+
+        Parameters
+        ----------
+        level : int
+            An indentation level
+
+        Returns
+        -------
+        str
+            A new line character followed by an indentation
+        """
+        while len(self._new_lines) <= level:
+            self._new_lines.append("\n" + " " * self._indent * len(self._new_lines))
+        return self._new_lines[level]
@@ -0,0 +1,633 @@
+"""The Mimeo Template Plan module.
+
+It contains classes representing a Mimeo Template compiled once into
+a typed tree, being then executed by Generators in every iteration:
+    * TemplatePlan
+        A class representing a compiled Mimeo Template.
+    * PlanNode
+        A superclass for all nodes of a compiled Mimeo Template.
+    * AtomicNode
+        A PlanNode implementation representing a node with an atomic value.
+    * DictNode
+        A PlanNode implementation representing a node with a dict value.
+    * ListNode
+        A PlanNode implementation representing a node with a list value.
+    * TemplatesNode
+        A PlanNode implementation representing nested Mimeo Templates.
+    * StaticNode
+        A PlanNode implementation representing a prebuilt static subtree.
+    * PlanValue
+        A superclass for all atomic values of a compiled Mimeo Template.
+    * LiteralValue
+        A PlanValue implementation representing a raw value.
+    * UtilValue
+        A superclass for PlanValues rendering a bound Mimeo Util.
+    * RawUtilValue
+        A UtilValue implementation representing a raw Mimeo Util.
+    * ParametrizedUtilValue
+        A UtilValue implementation representing a parametrized Mimeo Util.
+    * VarValue
+        A PlanValue implementation representing a value with a Mimeo Var.
+    * SpecialFieldValue
+        A PlanValue implementation representing a value with a Special Field.
+    * RefValue
+        A PlanValue implementation representing a Mimeo Ref.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from mimeo.config import constants as cc
+from mimeo.config.mimeo_config import MimeoTemplate
+from mimeo.context import MimeoContext
+from mimeo.utils import MimeoRenderer, MimeoUtil
+from mimeo.utils.renderers import UtilsRenderer
+
+logger = logging.getLogger(__name__)
+
+
+class TemplatePlan:
+    """A class representing a compiled Mimeo Template.
+
+    Attributes
+    ----------
+    template : MimeoTemplate
+        A source Mimeo Template
+    root : PlanNode
+        A compiled root node of the Mimeo Template's model
+    """
+
+    def __init__(
+            self,
+            template: MimeoTemplate,
+            root: PlanNode,
+    ):
+        """Initialize TemplatePlan class.
+
+        Parameters
+        ----------
+        template : MimeoTemplate
+            A source Mimeo Template
+        root : PlanNode
+            A compiled root node of the Mimeo Template's model
+        """
+        self.template: MimeoTemplate = template
+        self.root: PlanNode = root
+
+
+class PlanNode:
+    """A superclass for all nodes of a compiled Mimeo Template.
+
+    Attributes
+    ----------
+    name : str | None
+        A node's name (tag / property)
+    attrs : dict | None
+        A node's attributes (XML only)
+    """
+
+    def __init__(
+            self,
+            name: str | None,
+            attrs: dict | None = None,
+    ):
+        """Initialize PlanNode class.
+
+        Parameters
+        ----------
+        name : str | None
+            A node's name (tag / property)
+        attrs : dict | None, default None
+            A node's attributes (XML only)
+        """
+        self.name: str | None = name
+        self.attrs: dict | None = attrs
+
+
+class AtomicNode(PlanNode):
+    """A PlanNode implementation representing a node with an atomic value.
+
+    A parametrized Mimeo Util is considered as an atomic value as representing one.
+
+    Attributes
+    ----------
+    value : PlanValue
+        A compiled node's value
+    special : bool
+        A is-special-field flag
+    """
+
+    def __init__(
+            self,
+            name: str | None,
+            value: PlanValue,
+            special: bool,
+            attrs: dict | None = None,
+    ):
+        """Initialize AtomicNode class.
+
+        Extends PlanNode constructor.
+
+        Parameters
+        ----------
+        name : str | None
+            A node's name (tag / property)
+        value : PlanValue
+            A compiled node's value
+        special : bool
+            A is-special-field flag
+        attrs : dict | None, default None
+            A node's attributes (XML only)
+        """
+        super().__init__(name, attrs)
+        self.value: PlanValue = value
+        self.special: bool = special
+
+
+class DictNode(PlanNode):
+    """A PlanNode implementation representing a node with a dict value.
+
+    Attributes
+    ----------
+    children : list[PlanNode]
+        Compiled child nodes
+    """
+
+    def __init__(
+            self,
+            name: str | None,
+            children: list[PlanNode],
+            attrs: dict | None = None,
+    ):
+        """Initialize DictNode class.
+
+        Extends PlanNode constructor.
+
+        Parameters
+        ----------
+        name : str | None
+            A node's name (tag / property)
+        children : list[PlanNode]
+            Compiled child nodes
+        attrs : dict | None, default None
+            A node's attributes (XML only)
+        """
+        super().__init__(name, attrs)
+        self.children: list[PlanNode] = children
+
+
+class ListNode(PlanNode):
+    """A PlanNode implementation representing a node with a list value.
+
+    Attributes
+    ----------
+    children : list[PlanNode]
+        Compiled list items
+    """
+
+    def __init__(
+            self,
+            name: str | None,
+            children: list[PlanNode],
+            attrs: dict | None = None,
+    ):
+        """Initialize ListNode class.
+
+        Extends PlanNode constructor.
+
+        Parameters
+        ----------
+        name : str | None
+            A node's name (tag / property)
+        children : list[PlanNode]
+            Compiled list items
+        attrs : dict | None, default None
+            A node's attributes (XML only)
+        """
+        super().__init__(name, attrs)
+        self.children: list[PlanNode] = children
+
+
+class TemplatesNode(PlanNode):
+    """A PlanNode implementation representing nested Mimeo Templates.
+
+    Attributes
+    ----------
+    plans : list[TemplatePlan]
+        Compiled nested Mimeo Templates
+    """
+
+    def __init__(
+            self,
+            name: str | None,
+            plans: list[TemplatePlan],
+    ):
+        """Initialize TemplatesNode class.
+
+        Extends PlanNode constructor.
+
+        Parameters
+        ----------
+        name : str | None
+            A node's name (tag / property)
+        plans : list[TemplatePlan]
+            Compiled nested Mimeo Templates
+        """
+        super().__init__(name)
+        self.plans: list[TemplatePlan] = plans
+
+
+class StaticNode(PlanNode):
+    """A PlanNode implementation representing a prebuilt static subtree.
+
+    A static subtree includes only raw values (no Mimeo Utils, Mimeo Vars,
+    Mimeo Refs or Special Fields) and none of its fields is cached in references.
+    It is built once, while compiling a Mimeo Template, and reused in every
+    iteration.
+
+    Attributes
+    ----------
+    fragment : Any
+        A prebuilt subtree in a generator-specific form
+    texts : dict[int, str]
+        The fragment serialized as text, by indentation level
+    """
+
+    def __init__(
+            self,
+            name: str | None,
+            fragment: Any,
+            attrs: dict | None = None,
+    ):
+        """Initialize StaticNode class.
+
+        Extends PlanNode constructor.
+
+        Parameters
+        ----------
+        name : str | None
+            A node's name (tag / property)
+        fragment : Any
+            A prebuilt subtree in a generator-specific form
+        attrs : dict | None, default None
+            A node's attributes (XML only)
+        """
+        super().__init__(name, attrs)
+        self.fragment: Any = fragment
+        self.texts: dict[int, str] = {}
+
+
+class PlanValue:
+    """A superclass for all atomic values of a compiled Mimeo Template.
+
+    Every subclass knows upfront how its value should be rendered, so
+    the value is not classified again in every iteration.
+
+    Attributes
+    ----------
+    value : Any
+        A source value
+
+    Methods
+    -------
+    compile(value: Any) -> PlanValue
+        Compile an atomic value into a typed PlanValue.
+    render(context: MimeoContext | None = None) -> Any
+        Render the value.
+    """
+
+    def __init__(
+            self,
+            value: Any,
+    ):
+        """Initialize PlanValue class.
+
+        Parameters
+        ----------
+        value : Any
+            A source value
+        """
+        self.value: Any = value
+
+    @staticmethod
+    def compile(
+            value: Any,
+            has_special_fields: bool = True,
+    ) -> PlanValue:
+        """Compile an atomic value into a typed PlanValue.
+
+        The classification follows the MimeoRenderer precedence:
+        special fields, vars, raw Mimeo Utils and Mimeo Refs.
+
+        Parameters
+        ----------
+        value : Any
+            An atomic value or a parametrized Mimeo Util
+        has_special_fields : bool, default True
+            Indicate if the value can reference special fields
+
+        Returns
+        -------
+        PlanValue
+            A typed PlanValue
+
+        Raises
+        ------
+        InstanceNotAliveError
+            If the MimeoContextManager instance is not alive
+        """
+        if MimeoRenderer.is_parametrized_mimeo_util(value):
+            return ParametrizedUtilValue(value)
+        if isinstance(value, str):
+            return PlanValue._compile_string_value(value, has_special_fields)
+        return LiteralValue(value)
+
+    @staticmethod
+    def _compile_string_value(
+            value: str,
+            has_special_fields: bool,
+    ) -> PlanValue:
+        """Compile a string value into a typed PlanValue.
+
+        Mimeo Vars bound to literals are substituted upfront, so only vars
+        bound to Mimeo Utils are rendered in every iteration.
+
+        Parameters
+        ----------
+        value : str
+            A string value
+        has_special_fields : bool
+            Indicate if the value can reference special fields
+
+        Returns
+        -------
+        PlanValue
+            A typed PlanValue
+
+        Raises
+        ------
+        InstanceNotAliveError
+            If the MimeoContextManager instance is not alive
+        """
+        if MimeoRenderer.has_var(value):
+            value = MimeoRenderer.propagate_vars(value)
+            if not isinstance(value, str):
+                return LiteralValue(value)
+
+        value_cls = LiteralValue
+        if has_special_fields and MimeoRenderer.has_special_field(value):
+            value_cls = SpecialFieldValue
+        elif MimeoRenderer.has_var(value):
+            value_cls = VarValue
+        elif MimeoRenderer.is_raw_mimeo_util(value):
+            value_cls = RawUtilValue
+        elif MimeoRenderer.is_reference(value):
+            value_cls = RefValue
+        return value_cls(value)
+
+    def render(
+            self,
+            context: MimeoContext | None = None,
+    ) -> Any:
+        """Render the value.
+
+        Parameters
+        ----------
+        context : MimeoContext | None, default None
+            The current Mimeo Context. When provided, Mimeo Utils are rendered
+            in it directly, without looking it up.
+
+        Returns
+        -------
+        Any
+            A rendered value
+        """
+        try:
+            return self._render(context)
+        except Exception:
+            logger.exception("An error occurred for [%s].", self.value)
+            raise
+
+    def _render(
+            self,
+            context: MimeoContext | None,
+    ) -> Any:
+        """Render the value accordingly to its type.
+
+        It is an abstract method to implement in subclasses
+        """
+        raise NotImplementedError
+
+
+class LiteralValue(PlanValue):
+    """A PlanValue implementation representing a raw value."""
+
+    def render(
+            self,
+            context: MimeoContext | None = None,
+    ) -> Any:
+        """Return the raw value."""
+        return self.value
+
+
+class UtilValue(PlanValue):
+    """A superclass for PlanValues rendering a bound Mimeo Util.
+
+    A Mimeo Util instance is bound to the value once it is rendered for the first
+    time, so it is not looked up in the Mimeo Utils cache in every iteration.
+    When the Mimeo Util is batchable and a batch size is set, its values are
+    rendered for a block of iterations at once and taken in order.
+
+    Methods
+    -------
+    set_batch_size(batch_size: int)
+        Set a number of values rendered at once.
+    """
+
+    def __init__(
+            self,
+            value: Any,
+    ):
+        """Initialize UtilValue class.
+
+        Extends PlanValue constructor.
+
+        Parameters
+        ----------
+        value : Any
+            A Mimeo Util
+        """
+        super().__init__(value)
+        self._mimeo_util: MimeoUtil | None = None
+        self._is_batchable: bool = False
+        self._batch_size: int = 1
+        self._batch: list = []
+        self._batch_index: int = 0
+
+    def set_batch_size(
+            self,
+            batch_size: int,
+    ):
+        """Set a number of values rendered at once.
+
+        Parameters
+        ----------
+        batch_size : int
+            A number of values rendered at once (1 disables batching)
+        """
+        self._batch_size = batch_size
+
+    def _render_mimeo_util(
+            self,
+            context: MimeoContext | None,
+    ) -> Any:
+        """Render the bound Mimeo Util.
+
+        Parameters
+        ----------
+        context : MimeoContext | None
+            The current Mimeo Context
+
+        Returns
+        -------
+        Any
+            A rendered value
+        """
+        if self._mimeo_util is None:
+            self._mimeo_util = UtilsRenderer.create_mimeo_util(
+                self._get_mimeo_util_config())
+            self._is_batchable = self._mimeo_util.is_batchable()
+        if self._is_batchable and self._batch_size > 1:
+            if self._batch_index == len(self._batch):
+                self._batch = self._mimeo_util.render_batch(self._batch_size)
+                self._batch_index = 0
+            value = self._batch[self._batch_index]
+            self._batch_index += 1
+        elif context is None:
+            value = self._mimeo_util.render()
+        else:
+            value = self._mimeo_util.render_in_context(context)
+        return MimeoRenderer.render(value)
+
+    def _get_mimeo_util_config(
+            self,
+    ) -> dict:
+        """Get a configuration of the Mimeo Util to bind.
+
+        It is an abstract method to implement in subclasses
+        """
+        raise NotImplementedError
+
+
+class RawUtilValue(UtilValue):
+    """A UtilValue implementation representing a raw Mimeo Util."""
+
+    def _render(
+            self,
+            context: MimeoContext | None,
+    ) -> Any:
+        """Render a raw Mimeo Util."""
+        return self._render_mimeo_util(context)
+
+    def _get_mimeo_util_config(
+            self,
+    ) -> dict:
+        """Get a configuration of the raw Mimeo Util."""
+        return {cc.MODEL_MIMEO_UTIL_NAME_KEY: self.value[1:][:-1]}
+
+
+class ParametrizedUtilValue(UtilValue):
+    """A UtilValue implementation representing a parametrized Mimeo Util.
+
+    When none of the Mimeo Util parameters needs rendering, a Mimeo Util instance
+    is bound to the value. Otherwise, parameters are rendered in every iteration.
+    """
+
+    def __init__(
+            self,
+            value: dict,
+    ):
+        """Initialize ParametrizedUtilValue class.
+
+        Extends UtilValue constructor.
+
+        Parameters
+        ----------
+        value : dict
+            A parametrized Mimeo Util
+        """
+        super().__init__(value)
+        self._is_static: bool = self._has_static_parameters(value)
+
+    def _render(
+            self,
+            context: MimeoContext | None,
+    ) -> Any:
+        """Render a parametrized Mimeo Util."""
+        if not self._is_static:
+            return MimeoRenderer.render_parametrized_mimeo_util(self.value)
+        return self._render_mimeo_util(context)
+
+    def _get_mimeo_util_config(
+            self,
+    ) -> dict:
+        """Get a configuration of the parametrized Mimeo Util."""
+        return self.value[cc.MODEL_MIMEO_UTIL_KEY]
+
+    @staticmethod
+    def _has_static_parameters(
+            value: dict,
+    ) -> bool:
+        """Verify if a parametrized Mimeo Util has static parameters only.
+
+        Parameters
+        ----------
+        value : dict
+            A parametrized Mimeo Util
+
+        Returns
+        -------
+        bool
+            True if none of the parameters is a string with curly braces
+            or a parametrized Mimeo Util. Otherwise, False.
+        """
+        mimeo_util_config = value[cc.MODEL_MIMEO_UTIL_KEY]
+        return isinstance(mimeo_util_config, dict) and not any(
+            (isinstance(param, str) and "{" in param) or
+            MimeoRenderer.is_parametrized_mimeo_util(param)
+            for key, param in mimeo_util_config.items()
+            if key != cc.MODEL_MIMEO_UTIL_NAME_KEY)
+
+
+class VarValue(PlanValue):
+    """A PlanValue implementation representing a value with a Mimeo Var."""
+
+    def _render(
+            self,
+            context: MimeoContext | None,
+    ) -> Any:
+        """Render a value containing a Mimeo Var."""
+        return MimeoRenderer.render_var(self.value)
+
+
+class SpecialFieldValue(PlanValue):
+    """A PlanValue implementation representing a value with a Special Field."""
+
+    def _render(
+            self,
+            context: MimeoContext | None,
+    ) -> Any:
+        """Render a value containing a Special Field."""
+        return MimeoRenderer.render_special_field(self.value)
+
+
+class RefValue(PlanValue):
+    """A PlanValue implementation representing a Mimeo Ref."""
+
+    def _render(
+            self,
+            context: MimeoContext | None,
+    ) -> Any:
+        """Render a Mimeo Ref."""
+        return MimeoRenderer.render_reference(self.value)
@@ -0,0 +1,712 @@
+"""The Mimeo Sharding module.
+
+It contains classes allowing to generate data of a single Mimeo Configuration
+in multiple processes:
+    * Shard
+        A class representing a slice of a Mimeo Template's data units.
+    * ShardedGenerator
+        A class generating data of a Mimeo Configuration in a process pool.
+"""
+from __future__ import annotations
+
+import copy
+import copyreg
+import inspect
+import logging
+import random
+import re
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, ClassVar, Iterator, Pattern
+
+from mimeo.config import constants as cc
+from mimeo.config.mimeo_config import MimeoConfig, MimeoTemplate
+from mimeo.context import MimeoContext, MimeoContextManager
+from mimeo.generators.generator_factory import GeneratorFactory
+from mimeo.generators.plan import (AtomicNode, DictNode, ListNode,
+                                   ParametrizedUtilValue, PlanValue,
+                                   RawUtilValue, RefValue, SpecialFieldValue,
+                                   TemplatePlan, TemplatesNode, VarValue)
+from mimeo.utils import (AutoIncrementUtil, CityUtil, CountryUtil, CurrencyUtil,
+                         CurrentIterationUtil, FirstNameUtil, KeyUtil,
+                         LastNameUtil, MimeoRenderer)
+from mimeo.utils.renderers import UtilsRenderer
+
+logger = logging.getLogger(__name__)
+
+
+class Shard:
+    """A class representing a slice of a Mimeo Template's data units.
+
+    Attributes
+    ----------
+    template_index : int
+        An index of the Mimeo Template in the Mimeo Configuration
+    index : int
+        A shard index across all Mimeo Templates
+    start : int
+        A number of the template's data units generated by previous shards
+    count : int
+        A number of data units to generate
+    id_offsets : dict[str, int]
+        Identifiers consumed by previous shards, per Mimeo Context
+    unique_slices : dict[str, dict[str, tuple[int, int, int]]]
+        Unique values consumed before the shard, before its end and in total,
+        per Mimeo Context and unique values pool key
+    """
+
+    def __init__(
+            self,
+            template_index: int,
+            index: int,
+            start: int,
+            count: int,
+            id_offsets: dict[str, int],
+            unique_slices: dict[str, dict[str, tuple[int, int, int]]],
+    ):
+        """Initialize Shard class.
+
+        Parameters
+        ----------
+        template_index : int
+            An index of the Mimeo Template in the Mimeo Configuration
+        index : int
+            A shard index across all Mimeo Templates
+        start : int
+            A number of the template's data units generated by previous shards
+        count : int
+            A number of data units to generate
+        id_offsets : dict[str, int]
+            Identifiers consumed by previous shards, per Mimeo Context
+        unique_slices : dict[str, dict[str, tuple[int, int, int]]]
+            Unique values consumed before the shard, before its end and in total,
+            per Mimeo Context and unique values pool key
+        """
+        self.template_index: int = template_index
+        self.index: int = index
+        self.start: int = start
+        self.count: int = count
+        self.id_offsets: dict[str, int] = id_offsets
+        self.unique_slices: dict[str, dict[str, tuple[int, int, int]]] = (
+            unique_slices)
+
+
+class ShardedGenerator:
+    """A class generating data of a Mimeo Configuration in a process pool.
+
+    Every Mimeo Template's count is split into shards generated in separate
+    processes. To produce data equivalent to the sequential generation, each shard:
+    * starts auto incremented identifiers of every Mimeo Context from the number
+      of identifiers consumed by previous shards (computed statically from
+      compiled Mimeo Templates),
+    * starts iterations from the number of data units generated by previous shards,
+    * uses a disjoint slice of unique indexes (countries, cities, currencies and
+      names) of every Mimeo Context, proportional to the unique values consumed
+      in the shard (computed statically as well),
+    * uses its own seed of random values generators (derived from the Mimeo
+      Configuration's seed, if configured).
+    Shards are merged in order, keeping only a few of them in memory at once.
+
+    A Mimeo Configuration cannot be sharded when it uses Mimeo Refs, reaches
+    other iterations or contexts with key / curr_iter Mimeo Utils or uses Mimeo
+    Utils in parameters of other Mimeo Utils. In such case, data should be
+    generated sequentially.
+
+    Methods
+    -------
+    is_shardable() -> bool
+        Verify if the Mimeo Configuration can be generated in shards.
+    generate(
+        stringify: bool = False
+    ) -> Iterator[ElemTree.Element | dict | str]
+        Generate data of the Mimeo Configuration in a process pool.
+    """
+
+    _SHARD_SIZE: ClassVar[int] = 10_000
+    _VAR_NAME_PATTERN: ClassVar[Pattern] = re.compile("{([A-Z_0-9]+)}")
+    _UNIQUE_POOLS: ClassVar[dict[str, str]] = {
+        CityUtil.KEY: MimeoContext.CITIES,
+        CountryUtil.KEY: MimeoContext.COUNTRIES,
+        CurrencyUtil.KEY: MimeoContext.CURRENCIES,
+        FirstNameUtil.KEY: MimeoContext.FIRST_NAMES,
+        LastNameUtil.KEY: MimeoContext.LAST_NAMES,
+    }
+
+    def __init__(
+            self,
+            mimeo_config: MimeoConfig,
+            processes: int,
+            shard_size: int | None = None,
+    ):
+        """Initialize ShardedGenerator class.
+
+        Parameters
+        ----------
+        mimeo_config : MimeoConfig
+            A Mimeo Configuration for data generation
+        processes : int
+            A number of processes generating data
+        shard_size : int | None, default None
+            A maximal number of data units generated in a single shard
+        """
+        self._mimeo_config: MimeoConfig = mimeo_config
+        self._processes: int = processes
+        self._shard_size: int = shard_size or self._SHARD_SIZE
+        self._shards: list[Shard] | None = self._plan_shards()
+
+    def is_shardable(
+            self,
+    ) -> bool:
+        """Verify if the Mimeo Configuration can be generated in shards.
+
+        Returns
+        -------
+        bool
+            True if the Mimeo Configuration is split into more than one shard.
+            Otherwise, False.
+        """
+        return self._shards is not None and len(self._shards) > 1
+
+    def generate(
+            self,
+            stringify: bool = False,
+    ) -> Iterator[Any]:
+        """Generate data of the Mimeo Configuration in a process pool.
+
+        Shards are submitted in a bounded window, so that only twice as many
+        shards as processes are kept in memory at once. Every shard is generated
+        with its own seed. When the Mimeo Configuration has a seed, shard seeds
+        are derived from it, so that every shard can be reproduced independently.
+
+        Parameters
+        ----------
+        stringify : bool, default False
+            Indicate if data should be stringified
+
+        Returns
+        -------
+        Iterator[ElemTree.Element | dict | str]
+            Iterator for generated data, in the sequential order
+        """
+        shards = len(self._shards)
+        window_size = self._processes * 2
+        with ProcessPoolExecutor(max_workers=self._processes) as executor:
+            futures = deque()
+            for shard in self._shards:
+                logger.fine("Submitting a shard [%s/%s]", shard.index + 1, shards)
+                futures.append(executor.submit(
+                    ShardedGenerator._generate_shard,
+                    self._mimeo_config, shard, self._get_shard_seed(shard),
+                    stringify))
+                if len(futures) == window_size:
+                    yield from futures.popleft().result()
+            while futures:
+                yield from futures.popleft().result()
+
+    def _get_shard_seed(
+            self,
+            shard: Shard,
+    ) -> int:
+        """Get a seed of a shard's random values generators.
+
+        Parameters
+        ----------
+        shard : Shard
+            A shard to generate
+
+        Returns
+        -------
+        int
+            A seed derived from the Mimeo Configuration's seed and the shard index,
+            or a random one if the Mimeo Configuration has no seed
+        """
+        if self._mimeo_config.seed is None:
+            return random.getrandbits(64)
+        return random.Random(f"{self._mimeo_config.seed}:{shard.index}").getrandbits(64)
+
+    def _plan_shards(
+            self,
+    ) -> list[Shard] | None:
+        """Split Mimeo Templates into shards.
+
+        Returns
+        -------
+        list[Shard] | None
+            Shards of all Mimeo Templates, or None if the Mimeo Configuration
+            cannot be sharded
+        """
+        if len(self._mimeo_config.refs) > 0:
+            logger.debug("Mimeo Config cannot be sharded as it uses Mimeo Refs")
+            return None
+
+        generator = GeneratorFactory.get_generator(self._mimeo_config)
+        with MimeoContextManager(self._mimeo_config):
+            plans = [generator.compile_template(template)
+                     for template in self._mimeo_config.templates]
+            ids_per_unit = [self._count_ids(plan, plan.template.model.context_name)
+                            for plan in plans]
+            if any(ids is None for ids in ids_per_unit):
+                return None
+            unique_values_per_unit = [self._count_unique_values(plan)
+                                      for plan in plans]
+
+        templates = self._mimeo_config.templates
+        total_unique_values = self._sum_unique_values(templates,
+                                                      unique_values_per_unit)
+        shards = []
+        consumed_ids = defaultdict(int)
+        for template_index, template in enumerate(templates):
+            ids = ids_per_unit[template_index]
+            unique_values = unique_values_per_unit[template_index]
+            consumed_unique_values = self._sum_unique_values(
+                templates[:template_index], unique_values_per_unit[:template_index])
+            for start in range(0, template.count, self._shard_size):
+                stop = min(start + self._shard_size, template.count)
+                shards.append(Shard(
+                    template_index=template_index,
+                    index=len(shards),
+                    start=start,
+                    count=stop - start,
+                    id_offsets={context_name: consumed_ids[context_name] + start * num
+                                for context_name, num in ids.items()},
+                    unique_slices={
+                        context_name: {
+                            pool: (consumed_unique_values[context_name][pool] +
+                                   start * num,
+                                   consumed_unique_values[context_name][pool] +
+                                   stop * num,
+                                   max(total_unique_values[context_name][pool], 1))
+                            for pool, num in pools.items()}
+                        for context_name, pools in unique_values.items()}))
+            for context_name, num in ids.items():
+                consumed_ids[context_name] += template.count * num
+        return shards
+
+    @staticmethod
+    def _sum_unique_values(
+            templates: list[MimeoTemplate],
+            unique_values_per_unit: list[dict[str, dict[str, int]]],
+    ) -> dict[str, dict[str, int]]:
+        """Sum unique values consumed by all data units of Mimeo Templates.
+
+        Parameters
+        ----------
+        templates : list[MimeoTemplate]
+            Mimeo Templates
+        unique_values_per_unit : list[dict[str, dict[str, int]]]
+            Unique values consumed by a single data unit of each Mimeo Template
+
+        Returns
+        -------
+        dict[str, dict[str, int]]
+            Numbers of unique values per Mimeo Context and unique values pool
+        """
+        total_unique_values = defaultdict(lambda: defaultdict(int))
+        for template, unique_values in zip(templates, unique_values_per_unit):
+            for context_name, pools in unique_values.items():
+                for pool, num in pools.items():
+                    total_unique_values[context_name][pool] += template.count * num
+        return total_unique_values
+
+    @classmethod
+    def _count_ids(
+            cls,
+            plan: TemplatePlan,
+            sharded_context_name: str,
+    ) -> dict[str, int] | None:
+        """Count identifiers consumed by a single data unit, per Mimeo Context.
+
+        Parameters
+        ----------
+        plan : TemplatePlan
+            A compiled Mimeo Template
+        sharded_context_name : str
+            A context name of the top-level Mimeo Template
+
+        Returns
+        -------
+        dict[str, int] | None
+            Numbers of auto incremented identifiers per Mimeo Context,
+            or None if they cannot be determined statically
+        """
+        context_name = plan.template.model.context_name
+        ids = {context_name: 0}
+        nodes = [plan.root]
+        while len(nodes) > 0:
+            node = nodes.pop()
+            if isinstance(node, AtomicNode):
+                num = cls._count_value_ids(node.value)
+                if num is None:
+                    return None
+                ids[context_name] += num
+            elif isinstance(node, (DictNode, ListNode)):
+                nodes.extend(node.children)
+            elif isinstance(node, TemplatesNode):
+                for nested_plan in node.plans:
+                    nested_context_name = nested_plan.template.model.context_name
+                    if nested_context_name == sharded_context_name:
+                        logger.debug("Mimeo Config cannot be sharded as nested "
+                                     "templates use a sharded context [%s]",
+                                     nested_context_name)
+                        return None
+                    nested_ids = cls._count_ids(nested_plan, sharded_context_name)
+                    if nested_ids is None:
+                        return None
+                    for nested_name, num in nested_ids.items():
+                        ids[nested_name] = (ids.get(nested_name, 0) +
+                                            nested_plan.template.count * num)
+        return ids
+
+    @classmethod
+    def _count_value_ids(
+            cls,
+            value: PlanValue,
+    ) -> int | None:
+        """Count identifiers consumed by a compiled value.
+
+        Parameters
+        ----------
+        value : PlanValue
+            A compiled value
+
+        Returns
+        -------
+        int | None
+            A number of auto incremented identifiers, or None if it cannot be
+            determined statically
+        """
+        if isinstance(value, RefValue):
+            return None
+        num_of_ids = 0
+        for util in cls._get_value_utils(value):
+            num = cls._count_util_ids(util)
+            if num is None:
+                return None
+            num_of_ids += num
+        return num_of_ids
+
+    @classmethod
+    def _count_util_ids(
+            cls,
+            util: dict,
+    ) -> int | None:
+        """Count identifiers consumed by a parametrized Mimeo Util.
+
+        Parameters
+        ----------
+        util : dict
+            A parametrized Mimeo Util's configuration
+
+        Returns
+        -------
+        int | None
+            A number of auto incremented identifiers, or None if it cannot be
+            determined statically
+        """
+        name = util.get(cc.MODEL_MIMEO_UTIL_NAME_KEY)
+        params = {key: val for key, val in util.items()
+                  if key != cc.MODEL_MIMEO_UTIL_NAME_KEY}
+        if name == AutoIncrementUtil.KEY:
+            return 1
+        if (name in (KeyUtil.KEY, CurrentIterationUtil.KEY) and
+                ("context" in params or "iteration" in params)):
+            logger.debug("Mimeo Config cannot be sharded as it reaches other "
+                         "contexts or iterations [%s]", util)
+            return None
+        if cls._has_dynamic_value(params):
+            logger.debug("Mimeo Config cannot be sharded as it renders Mimeo Util "
+                         "parameters [%s]", util)
+            return None
+        return 0
+
+    @classmethod
+    def _get_value_utils(
+            cls,
+            value: PlanValue,
+    ) -> list[dict]:
+        """Get Mimeo Utils rendered by a compiled value.
+
+        Parameters
+        ----------
+        value : PlanValue
+            A compiled value
+
+        Returns
+        -------
+        list[dict]
+            Configurations of Mimeo Utils rendered by the value
+        """
+        if isinstance(value, ParametrizedUtilValue):
+            return [value.value[cc.MODEL_MIMEO_UTIL_KEY]]
+        if isinstance(value, (RawUtilValue, VarValue, SpecialFieldValue)):
+            return cls._get_string_utils(value.value)
+        return []
+
+    @classmethod
+    def _get_string_utils(
+            cls,
+            value: str,
+    ) -> list[dict]:
+        """Get Mimeo Utils rendered by a string value.
+
+        Mimeo Vars are followed recursively, also when they are embedded
+        in a string or a value with Special Fields. Every Mimeo Var is counted
+        once per value, as it is rendered once.
+
+        Parameters
+        ----------
+        value : str
+            A string value
+
+        Returns
+        -------
+        list[dict]
+            Configurations of Mimeo Utils rendered by the value
+        """
+        if MimeoRenderer.is_raw_mimeo_util(value):
+            return [{cc.MODEL_MIMEO_UTIL_NAME_KEY: value[1:-1]}]
+        utils = []
+        for var_name in set(cls._VAR_NAME_PATTERN.findall(value)):
+            var_value = MimeoContextManager().get_var(var_name)
+            if MimeoRenderer.is_parametrized_mimeo_util(var_value):
+                utils.append(var_value[cc.MODEL_MIMEO_UTIL_KEY])
+            elif isinstance(var_value, str):
+                utils.extend(cls._get_string_utils(var_value))
+        return utils
+
+    @classmethod
+    def _count_unique_values(
+            cls,
+            plan: TemplatePlan,
+    ) -> dict[str, dict[str, int]]:
+        """Count unique values consumed by a single data unit.
+
+        Parameters
+        ----------
+        plan : TemplatePlan
+            A compiled Mimeo Template
+
+        Returns
+        -------
+        dict[str, dict[str, int]]
+            Numbers of unique values per Mimeo Context and unique values pool
+        """
+        context_name = plan.template.model.context_name
+        unique_values = {context_name: {}}
+        nodes = [plan.root]
+        while len(nodes) > 0:
+            node = nodes.pop()
+            if isinstance(node, AtomicNode):
+                for pool in cls._get_value_unique_pools(node.value):
+                    unique_values[context_name][pool] = (
+                        unique_values[context_name].get(pool, 0) + 1)
+            elif isinstance(node, (DictNode, ListNode)):
+                nodes.extend(node.children)
+            elif isinstance(node, TemplatesNode):
+                for nested_plan in node.plans:
+                    nested_values = cls._count_unique_values(nested_plan)
+                    for nested_name, pools in nested_values.items():
+                        context_values = unique_values.setdefault(nested_name, {})
+                        for pool, num in pools.items():
+                            context_values[pool] = (context_values.get(pool, 0) +
+                                                    nested_plan.template.count * num)
+        return unique_values
+
+    @classmethod
+    def _get_value_unique_pools(
+            cls,
+            value: PlanValue,
+    ) -> list[str]:
+        """Get unique values pools consumed by a compiled value.
+
+        Parameters
+        ----------
+        value : PlanValue
+            A compiled value
+
+        Returns
+        -------
+        list[str]
+            Keys of unique values pools, once per unique value consumed
+        """
+        return [cls._get_unique_pool_key(util)
+                for util in cls._get_value_utils(value) if cls._is_unique(util)]
+
+    @classmethod
+    def _get_unique_pool_key(
+            cls,
+            util: dict,
+    ) -> str:
+        """Get a key of a unique values pool consumed by a Mimeo Util.
+
+        Parameters
+        ----------
+        util : dict
+            A Mimeo Util's configuration
+
+        Returns
+        -------
+        str
+            A key of the unique values pool, scoped by a country of cities or
+            a sex of first names, like in a Mimeo Context
+        """
+        name = util[cc.MODEL_MIMEO_UTIL_NAME_KEY]
+        scope = None
+        if name == CityUtil.KEY:
+            scope = util.get("country")
+        elif name == FirstNameUtil.KEY and util.get("sex") is not None:
+            scope = str(util["sex"]).upper()[:1]
+        return MimeoContext.get_unique_pool_key(cls._UNIQUE_POOLS[name], scope)
+
+    @classmethod
+    def _is_unique(
+            cls,
+            util: dict,
+    ) -> bool:
+        """Verify if a Mimeo Util consumes unique values.
+
+        Parameters
+        ----------
+        util : dict
+            A Mimeo Util's configuration
+
+        Returns
+        -------
+        bool
+            True if the Mimeo Util generates unique values, explicitly or by
+            default. Otherwise, False.
+        """
+        name = util.get(cc.MODEL_MIMEO_UTIL_NAME_KEY)
+        if name not in cls._UNIQUE_POOLS:
+            return False
+        if name in (CountryUtil.KEY, CurrencyUtil.KEY) and "country" in util:
+            return False
+        parameters = inspect.signature(UtilsRenderer.MIMEO_UTILS[name]).parameters
+        return util.get("unique", parameters["unique"].default)
+
+    @classmethod
+    def _has_dynamic_value(
+            cls,
+            value: Any,
+    ) -> bool:
+        """Verify if a value includes Mimeo Utils or Mimeo Vars.
+
+        Parameters
+        ----------
+        value : Any
+            A value to verify
+
+        Returns
+        -------
+        bool
+            True if the value includes Mimeo Utils or Mimeo Vars at any level.
+            Otherwise, False.
+        """
+        if isinstance(value, dict):
+            return (MimeoRenderer.is_parametrized_mimeo_util(value) or
+                    any(cls._has_dynamic_value(val) for val in value.values()))
+        if isinstance(value, list):
+            return any(cls._has_dynamic_value(val) for val in value)
+        if isinstance(value, str):
+            return (MimeoRenderer.is_raw_mimeo_util(value) or
+                    MimeoRenderer.has_var(value))
+        return False
+
+    @staticmethod
+    def _generate_shard(
+            mimeo_config: MimeoConfig,
+            shard: Shard,
+            seed: int,
+            stringify: bool,
+    ) -> list:
+        """Generate data units of a single shard.
+
+        It is executed in a separate process.
+
+        Parameters
+        ----------
+        mimeo_config : MimeoConfig
+            A Mimeo Configuration for data generation
+        shard : Shard
+            A shard to generate
+        seed : int
+            A seed of the shard's random values generators
+        stringify : bool
+            Indicate if data should be stringified
+
+        Returns
+        -------
+        list
+            Data units generated in the shard
+
+        Raises
+        ------
+        Exception
+            Any exception raised in the shard, passed to the main process
+            with its original type
+        """
+        shard_config = copy.copy(mimeo_config)
+        shard_config.seed = seed
+        template = copy.copy(mimeo_config.templates[shard.template_index])
+        template.count = shard.count
+        generator = GeneratorFactory.get_generator(shard_config)
+        try:
+            with MimeoContextManager(shard_config) as mimeo_manager:
+                for context_name, id_offset in shard.id_offsets.items():
+                    iteration_offset = (shard.start
+                                        if context_name == template.model.context_name
+                                        else 0)
+                    mimeo_manager.get_context(context_name).assign_shard(
+                        shard.unique_slices[context_name], id_offset, iteration_offset)
+                generator.retain_iterations(shard_config)
+                if stringify:
+                    return list(generator.generate_stringified([template]))
+                return list(generator.generate([template]))
+        except Exception as err:
+            copyreg.pickle(type(err), ShardedGenerator._reduce_error)
+            raise
+
+    @staticmethod
+    def _reduce_error(
+            error: Exception,
+    ) -> tuple:
+        """Reduce an exception raised in a shard to be passed to the main process.
+
+        Mimeo exceptions build their messages from error codes, so they cannot
+        be unpickled with their initializers. They are restored with arguments
+        of the exception raised instead.
+
+        Parameters
+        ----------
+        error : Exception
+            An exception raised in a shard
+
+        Returns
+        -------
+        tuple
+            A function restoring the exception and its arguments
+        """
+        return ShardedGenerator._restore_error, (type(error), error.args)
+
+    @staticmethod
+    def _restore_error(
+            error_type: type[Exception],
+            args: tuple,
+    ) -> Exception:
+        """Restore an exception raised in a shard without its initializer.
+
+        Parameters
+        ----------
+        error_type : type[Exception]
+            A type of the exception raised
+        args : tuple
+            Arguments of the exception raised
+
+        Returns
+        -------
+        Exception
+            An exception of the same type and message
+        """
+        error = error_type.__new__(error_type)
+        error.args = args
+        return error
@@ -6,15 +6,19 @@ It exports only one class:
 """
 from __future__ import annotations
 
+import copy
 import logging
 import xml.etree.ElementTree as ElemTree
 from typing import Iterator
-from xml.dom import minidom
 
 from mimeo.config import constants as cc
-from mimeo.config.mimeo_config import MimeoConfig, MimeoTemplate
+from mimeo.config.mimeo_config import MimeoConfig, MimeoModel, MimeoTemplate
+from mimeo.context import MimeoContext
 from mimeo.generators import Generator
 from mimeo.generators.exc import UnsupportedStructureError
+from mimeo.generators.plan import (AtomicNode, DictNode, ListNode, PlanNode,
+                                   StaticNode, TemplatesNode)
+from mimeo.generators.xml_writer import XMLTextWriter
 from mimeo.utils import MimeoRenderer
 
 logger = logging.getLogger(__name__)
@@ -52,6 +56,10 @@ class XMLGenerator(Generator):
         """
         self._indent: int = mimeo_config.output.indent
         self._xml_declaration: bool = mimeo_config.output.xml_declaration
+        self._writer: XMLTextWriter | None = (
+            XMLTextWriter(self._indent, self._xml_declaration)
+            if self._indent is not None and self._indent != 0
+            else None)
 
     @classmethod
     def generate(
@@ -81,8 +89,8 @@ class XMLGenerator(Generator):
             Iterator for generated nodes
         """
         for template in templates:
-            for data_unit in cls._process_single_template(template, parent):
-                yield data_unit
+            plan = cls.compile_template(template)
+            yield from cls._process_single_template(template, plan, parent)
 
     def stringify(
             self,
@@ -100,21 +108,14 @@ class XMLGenerator(Generator):
         str
             Stringified data unit
         """
-        if self._indent is None or self._indent == 0:
-            node_str = ElemTree.tostring(
-                data_unit,
-                encoding="utf-8",
-                method="xml",
-                xml_declaration=self._xml_declaration)
-        else:
-            xml_string = ElemTree.tostring(data_unit)
-            xml_minidom = minidom.parseString(xml_string)
-            if self._xml_declaration is False:
-                xml_minidom = xml_minidom.childNodes[0]
-            node_str = xml_minidom.toprettyxml(
-                indent=" " * self._indent,
-                encoding="utf-8")
-        return node_str.decode("ascii")
+        if self._writer is not None:
+            return self._writer.tostring(data_unit)
+
+        return ElemTree.tostring(
+            data_unit,
+            encoding="utf-8",
+            method="xml",
+            xml_declaration=self._xml_declaration).decode("ascii")
 
     @classmethod
     def _pre_process_node(
@@ -168,24 +169,138 @@ class XMLGenerator(Generator):
             is_mimeo_util,
             is_special_field)
 
+    @classmethod
+    def _compile_complex_value(
+            cls,
+            node_meta: dict,
+            model: MimeoModel | None = None,
+    ) -> DictNode | ListNode | TemplatesNode:
+        """Compile a node with a complex value.
+
+        The node is compiled accordingly to its value type.
+        When the type is list and name is _templates_, nested templates
+        are compiled into plans.
+
+        Parameters
+        ----------
+        node_meta : dict
+            Pre-processed node's metadata
+        model : MimeoModel | None, default None
+            A Mimeo Model the node belongs to
+
+        Returns
+        -------
+        DictNode | ListNode | TemplatesNode
+            A compiled node
+
+        Raises
+        ------
+        UnsupportedStructureError
+            If any of the list value element is a list.
+        """
+        name = node_meta["name"]
+        value = node_meta["value"]
+        attrs = node_meta["attrs"]
+        if isinstance(value, dict):
+            return DictNode(
+                name,
+                [cls._compile_node(cls._node_meta(child_tag, child_value), model)
+                 for child_tag, child_value in value.items()],
+                dict(attrs))
+        if isinstance(value, list) and name != cc.TEMPLATES_KEY:
+            children = []
+            for child in value:
+                if isinstance(child, list):
+                    raise UnsupportedStructureError(name, value)
+                children.append(cls._compile_node(cls._node_meta(
+                    name=name,
+                    value=child,
+                    attrs=attrs), model))
+            return ListNode(name, children, dict(attrs))
+        return TemplatesNode(name, cls._compile_nested_templates(value, model))
+
+    @classmethod
+    def _build_static_fragment(
+            cls,
+            node: DictNode | ListNode,
+    ) -> list[ElemTree.Element]:
+        """Build a static subtree once.
+
+        The prebuilt elements are cloned for every data unit generated.
+
+        Parameters
+        ----------
+        node : DictNode | ListNode
+            A compiled static node
+
+        Returns
+        -------
+        list[ElemTree.Element]
+            Prebuilt elements to attach to a parent node
+
+        Examples
+        --------
+        node = cls._compile_node(cls._node_meta(
+            name="SomeField",
+            value=["value-1", "value-2"],
+        ))
+        cls._build_static_fragment(node)
+        ->
+        [
+            <SomeField>value-1</SomeField>,
+            <SomeField>value-2</SomeField>,
+        ]
+        """
+        holder = ElemTree.Element(node.name)
+        cls._build_static_element(holder, node)
+        return list(holder)
+
+    @classmethod
+    def _build_static_element(
+            cls,
+            parent: ElemTree.Element,
+            node: DictNode | ListNode | AtomicNode,
+    ) -> None:
+        """Build a static node recursively.
+
+        Parameters
+        ----------
+        parent : ElemTree.Element
+            A parent node
+        node : DictNode | ListNode | AtomicNode
+            A compiled static node
+        """
+        if isinstance(node, ListNode):
+            for child in node.children:
+                cls._build_static_element(parent, child)
+            return
+
+        element = cls._create_node(parent, node)
+        if isinstance(node, DictNode):
+            for child in node.children:
+                cls._build_static_element(element, child)
+        else:
+            element.text = cls._to_text(node.value.render())
+
     @classmethod
     def _process_complex_value(
             cls,
             parent: ElemTree.Element | None,
-            node_meta: dict,
+            node: PlanNode,
+            context: MimeoContext,
     ) -> ElemTree.Element | None:
-        """Process a node with a complex value.
+        """Process a compiled node with a complex value.
 
-        The node is processed accordingly to its value type.
-        When the type is list and name is _templates_, node is processed
-        in a special way.
+        The node is processed accordingly to its type.
 
         Parameters
         ----------
         parent : ElemTree.Element | None
             A parent node
-        node_meta : dict
-            Node's metadata
+        node : PlanNode
+            A compiled node
+        context : MimeoContext
+            The current Mimeo Context
 
         Returns
         -------
@@ -194,29 +309,27 @@ class XMLGenerator(Generator):
 
         Raises
         ------
-        UnsupportedStructureError
-            If a list value elements are not atomic-only or dict-only.
         InvalidSpecialFieldValueError
             If a special field value is dict or list
         SpecialFieldNotFoundError
             If a special field does not exist.
         """
-        if isinstance(node_meta["value"], dict):
-            func = cls._process_dict_value
-        elif (isinstance(node_meta["value"], list) and
-              node_meta["name"] != cc.TEMPLATES_KEY):
-            func = cls._process_list_value
-        else:
-            func = cls._process_templates_value
-        return func(parent, node_meta)
+        if isinstance(node, DictNode):
+            return cls._process_dict_value(parent, node, context)
+        if isinstance(node, ListNode):
+            return cls._process_list_value(parent, node, context)
+        if isinstance(node, StaticNode):
+            return cls._process_static_value(parent, node)
+        return cls._process_templates_value(parent, node)
 
     @classmethod
     def _process_dict_value(
             cls,
             parent: ElemTree.Element | None,
-            node_meta: dict,
+            node: DictNode,
+            context: MimeoContext,
     ) -> ElemTree.Element:
-        """Process a node with a dictionary value.
+        """Process a compiled node with a dictionary value.
 
         It iterates through the dictionary items and processes each of them.
 
@@ -224,8 +337,10 @@ class XMLGenerator(Generator):
         ----------
         parent : ElemTree.Element | None
             A parent node
-        node_meta : dict
-            Node's metadata
+        node : DictNode
+            A compiled node
+        context : MimeoContext
+            The current Mimeo Context
 
         Returns
         -------
@@ -244,29 +359,30 @@ class XMLGenerator(Generator):
         Examples
         --------
         parent = ElemTree.Element("Root")
-        node_meta = cls._node_meta(
+        node = cls._compile_node(cls._node_meta(
             name="SomeField",
             value={"SomeChild1": 1, "SomeChild2": 2},
-        )
-        cls._process_dict_value(parent, node_meta)
+        ))
+        cls._process_dict_value(parent, node, context)
         ->
         <SomeField>
             <SomeChild1>1</SomeChild1>
             <SomeChild2>2</SomeChild2>
         </SomeField>
         """
-        element = cls._create_node(parent, node_meta)
-        for child_tag, child_value in node_meta["value"].items():
-            cls._process_node(element, cls._node_meta(child_tag, child_value))
+        element = cls._create_node(parent, node)
+        for child in node.children:
+            cls._process_node(element, child, context)
         return element
 
     @classmethod
     def _process_list_value(
             cls,
             parent: ElemTree.Element,
-            node_meta: dict,
+            node: ListNode,
+            context: MimeoContext,
     ) -> ElemTree.Element:
-        """Process a node with a list value.
+        """Process a compiled node with a list value.
 
         It iterates through the list items and processes each of them: generates
         a child element for each value as direct children of the parent.
@@ -275,8 +391,10 @@ class XMLGenerator(Generator):
         ----------
         parent : ElemTree.Element | None
             A parent node
-        node_meta : dict
-            Node's metadata
+        node : ListNode
+            A compiled node
+        context : MimeoContext
+            The current Mimeo Context
 
         Returns
         -------
@@ -285,8 +403,6 @@ class XMLGenerator(Generator):
 
         Raises
         ------
-        UnsupportedStructureError
-            If any of the list value element is a list.
         InvalidSpecialFieldValueError
             If the special field value is dict or list
         SpecialFieldNotFoundError
@@ -295,15 +411,15 @@ class XMLGenerator(Generator):
         Examples
         --------
         parent = ElemTree.Element("Root")
-        node_meta = cls._node_meta(
+        node = cls._compile_node(cls._node_meta(
             name="SomeField",
             value=[
                 'value-1',
                 {'SomeChild1': True, 'SomeChild2': False},
                 {'_mimeo_util': {'_name': 'auto_increment', 'pattern': '{}'}}
             ],
-        )
-        cls._process_list_value_with_atomic_children(parent, node_meta)
+        ))
+        cls._process_list_value(parent, node, context)
         ->
         <Root>
             <SomeField>value-1</SomeField>
@@ -314,25 +430,46 @@ class XMLGenerator(Generator):
             <SomeField>1</SomeField>
         </Root>
         """
-        for child in node_meta["value"]:
-            if isinstance(child, list):
-                raise UnsupportedStructureError(
-                    node_meta["name"],
-                    node_meta["value"])
-            node_meta = cls._node_meta(
-                name=node_meta["name"],
-                value=child,
-                attrs=node_meta["attrs"])
-            cls._process_node(parent, node_meta)
+        for child in node.children:
+            cls._process_node(parent, child, context)
+        return parent
+
+    @classmethod
+    def _process_static_value(
+            cls,
+            parent: ElemTree.Element | None,
+            node: StaticNode,
+    ) -> ElemTree.Element:
+        """Process a compiled node with a prebuilt static subtree.
+
+        It attaches clones of the prebuilt elements to the parent without
+        processing them node by node.
+
+        Parameters
+        ----------
+        parent : ElemTree.Element | None
+            A parent node
+        node : StaticNode
+            A compiled node
+
+        Returns
+        -------
+        ElemTree.Element
+            A processed node
+        """
+        elements = [copy.deepcopy(element) for element in node.fragment]
+        if parent is None:
+            return elements[0]
+        parent.extend(elements)
         return parent
 
     @classmethod
     def _process_templates_value(
             cls,
             parent: ElemTree.Element,
-            node_meta: dict,
+            node: TemplatesNode,
     ) -> ElemTree.Element:
-        """Process a node with a dictionary value storing templates.
+        """Process a compiled node with nested templates.
 
         It iterates through the templates and generates data based on them.
 
@@ -340,8 +477,8 @@ class XMLGenerator(Generator):
         ----------
         parent : ElemTree.Element | None
             A parent node
-        node_meta : dict
-            Node's metadata
+        node : TemplatesNode
+            A compiled node
 
         Returns
         -------
@@ -360,7 +497,7 @@ class XMLGenerator(Generator):
         Examples
         --------
         parent = ElemTree.Element("Root")
-        node_meta = cls._node_meta(
+        node = cls._compile_node(cls._node_meta(
             name="SomeField",
             value={"_templates_": [
                 {
@@ -374,8 +511,8 @@ class XMLGenerator(Generator):
                   }
                 }
             ]},
-        )
-        cls._process_templates_value(parent, node_meta)
+        ))
+        cls._process_templates_value(parent, node)
         ->
         <Root>
             <SomeField>
@@ -385,8 +522,7 @@ class XMLGenerator(Generator):
             </SomeField>
         </Root>
         """
-        templates = (MimeoTemplate(template) for template in node_meta["value"])
-        for _ in cls.generate(templates, parent):
+        for _ in cls._generate_from_plans(node.plans, parent):
             pass
         return parent
 
@@ -394,9 +530,10 @@ class XMLGenerator(Generator):
     def _process_atomic_value(
             cls,
             parent: ElemTree.Element,
-            node_meta: dict,
+            node: AtomicNode,
+            context: MimeoContext,
     ) -> ElemTree.Element:
-        """Process a node with an atomic value.
+        """Process a compiled node with an atomic value.
 
         A parametrized Mimeo Util is considered as an atomic value as representing one.
         It renders a value for the node.
@@ -405,8 +542,10 @@ class XMLGenerator(Generator):
         ----------
         parent : ElemTree.Element | None
             A parent node
-        node_meta : dict
-            Node's metadata
+        node : AtomicNode
+            A compiled node
+        context : MimeoContext
+            The current Mimeo Context
 
         Returns
         -------
@@ -425,25 +564,44 @@ class XMLGenerator(Generator):
         Examples
         --------
         parent = ElemTree.Element("Root")
-        node_meta = cls._node_meta(
+        node = cls._compile_node(cls._node_meta(
             name="SomeField",
             value="value-1",
-        )
-        cls._process_atomic_value(parent, node_meta)
+        ))
+        cls._process_atomic_value(parent, node, context)
         ->
         <SomeField>value-1</SomeField>
         """
-        element = cls._create_node(parent, node_meta)
-        value = super()._render_atomic_value(node_meta)
-        val_str = str(value) if value is not None else ""
-        element.text = val_str.lower() if isinstance(value, bool) else val_str
+        element = cls._create_node(parent, node)
+        value = super()._render_atomic_value(node, context)
+        element.text = cls._to_text(value)
         logger.fine("Rendered value [%s]", element.text)
         return element
 
+    @staticmethod
+    def _to_text(
+            value: str | int | float | bool | None,
+    ) -> str:
+        """Convert a rendered value into an XML node's text.
+
+        Parameters
+        ----------
+        value : str | int | float | bool | None
+            A rendered value
+
+        Returns
+        -------
+        str
+            An empty string for None, a lowercase string for booleans and
+            a stringified value otherwise
+        """
+        val_str = str(value) if value is not None else ""
+        return val_str.lower() if isinstance(value, bool) else val_str
+
     @staticmethod
     def _create_node(
             parent: ElemTree.Element,
-            node_meta: dict,
+            node: PlanNode,
     ) -> ElemTree.Element | ElemTree.SubElement:
         """Create an XML node based on the `parent` existence.
 
@@ -451,8 +609,8 @@ class XMLGenerator(Generator):
         ----------
         parent : ElemTree.Element
             A parent node
-        node_meta : dict
-            Node's metadata
+        node : PlanNode
+            A compiled node
 
         Returns
         -------
@@ -462,10 +620,10 @@ class XMLGenerator(Generator):
         """
         if parent is None:
             return ElemTree.Element(
-                node_meta["name"],
-                attrib=node_meta["attrs"])
+                node.name,
+                attrib=node.attrs)
         return ElemTree.SubElement(
             parent,
-            node_meta["name"],
-            attrib=node_meta["attrs"],
+            node.name,
+            attrib=node.attrs,
         )
@@ -0,0 +1,201 @@
+"""The Mimeo XML Writer module.
+
+It exports only one class:
+    * XMLTextWriter
+        A class writing indented XML text in a single pass.
+"""
+from __future__ import annotations
+
+import xml.etree.ElementTree as ElemTree
+from typing import ClassVar
+
+
+class XMLTextWriter:
+    """A class writing indented XML text in a single pass.
+
+    It is used by XMLGenerator to stringify a data unit with an indent.
+    An element tree is traversed once, and the text is the same as
+    minidom's toprettyxml() produces for it.
+
+    Methods
+    -------
+    tostring(element: ElemTree.Element) -> str
+        Write an element as indented XML text.
+    """
+
+    _XML_DECLARATION: ClassVar[str] = '<?xml version="1.0" encoding="utf-8"?>\n'
+
+    def __init__(
+            self,
+            indent: int,
+            xml_declaration: bool = False,
+    ):
+        """Initialize XMLTextWriter class.
+
+        Parameters
+        ----------
+        indent : int
+            An indent applied in XML text
+        xml_declaration : bool, default False
+            Indicate if an XML declaration should be written
+        """
+        self._indent: int = indent
+        self._xml_declaration: bool = xml_declaration
+        self._indents: list[str] = []
+
+    def tostring(
+            self,
+            element: ElemTree.Element,
+    ) -> str:
+        """Write an element as indented XML text.
+
+        Parameters
+        ----------
+        element : ElemTree.Element
+            An element to write
+
+        Returns
+        -------
+        str
+            Indented XML text
+        """
+        parts = [self._XML_DECLARATION] if self._xml_declaration else []
+        self._write_element(parts, element, 0)
+        return "".join(parts)
+
+    def _write_element(
+            self,
+            parts: list[str],
+            element: ElemTree.Element,
+            level: int,
+    ):
+        """Write an element with its descendants.
+
+        An element having a text only is written in a single line.
+        Otherwise, its text, children and their tails are written in separate
+        lines, indented one level deeper.
+
+        Parameters
+        ----------
+        parts : list[str]
+            A buffer of text parts
+        element : ElemTree.Element
+            An element to write
+        level : int
+            An indentation level of the element
+        """
+        indent = self._get_indent(level)
+        parts.append(f"{indent}<{element.tag}")
+        for name, value in self._get_attributes(element):
+            parts.append(f' {name}="{self._escape(value)}"')
+
+        text = element.text
+        if not len(element):
+            if text:
+                parts.append(f">{self._escape_text(text)}</{element.tag}>\n")
+            else:
+                parts.append("/>\n")
+            return
+
+        parts.append(">\n")
+        child_indent = self._get_indent(level + 1)
+        if text:
+            parts.append(f"{child_indent}{self._escape_text(text)}\n")
+        for child in element:
+            self._write_element(parts, child, level + 1)
+            if child.tail:
+                parts.append(f"{child_indent}{self._escape_text(child.tail)}\n")
+        parts.append(f"{indent}</{element.tag}>\n")
+
+    def _get_indent(
+            self,
+            level: int,
+    ) -> str:
+        """Get an indentation of a specific level.
+
+        Parameters
+        ----------
+        level : int
+            An indentation level
+
+        Returns
+        -------
+        str
+            An indentation
+        """
+        while len(self._indents) <= level:
+            self._indents.append(" " * self._indent * len(self._indents))
+        return self._indents[level]
+
+    @staticmethod
+    def _get_attributes(
+            element: ElemTree.Element,
+    ) -> list[tuple[str, str]]:
+        """Get element's attributes in the order they should be written.
+
+        Namespace declarations are written before other attributes, keeping
+        the order they have been added in.
+
+        Parameters
+        ----------
+        element : ElemTree.Element
+            An element
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            Element's attributes
+        """
+        attributes = list(element.attrib.items())
+        if len(attributes) > 1:
+            attributes.sort(key=lambda attribute: not (
+                attribute[0] == "xmlns" or attribute[0].startswith("xmlns:")))
+        return attributes
+
+    @staticmethod
+    def _escape_text(
+            text: str,
+    ) -> str:
+        """Escape an element's text or tail.
+
+        Line endings are normalized, as an XML parser would do.
+
+        Parameters
+        ----------
+        text : str
+            A text to escape
+
+        Returns
+        -------
+        str
+            An escaped text
+        """
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return XMLTextWriter._escape(text)
+
+    @staticmethod
+    def _escape(
+            text: str,
+    ) -> str:
+        """Escape XML special characters.
+
+        Parameters
+        ----------
+        text : str
+            A text to escape
+
+        Returns
+        -------
+        str
+            An escaped text
+        """
+        if "&" in text:
+            text = text.replace("&", "&amp;")
+        if "<" in text:
+            text = text.replace("<", "&lt;")
+        if '"' in text:
+            text = text.replace('"', "&quot;")
+        if ">" in text:
+            text = text.replace(">", "&gt;")
+        return text
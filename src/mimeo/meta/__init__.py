@@ -6,6 +6,8 @@ essentially related to any Mimeo component.
 It contains the following modules:
 * alive
     The Alive module.
+* lru_cache
+    The LRU Cache module.
 * exc
     The Mimeo Meta Exceptions module.
 
@@ -14,12 +16,15 @@ The Mimeo Meta package exports the following classes:
     A type ensuring there's only one instance qualified to be used.
 - Alive
     A superclass for OnlyOneAlive classes.
+- LRUCache
+    A size-bounded cache evicting the least recently used entries.
 
 To use this package, simply import the desired class:
-    from mimeo.meta import Alive, OnlyOneAlive
+    from mimeo.meta import Alive, LRUCache, OnlyOneAlive
 """
 from __future__ import annotations
 
 from .alive import Alive, OnlyOneAlive
+from .lru_cache import LRUCache
 
-__all__ = ["Alive", "OnlyOneAlive"]
+__all__ = ["Alive", "LRUCache", "OnlyOneAlive"]
@@ -7,6 +7,8 @@ OnlyOneAlive class you can instantiate a class multiple times.
 Thanks to that a single instance will not store several configurations
 depending on execution time. This pattern ensures your instances are
 consistent and will be reached whenever needed using a constructor.
+An instance is alive only in the execution context (thread or asyncio task)
+it has been entered in, so that each one can use its own instance.
 
 The complete pattern is supported using 2 exported classes:
     * OnlyOneAlive
@@ -37,6 +39,7 @@ with SomeClass({'x': 1}) as alive_1:
 """
 from __future__ import annotations
 
+from contextvars import ContextVar
 from types import TracebackType
 from typing import ClassVar
 
@@ -46,13 +49,22 @@ from mimeo.meta.exc import InstanceNotAliveError
 class OnlyOneAlive(type):
     """A type ensuring there's only one instance qualified to be used.
 
-    The OnlyOneAlive type caches all instances being created for each
-    Alive subclass. If there is any instance being alive, it is
-    returned by a constructor. Otherwise, an Alive subclass is
-    instantiated and returned.
+    The OnlyOneAlive type registers alive instances of each Alive subclass
+    in a context variable. If there is any instance being alive in the current
+    execution context, it is returned by a constructor. Otherwise, an Alive
+    subclass is instantiated and returned.
+    The registry keeps only alive instances, so a lookup takes constant time
+    and instances are released once they are not alive anymore.
+
+    Methods
+    -------
+    get_alive_instances() -> dict
+        Get instances alive in the current execution context.
+    set_alive_instances(alive_instances: dict)
+        Set instances alive in the current execution context.
     """
 
-    _INSTANCES: ClassVar[dict] = {}
+    _ALIVE_INSTANCES: ClassVar[ContextVar[dict]] = ContextVar("alive_instances")
 
     def __call__(
             cls,
@@ -60,16 +72,36 @@ class OnlyOneAlive(type):
             **kwargs,
     ):
         """Ensure there's only one instance qualified to be used."""
-        if cls not in cls._INSTANCES:
-            cls._INSTANCES[cls] = []
-
-        alive_instance = next((i for i in cls._INSTANCES[cls] if i.is_alive()), None)
+        alive_instance = OnlyOneAlive.get_alive_instances().get(cls)
         if alive_instance is None:
-            instance = super().__call__(*args, **kwargs)
-            cls._INSTANCES[cls].append(instance)
-            return instance
+            return super().__call__(*args, **kwargs)
         return alive_instance
 
+    @staticmethod
+    def get_alive_instances(
+    ) -> dict:
+        """Get instances alive in the current execution context.
+
+        Returns
+        -------
+        dict
+            Alive instances indexed by their classes
+        """
+        return OnlyOneAlive._ALIVE_INSTANCES.get({})
+
+    @staticmethod
+    def set_alive_instances(
+            alive_instances: dict,
+    ):
+        """Set instances alive in the current execution context.
+
+        Parameters
+        ----------
+        alive_instances : dict
+            Alive instances indexed by their classes
+        """
+        OnlyOneAlive._ALIVE_INSTANCES.set(alive_instances)
+
 
 class Alive:
     """A superclass for OnlyOneAlive classes.
@@ -79,6 +111,10 @@ class Alive:
     * a method checking if an instance is alive
     * a method throwing an exception when the instance is not alive
 
+    The alive state is stored in a context variable, so an instance entered
+    in one thread is not alive in others. Asyncio tasks created within
+    the `with` statement inherit it.
+
     Methods
     -------
     is_alive()
@@ -87,24 +123,20 @@ class Alive:
         Assert the instance is alive.
     """
 
-    def __init__(
-            self,
-    ):
-        self._alive: bool = False
-
     def __enter__(
             self,
     ) -> Alive:
         """Enter the Alive instance.
 
-        It sets the internal `alive` attribute to True.
+        It marks the instance as alive in the current execution context.
 
         Returns
         -------
         self : Alive
             A Alive instance
         """
-        self._alive = True
+        alive_instances = OnlyOneAlive.get_alive_instances()
+        OnlyOneAlive.set_alive_instances({**alive_instances, type(self): self})
         return self
 
     def __exit__(
@@ -115,7 +147,7 @@ class Alive:
     ) -> None:
         """Exit the Alive instance.
 
-        It sets the internal `alive` attribute to False.
+        It marks the instance as not alive in the current execution context.
 
         Parameters
         ----------
@@ -131,7 +163,12 @@ class Alive:
         None
             A None value
         """
-        self._alive = False
+        alive_instances = OnlyOneAlive.get_alive_instances()
+        if alive_instances.get(type(self)) is self:
+            OnlyOneAlive.set_alive_instances({
+                cls: instance
+                for cls, instance in alive_instances.items()
+                if instance is not self})
 
     def assert_alive(
             self,
@@ -155,5 +192,5 @@ class Alive:
     def is_alive(
             self,
     ) -> bool:
-        """Verify if the instance is alive."""
-        return self._alive
+        """Verify if the instance is alive in the current execution context."""
+        return OnlyOneAlive.get_alive_instances().get(type(self)) is self
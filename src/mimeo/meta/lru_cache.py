@@ -0,0 +1,137 @@
+"""The LRU Cache module.
+
+It exports only one class:
+    * LRUCache
+        A size-bounded cache evicting the least recently used entries.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable
+
+_MISSING = object()
+
+
+class LRUCache:
+    """A size-bounded cache evicting the least recently used entries.
+
+    Besides entries, it counts cache hits, misses and evictions, so its
+    efficiency can be verified. All operations are guarded by a lock, so
+    the cache can be shared by multiple threads.
+
+    Attributes
+    ----------
+    max_size : int
+        A maximum number of entries
+    hits : int
+        A number of lookups that found an entry
+    misses : int
+        A number of lookups that did not find an entry
+    evictions : int
+        A number of entries evicted to not exceed the maximum size
+
+    Methods
+    -------
+    get(key: Hashable, default: Any = None) -> Any
+        Get an entry's value.
+    put(key: Hashable, value: Any)
+        Put an entry.
+    clear()
+        Remove all entries and reset counters.
+    """
+
+    def __init__(
+            self,
+            max_size: int,
+    ):
+        """Initialize LRUCache class.
+
+        Parameters
+        ----------
+        max_size : int
+            A maximum number of entries
+        """
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(
+            self,
+    ) -> int:
+        """Return a number of entries.
+
+        Returns
+        -------
+        int
+            A number of entries
+        """
+        with self._lock:
+            return len(self._entries)
+
+    def get(
+            self,
+            key: Hashable,
+            default: Any = None,
+    ) -> Any:
+        """Get an entry's value.
+
+        The entry becomes the most recently used one.
+
+        Parameters
+        ----------
+        key : Hashable
+            An entry's key
+        default : Any, default None
+            A value returned when the entry does not exist
+
+        Returns
+        -------
+        Any
+            An entry's value or the default one if the entry does not exist
+        """
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return value
+
+    def put(
+            self,
+            key: Hashable,
+            value: Any,
+    ):
+        """Put an entry.
+
+        When the cache is full, the least recently used entry is evicted.
+
+        Parameters
+        ----------
+        key : Hashable
+            An entry's key
+        value : Any
+            An entry's value
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(
+            self,
+    ):
+        """Remove all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
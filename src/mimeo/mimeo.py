@@ -13,14 +13,17 @@ import os
 import queue
 import xml.etree.ElementTree as ElemTree
 from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from types import TracebackType
-from typing import Iterable, Iterator
+from typing import ClassVar, Iterable, Iterator
 
 from mimeo.config.mimeo_config import MimeoConfig
 from mimeo.consumers import ConsumerFactory
 from mimeo.context import MimeoContextManager
-from mimeo.exc import NotRunningMimeographError
+from mimeo.exc import (InvalidMimeographParameterError,
+                       NotRunningMimeographError)
 from mimeo.generators import GeneratorFactory
+from mimeo.generators.sharding import ShardedGenerator
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +42,7 @@ class Mimeograph:
     generate(
         mimeo_config: MimeoConfig,
         stringify: bool = False,
+        processes: int | None = None,
     ) -> Iterator[ElemTree.Element | dict | str]
         Generate data from the Mimeo Configuration.
 
@@ -50,6 +54,7 @@ class Mimeograph:
 
     process(
         mimeo_config: MimeoConfig,
+        processes: int | None = None,
     )
         Process the Mimeo Configuration (generate data and consume).
 
@@ -77,6 +82,11 @@ class Mimeograph:
     data = Mimeograph.generate(mimeo_config)
     Mimeograph.consume(mimeo_config, data)
 
+    # Generating data of a mimeo config in multiple processes
+    config_path = "SomeEntity-config.json"
+    mimeo_config = MimeoConfigFactory.parse(config_path)
+    Mimeograph.process(mimeo_config, processes=4)
+
     # Processing mimeo configs in parallel
     config_paths = []
     with Mimeograph() as mimeo:
@@ -92,11 +102,30 @@ class Mimeograph:
         mimeo_config = MimeoConfigFactory.parse(config_path)
         mimeo.submit((config_path, mimeo_config))
     mimeo.stop()
+
+    # Processing mimeo configs in parallel, generating several configs at once
+    config_paths = []
+    with Mimeograph(generator_workers=4) as mimeo:
+        for config_path in config_paths:
+            mimeo_config = MimeoConfigFactory.parse(config_path)
+            mimeo.submit((config_path, mimeo_config))
+
+    # Processing mimeo configs in parallel, streaming data in chunks
+    config_paths = []
+    with Mimeograph(chunk_size=1000) as mimeo:
+        for config_path in config_paths:
+            mimeo_config = MimeoConfigFactory.parse(config_path)
+            mimeo.submit((config_path, mimeo_config))
     """
 
+    _STREAM_BUFFER_SIZE: ClassVar[int] = 2
+
     def __init__(
             self,
             workers: int = -1,
+            chunk_size: int | None = None,
+            processes: int | None = None,
+            generator_workers: int = 1,
     ):
         """Initialize Mimeograph class.
 
@@ -104,7 +133,29 @@ class Mimeograph:
         ----------
         workers : int
             A number of consumer workers
+        chunk_size : int | None, default None
+            A number of data units passed to consumers at once. When it is
+            provided, data is streamed to consumers in chunks, alongside
+            generation. Otherwise, data of a config is consumed once it is
+            completely generated.
+        processes : int | None, default None
+            A number of processes generating data of a single config. When it is
+            provided, data of a config is generated in shards, in a process pool.
+            Otherwise, data is generated sequentially.
+        generator_workers : int, default 1
+            A number of generator workers. Each of them generates data of
+            a different config, using its own Mimeo Context Manager.
+
+        Raises
+        ------
+        InvalidMimeographParameterError
+            If the chunk size or the number of generator workers is lower
+            than 1
         """
+        if chunk_size is not None:
+            self._validate_positive_int("chunk_size", chunk_size)
+        self._validate_positive_int("generator_workers", generator_workers)
+
         self._is_running: bool = False
         self._generator_queue: queue.Queue = queue.Queue()
         self._consumer_queue: queue.Queue = queue.Queue()
@@ -115,6 +166,9 @@ class Mimeograph:
             self._consumer_workers = self._get_max_num_of_workers()
         else:
             self._consumer_workers = workers
+        self._chunk_size: int | None = chunk_size
+        self._processes: int | None = processes
+        self._generator_workers: int = generator_workers
 
     def __enter__(
             self,
@@ -162,13 +216,14 @@ class Mimeograph:
         if not self._is_running:
             self._is_running = not self._is_running
             self._generate_executor = ThreadPoolExecutor(
-                max_workers=1,
+                max_workers=self._generator_workers,
                 thread_name_prefix="generator_thread")
             self._consume_executor = ThreadPoolExecutor(
                 max_workers=self._consumer_workers,
                 thread_name_prefix="consumer_thread")
 
-            self._generate_executor.submit(self._start_generate)
+            for _ in range(self._generator_workers):
+                self._generate_executor.submit(self._start_generate)
             for _ in range(self._consumer_workers):
                 self._consume_executor.submit(self._start_consume)
 
@@ -177,13 +232,17 @@ class Mimeograph:
     ):
         """Stop the Mimeograph instance.
 
-        It puts a poison pill to generator queue and awaits for all threads to stop
-        before shutting executors down.
+        It puts poison pills to generator queue and awaits for all generator threads
+        to stop. Then, it puts poison pills to consumer queue and awaits for all
+        consumer threads to stop before shutting executors down.
         """
         if self._is_running:
             self._is_running = not self._is_running
-            self._generator_queue.put((None, None))
+            for _ in range(self._generator_workers):
+                self._generator_queue.put((None, None))
             self._generator_queue.join()
+            for _ in range(self._consumer_workers):
+                self._consumer_queue.put((None, None, None))
             self._consumer_queue.join()
             self._generate_executor.shutdown()
             self._consume_executor.shutdown()
@@ -219,8 +278,7 @@ class Mimeograph:
         """Start a generator task.
 
         Starts an infinitive loop that will work until a poison pill is being submitted.
-        It gets a config from a queue and generates data. Once it took a poison pill,
-        puts same to a consumer queue.
+        It gets a config from a queue and generates data.
         """
         while True:
             logger.fine("Getting a config for data generation from queue")
@@ -237,9 +295,13 @@ class Mimeograph:
     ):
         """Execute a generator task."""
         try:
-            data = list(self.generate(mimeo_config, stringify=True))
-            logger.fine("Putting data to consume to queue")
-            self._consumer_queue.put((config_id, mimeo_config, data))
+            if self._chunk_size is None:
+                data = list(self.generate(mimeo_config, stringify=True,
+                                          processes=self._processes))
+                logger.fine("Putting data to consume to queue")
+                self._consumer_queue.put((config_id, mimeo_config, data))
+            else:
+                self._stream_data(config_id, mimeo_config)
         except Exception:
             self._failed_configs.append(config_id)
             logger.exception("An unexpected error occurred while generating data "
@@ -247,13 +309,35 @@ class Mimeograph:
         finally:
             self._generator_queue.task_done()
 
+    def _stream_data(
+            self,
+            config_id: str,
+            mimeo_config: MimeoConfig,
+    ):
+        """Stream generated data to consumers in chunks.
+
+        It puts a bounded chunks queue into the consumer queue before data
+        generation starts, so that a consumer task works alongside. Thanks to that,
+        only a few chunks are kept in memory at once. The chunks queue is always
+        closed with None, even when data generation fails.
+        """
+        chunks = queue.Queue(maxsize=self._STREAM_BUFFER_SIZE)
+        logger.fine("Putting data stream to consume to queue")
+        self._consumer_queue.put((config_id, mimeo_config, chunks))
+        try:
+            data = self.generate(mimeo_config, stringify=True,
+                                 processes=self._processes)
+            while chunk := list(islice(data, self._chunk_size)):
+                logger.fine("Putting data chunk to stream [%s]", config_id)
+                chunks.put(chunk)
+        finally:
+            chunks.put(None)
+
     def _stop_generate(
             self,
     ):
         """Stop a generator task."""
         logger.fine("Closing config generator")
-        for _ in range(self._consumer_workers):
-            self._consumer_queue.put((None, None, None))
         self._generator_queue.task_done()
 
     def _start_consume(
@@ -276,11 +360,14 @@ class Mimeograph:
             self,
             config_id: str,
             mimeo_config: MimeoConfig,
-            data: list,
+            data: list | queue.Queue,
     ):
         """Execute a consumer task."""
         try:
-            self.consume(mimeo_config, data)
+            if isinstance(data, queue.Queue):
+                self._consume_stream(mimeo_config, data)
+            else:
+                self.consume(mimeo_config, data)
         except Exception:
             self._failed_configs.append(config_id)
             logger.exception("An unexpected error occurred while consuming data "
@@ -288,6 +375,26 @@ class Mimeograph:
         finally:
             self._consumer_queue.task_done()
 
+    @staticmethod
+    def _consume_stream(
+            mimeo_config: MimeoConfig,
+            chunks: queue.Queue,
+    ):
+        """Consume data streamed in chunks.
+
+        All chunks are consumed by a single consumer to keep the data order.
+        When consumption fails, remaining chunks are discarded, so that data
+        generation is never blocked.
+        """
+        consumer = ConsumerFactory.get_consumer(mimeo_config)
+        stream = iter(chunks.get, None)
+        try:
+            for chunk in stream:
+                asyncio.run(consumer.consume(chunk))
+        finally:
+            for _ in stream:
+                pass
+
     def _stop_consume(
             self,
     ):
@@ -299,6 +406,7 @@ class Mimeograph:
     def process(
             cls,
             mimeo_config: MimeoConfig,
+            processes: int | None = None,
     ):
         """Process the Mimeo Configuration (generate data and consume).
 
@@ -306,8 +414,10 @@ class Mimeograph:
         ----------
         mimeo_config: MimeoConfig
             A Mimeo Configuration to process
+        processes: int | None, default None
+            A number of processes generating data
         """
-        data = cls.generate(mimeo_config, stringify=True)
+        data = cls.generate(mimeo_config, stringify=True, processes=processes)
         cls.consume(mimeo_config, data)
 
         logger.info("Data has been processed")
@@ -317,26 +427,43 @@ class Mimeograph:
             cls,
             mimeo_config: MimeoConfig,
             stringify: bool = False,
+            processes: int | None = None,
     ) -> Iterator[ElemTree.Element | dict | str]:
         """Generate data from the Mimeo Configuration.
 
+        When a number of processes is provided, data is generated in shards,
+        in a process pool. If the Mimeo Configuration cannot be sharded
+        (see ShardedGenerator), it is generated sequentially.
+
         Parameters
         ----------
         mimeo_config: MimeoConfig
             A Mimeo Configuration for data generation
         stringify: bool
             Indicate if data should be stringified
+        processes: int | None, default None
+            A number of processes generating data
 
         Returns
         -------
         Iterator[ElemTree.Element | dict | str]
             Iterator for generated data
         """
+        if processes is not None and processes > 1:
+            sharded_generator = ShardedGenerator(mimeo_config, processes)
+            if sharded_generator.is_shardable():
+                logger.info("Starting data generation in [%s] processes", processes)
+                yield from sharded_generator.generate(stringify)
+                return
+            logger.info("Mimeo Config cannot be sharded, generating data sequentially")
         generator = GeneratorFactory.get_generator(mimeo_config)
         logger.info("Starting data generation")
         with MimeoContextManager(mimeo_config):
-            for data in generator.generate(mimeo_config.templates):
-                yield data if not stringify else generator.stringify(data)
+            generator.retain_iterations(mimeo_config)
+            if stringify:
+                yield from generator.generate_stringified(mimeo_config.templates)
+            else:
+                yield from generator.generate(mimeo_config.templates)
 
     @classmethod
     def consume(
@@ -356,6 +483,28 @@ class Mimeograph:
         consumer = ConsumerFactory.get_consumer(mimeo_config)
         asyncio.run(consumer.consume(data))
 
+    @staticmethod
+    def _validate_positive_int(
+            param: str,
+            value: int,
+    ):
+        """Validate if a Mimeograph parameter is a positive integer.
+
+        Parameters
+        ----------
+        param : str
+            A Mimeograph parameter name
+        value : int
+            A provided parameter value
+
+        Raises
+        ------
+        InvalidMimeographParameterError
+            If the parameter value is lower than 1
+        """
+        if value < 1:
+            raise InvalidMimeographParameterError(param, value)
+
     @staticmethod
     def _get_max_num_of_workers():
         """Get a maximum number of ThreadPoolExecutor workers."""
@@ -38,10 +38,11 @@ import random
 import string
 from abc import ABCMeta, abstractmethod
 from datetime import date, datetime, timedelta
-from typing import Any
+from typing import Any, ClassVar
 
 from mimeo.context import MimeoContext, MimeoContextManager
 from mimeo.context.decorators import mimeo_context
+from mimeo.context.random_engines import RandomEngine, RandomEngineFactory
 from mimeo.database import Country, Currency, MimeoDB
 from mimeo.database.exc import DataNotFoundError, InvalidSexError
 from mimeo.utils.exc import InvalidValueError
@@ -56,8 +57,18 @@ class MimeoUtil(metaclass=ABCMeta):
     -------
     render
         Render a value.
+    render_in_context
+        Render a value in a specific Mimeo Context.
+    render_batch
+        Render a number of values at once.
+    is_batchable
+        Verify if values can be rendered ahead in batches.
     """
 
+    _RANDOM: ClassVar[random.Random] = random.Random()
+    _RANDOM_ENGINE: ClassVar[RandomEngine] = RandomEngineFactory.get_random_engine(
+        _RANDOM)
+
     @classmethod
     def __subclasshook__(
             cls,
@@ -91,6 +102,123 @@ class MimeoUtil(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    def render_in_context(
+            self,
+            context: MimeoContext,
+    ) -> Any:
+        """Render a value in a specific Mimeo Context.
+
+        It is used while generating data, when the current Mimeo Context is
+        already known, so it does not need to be looked up. By default, the context
+        is ignored and the value is rendered by the render() method.
+
+        Parameters
+        ----------
+        context : MimeoContext
+            A Mimeo Context to render the value in
+
+        Returns
+        -------
+        Any
+            A rendered value
+        """
+        return self.render()
+
+    def render_batch(
+            self,
+            num_of_values: int,
+    ) -> list:
+        """Render a number of values at once.
+
+        By default, values are rendered one by one with the render() method.
+        Mimeo Utils drawing independent random values override it to draw them
+        in bulk.
+
+        Parameters
+        ----------
+        num_of_values : int
+            A number of values to render
+
+        Returns
+        -------
+        list
+            Rendered values
+        """
+        return [self.render() for _ in range(num_of_values)]
+
+    def is_batchable(
+            self,
+    ) -> bool:
+        """Verify if values can be rendered ahead in batches.
+
+        Values can be rendered ahead only when they do not depend on a Mimeo
+        Context state (e.g. the current iteration or unique values consumed).
+        Thanks to that, generators can render them for a block of iterations
+        and take them in order.
+
+        Returns
+        -------
+        bool
+            False by default
+        """
+        return False
+
+    @classmethod
+    def _get_random(
+            cls,
+            context: MimeoContext | None = None,
+    ) -> random.Random:
+        """Get a random values generator.
+
+        Within data generation, it is a random values generator of the provided
+        or the current Mimeo Context. Otherwise, a generator shared by all Mimeo
+        Utils is used.
+
+        Parameters
+        ----------
+        context : MimeoContext | None, default None
+            A Mimeo Context to render values in, if already known
+
+        Returns
+        -------
+        random.Random
+            A random values generator
+        """
+        if context is not None:
+            return context.rng
+        mimeo_manager = MimeoContextManager()
+        if mimeo_manager.is_alive():
+            return mimeo_manager.get_random()
+        return cls._RANDOM
+
+    @classmethod
+    def _get_random_engine(
+            cls,
+            context: MimeoContext | None = None,
+    ) -> RandomEngine:
+        """Get a random engine drawing blocks of values.
+
+        Within data generation, it is a random engine of the provided or
+        the current Mimeo Context. Otherwise, an engine shared by all Mimeo Utils
+        is used.
+
+        Parameters
+        ----------
+        context : MimeoContext | None, default None
+            A Mimeo Context to render values in, if already known
+
+        Returns
+        -------
+        RandomEngine
+            A random engine
+        """
+        if context is not None:
+            return context.random_engine
+        mimeo_manager = MimeoContextManager()
+        if mimeo_manager.is_alive():
+            return mimeo_manager.get_random_engine()
+        return cls._RANDOM_ENGINE
+
 
 class RandomStringUtil(MimeoUtil):
     """A MimeoUtil implementation rendering a random string value.
@@ -99,6 +227,10 @@ class RandomStringUtil(MimeoUtil):
     -------
     render
         Render a random string value.
+    render_batch
+        Render a number of random string values at once.
+    is_batchable
+        Verify if values can be rendered ahead in batches.
 
     Attributes
     ----------
@@ -143,7 +275,50 @@ class RandomStringUtil(MimeoUtil):
             raise InvalidValueError(InvalidValueError.Code.ERR_1,
                                     util=self.KEY,
                                     length=self._length)
-        return "".join(random.choice(string.ascii_letters) for _ in range(self._length))
+        return "".join(self._get_random().choices(string.ascii_letters, k=self._length))
+
+    def render_batch(
+            self,
+            num_of_values: int,
+    ) -> list[str]:
+        """Render a number of random string values at once.
+
+        Characters of all values are drawn at once by a random engine.
+
+        Parameters
+        ----------
+        num_of_values : int
+            A number of values to render
+
+        Returns
+        -------
+        list[str]
+            Random string values
+
+        Raises
+        ------
+        InvalidValueError
+            If the length param is negative
+        """
+        if self._length < 0:
+            raise InvalidValueError(InvalidValueError.Code.ERR_1,
+                                    util=self.KEY,
+                                    length=self._length)
+        return self._get_random_engine().strings(string.ascii_letters,
+                                                 self._length,
+                                                 num_of_values)
+
+    def is_batchable(
+            self,
+    ) -> bool:
+        """Verify if values can be rendered ahead in batches.
+
+        Returns
+        -------
+        bool
+            Always True, as values are drawn independently
+        """
+        return True
 
 
 class RandomIntegerUtil(MimeoUtil):
@@ -153,6 +328,10 @@ class RandomIntegerUtil(MimeoUtil):
     -------
     render
         Render a random integer value.
+    render_batch
+        Render a number of random integer values at once.
+    is_batchable
+        Verify if values can be rendered ahead in batches.
 
     Attributes
     ----------
@@ -202,7 +381,49 @@ class RandomIntegerUtil(MimeoUtil):
                                     util=self.KEY,
                                     limit=self._limit,
                                     start=self._start)
-        return random.randrange(self._start, self._limit + 1)
+        return self._get_random().randrange(self._start, self._limit + 1)
+
+    def render_batch(
+            self,
+            num_of_values: int,
+    ) -> list[int]:
+        """Render a number of random integer values at once.
+
+        Parameters
+        ----------
+        num_of_values : int
+            A number of values to render
+
+        Returns
+        -------
+        list[int]
+            Random integer values
+
+        Raises
+        ------
+        InvalidValueError
+            If the limit param is lower than start
+        """
+        if self._start > self._limit:
+            raise InvalidValueError(InvalidValueError.Code.ERR_2,
+                                    util=self.KEY,
+                                    limit=self._limit,
+                                    start=self._start)
+        return self._get_random_engine().integers(self._start,
+                                                  self._limit + 1,
+                                                  num_of_values)
+
+    def is_batchable(
+            self,
+    ) -> bool:
+        """Verify if values can be rendered ahead in batches.
+
+        Returns
+        -------
+        bool
+            Always True, as values are drawn independently
+        """
+        return True
 
 
 class RandomItemUtil(MimeoUtil):
@@ -212,6 +433,10 @@ class RandomItemUtil(MimeoUtil):
     -------
     render
         Render a random item.
+    render_batch
+        Render a number of random items at once.
+    is_batchable
+        Verify if values can be rendered ahead in batches.
 
     Attributes
     ----------
@@ -248,7 +473,37 @@ class RandomItemUtil(MimeoUtil):
             A random item
         """
         length = len(self._items)
-        return self._items[random.randrange(0, length)]
+        return self._items[self._get_random().randrange(0, length)]
+
+    def render_batch(
+            self,
+            num_of_values: int,
+    ) -> list:
+        """Render a number of random items at once.
+
+        Parameters
+        ----------
+        num_of_values : int
+            A number of values to render
+
+        Returns
+        -------
+        list
+            Random items
+        """
+        return self._get_random_engine().choices(self._items, num_of_values)
+
+    def is_batchable(
+            self,
+    ) -> bool:
+        """Verify if values can be rendered ahead in batches.
+
+        Returns
+        -------
+        bool
+            Always True, as values are drawn independently
+        """
+        return True
 
 
 class PhoneUtil(MimeoUtil):
@@ -258,6 +513,10 @@ class PhoneUtil(MimeoUtil):
     -------
     render
         Render a phone number.
+    render_batch
+        Render a number of phone numbers at once.
+    is_batchable
+        Verify if values can be rendered ahead in batches.
 
     Attributes
     ----------
@@ -310,15 +569,67 @@ class PhoneUtil(MimeoUtil):
         str
             A phone number
         """
-        format_ = self._format.replace(
+        format_ = self._get_string_format()
+        digits_count = format_.count(self._STRING_FORMAT_PLACEHOLDER)
+        rng = self._get_random()
+        numbers = [rng.randrange(0, 10) for _ in range(digits_count)]
+        return format_.format(*numbers)
+
+    def render_batch(
+            self,
+            num_of_values: int,
+    ) -> list[str]:
+        """Render a number of phone numbers at once.
+
+        Digits of all phone numbers are drawn at once by a random engine.
+
+        Parameters
+        ----------
+        num_of_values : int
+            A number of values to render
+
+        Returns
+        -------
+        list[str]
+            Phone numbers
+        """
+        format_ = self._get_string_format()
+        digits_count = format_.count(self._STRING_FORMAT_PLACEHOLDER)
+        if digits_count == 0:
+            return [format_.format()] * num_of_values
+        digits = self._get_random_engine().strings(string.digits,
+                                                   digits_count,
+                                                   num_of_values)
+        return [format_.format(*phone_digits) for phone_digits in digits]
+
+    def is_batchable(
+            self,
+    ) -> bool:
+        """Verify if values can be rendered ahead in batches.
+
+        Returns
+        -------
+        bool
+            Always True, as values are drawn independently
+        """
+        return True
+
+    def _get_string_format(
+            self,
+    ) -> str:
+        """Get the phone number format with string format placeholders.
+
+        Returns
+        -------
+        str
+            A format with each digit placeholder replaced by {}
+        """
+        return self._format.replace(
             self._DIGIT_PLACEHOLDER_LOWER,
             self._STRING_FORMAT_PLACEHOLDER,
         ).replace(
             self._DIGIT_PLACEHOLDER_UPPER,
             self._STRING_FORMAT_PLACEHOLDER)
-        digits_count = format_.count(self._STRING_FORMAT_PLACEHOLDER)
-        numbers = [random.randrange(0, 10) for _ in range(digits_count)]
-        return format_.format(*numbers)
 
 
 class DateUtil(MimeoUtil):
@@ -439,6 +750,8 @@ class AutoIncrementUtil(MimeoUtil):
     -------
     render
         Render an auto incremented identifier.
+    render_in_context
+        Render an auto incremented identifier in a specific Mimeo Context.
 
     Attributes
     ----------
@@ -481,6 +794,33 @@ class AutoIncrementUtil(MimeoUtil):
         str
             An auto incremented identifier in a parametrized format
 
+        Raises
+        ------
+        InvalidValueError
+            If the pattern is not a string value
+        """
+        return self.render_in_context(context)
+
+    def render_in_context(
+            self,
+            context: MimeoContext,
+    ) -> str:
+        """Render an auto incremented identifier in a specific Mimeo Context.
+
+        The context's identifier is incremented and injected into the pattern.
+        When the pattern cannot be formatted, the identifier is decremented
+        back, so that no identifier is skipped.
+
+        Parameters
+        ----------
+        context : MimeoContext
+            A Mimeo Context to render the value in
+
+        Returns
+        -------
+        str
+            An auto incremented identifier in a parametrized format
+
         Raises
         ------
         InvalidValueError
@@ -508,6 +848,8 @@ class CurrentIterationUtil(MimeoUtil):
     -------
     render
         Render a current iteration ID.
+    render_in_context
+        Render a current iteration ID in a specific Mimeo Context.
 
     Attributes
     ----------
@@ -545,6 +887,28 @@ class CurrentIterationUtil(MimeoUtil):
         context : MimeoContext, default None
             A current Mimeo Context injected by a decorator
 
+        Returns
+        -------
+        int
+            A specific Mimeo Context's current iteration ID
+        """
+        return self.render_in_context(context)
+
+    def render_in_context(
+            self,
+            context: MimeoContext,
+    ) -> int:
+        """Render a current iteration ID in a specific Mimeo Context.
+
+        The ID is pulled from the current iteration of the context provided,
+        unless the context name is parametrized. Then, the current iteration
+        of THIS context is used.
+
+        Parameters
+        ----------
+        context : MimeoContext
+            A Mimeo Context to render the value in
+
         Returns
         -------
         int
@@ -566,6 +930,8 @@ class KeyUtil(MimeoUtil):
     -------
     render
         Render a unique identifier.
+    render_in_context
+        Render a unique identifier in a specific Mimeo Context.
 
     Attributes
     ----------
@@ -615,6 +981,28 @@ class KeyUtil(MimeoUtil):
         context : MimeoContext, default None
             A current Mimeo Context injected by a decorator
 
+        Returns
+        -------
+        str
+            A unique identifier
+        """
+        return self.render_in_context(context)
+
+    def render_in_context(
+            self,
+            context: MimeoContext,
+    ) -> str:
+        """Render a unique identifier in a specific Mimeo Context.
+
+        The identifier is pulled from the current iteration of the context
+        provided. A parametrized context name replaces the context, and
+        a parametrized iteration replaces its current iteration.
+
+        Parameters
+        ----------
+        context : MimeoContext
+            A Mimeo Context to render the value in
+
         Returns
         -------
         str
@@ -639,6 +1027,12 @@ class CityUtil(MimeoUtil):
     -------
     render
         Render a city name.
+    render_in_context
+        Render a city name in a specific Mimeo Context.
+    render_batch
+        Render a number of city names at once.
+    is_batchable
+        Verify if values can be rendered ahead in batches.
 
     Attributes
     ----------
@@ -692,6 +1086,36 @@ class CityUtil(MimeoUtil):
         str
             A city name
 
+        Raises
+        ------
+        OutOfStockError
+            If all unique cities have been consumed already
+        DataNotFoundError
+            If database does not contain any cities for the provided
+            `country`
+        """
+        return self.render_in_context(context)
+
+    def render_in_context(
+            self,
+            context: MimeoContext,
+    ) -> str:
+        """Render a city name in a specific Mimeo Context.
+
+        Unique city names are taken from indexes assigned to the context,
+        separately for every `country`. Non-unique city names are drawn
+        at random, so they do not consume the context's indexes.
+
+        Parameters
+        ----------
+        context : MimeoContext
+            A Mimeo Context to render the value in
+
+        Returns
+        -------
+        str
+            A city name
+
         Raises
         ------
         OutOfStockError
@@ -704,10 +1128,10 @@ class CityUtil(MimeoUtil):
             if self._unique:
                 index = context.next_city_index()
             else:
-                index = random.randrange(MimeoDB.NUM_OF_CITIES)
+                index = self._get_random(context).randrange(MimeoDB.NUM_OF_CITIES)
             city = self._MIMEO_DB.get_city_at(index)
         else:
-            country_cities = self._MIMEO_DB.get_cities_of(self._country)
+            country_cities = self._MIMEO_DB.get_cities_view_of(self._country)
             country_cities_count = len(country_cities)
             if country_cities_count == 0:
                 raise DataNotFoundError(DataNotFoundError.Code.ERR_2,
@@ -718,11 +1142,68 @@ class CityUtil(MimeoUtil):
             if self._unique:
                 index = context.next_city_index(self._country)
             else:
-                index = random.randrange(country_cities_count)
+                index = self._get_random(context).randrange(country_cities_count)
             city = country_cities[index]
 
         return city.name_ascii
 
+    def render_batch(
+            self,
+            num_of_values: int,
+    ) -> list[str]:
+        """Render a number of city names at once.
+
+        Extends MimeoUtil's implementation by drawing indexes of non-unique city
+        names in bulk.
+
+        Parameters
+        ----------
+        num_of_values : int
+            A number of values to render
+
+        Returns
+        -------
+        list[str]
+            City names
+
+        Raises
+        ------
+        OutOfStockError
+            If all unique cities have been consumed already
+        DataNotFoundError
+            If database does not contain any cities for the provided
+            `country`
+        """
+        if self._unique:
+            return super().render_batch(num_of_values)
+
+        random_engine = self._get_random_engine()
+        if self._country is None:
+            get_city_at = self._MIMEO_DB.get_city_at
+            indexes = random_engine.integers(0, MimeoDB.NUM_OF_CITIES, num_of_values)
+            return [get_city_at(index).name_ascii for index in indexes]
+
+        country_cities = self._MIMEO_DB.get_cities_view_of(self._country)
+        if len(country_cities) == 0:
+            raise DataNotFoundError(DataNotFoundError.Code.ERR_2,
+                                    data="city",
+                                    param_name="country",
+                                    param_val=self._country)
+        return [city.name_ascii
+                for city in random_engine.choices(country_cities, num_of_values)]
+
+    def is_batchable(
+            self,
+    ) -> bool:
+        """Verify if values can be rendered ahead in batches.
+
+        Returns
+        -------
+        bool
+            True if values are not unique. Otherwise, False.
+        """
+        return not self._unique
+
 
 class CountryUtil(MimeoUtil):
     """A MimeoUtil implementation rendering country details.
@@ -734,6 +1215,8 @@ class CountryUtil(MimeoUtil):
     -------
     render
         Render a country detail (name, ISO3 or ISO2 code).
+    render_in_context
+        Render a country detail (name, ISO3 or ISO2 code) in a specific Mimeo Context.
 
     Attributes
     ----------
@@ -800,6 +1283,38 @@ class CountryUtil(MimeoUtil):
         str
             A country detail
 
+        Raises
+        ------
+        InvalidValueError
+            If the `value` parameter value is not supported
+        OutOfStockError
+            If all unique countries have been consumed already
+        DataNotFoundError
+            If database does not contain the provided `country`
+        """
+        return self.render_in_context(context)
+
+    def render_in_context(
+            self,
+            context: MimeoContext,
+    ) -> str:
+        """Render a country detail in a specific Mimeo Context.
+
+        The detail (name, ISO3 code or ISO2 code) is taken from a country
+        matching the `country` parameter. When it is not parametrized,
+        the country is drawn at random, and it is unique across the context
+        unless the `unique` parameter is disabled.
+
+        Parameters
+        ----------
+        context : MimeoContext
+            A Mimeo Context to render the value in
+
+        Returns
+        -------
+        str
+            A country detail
+
         Raises
         ------
         InvalidValueError
@@ -825,12 +1340,7 @@ class CountryUtil(MimeoUtil):
             context: MimeoContext,
     ) -> Country:
         if self._country is not None:
-            countries = self._MIMEO_DB.get_countries()
-            country_found = next(
-                filter(lambda c: self._country in [c.name, c.iso_3, c.iso_2],
-                       countries),
-                None,
-            )
+            country_found = self._MIMEO_DB.get_country(self._country)
             if country_found is None:
                 raise DataNotFoundError(DataNotFoundError.Code.ERR_1,
                                         data="country",
@@ -840,7 +1350,7 @@ class CountryUtil(MimeoUtil):
         if self._unique:
             index = context.next_country_index()
         else:
-            index = random.randrange(MimeoDB.NUM_OF_COUNTRIES)
+            index = self._get_random(context).randrange(MimeoDB.NUM_OF_COUNTRIES)
         return self._MIMEO_DB.get_country_at(index)
 
 
@@ -854,6 +1364,8 @@ class CurrencyUtil(MimeoUtil):
     -------
     render
         Render a currency detail (code or name).
+    render_in_context
+        Render a currency detail (code or name) in a specific Mimeo Context.
 
     Attributes
     ----------
@@ -917,6 +1429,38 @@ class CurrencyUtil(MimeoUtil):
         str
             A currency code
 
+        Raises
+        ------
+        InvalidValueError
+            If the `value` parameter value is not supported
+        OutOfStockError
+            If all unique currencies have been consumed already
+        DataNotFoundError
+            If database does not contain a currency of the provided `country`
+        """
+        return self.render_in_context(context)
+
+    def render_in_context(
+            self,
+            context: MimeoContext,
+    ) -> str:
+        """Render a currency detail in a specific Mimeo Context.
+
+        The detail (code or name) is taken from a currency being used in
+        the parametrized `country`. Otherwise, the currency is drawn at random,
+        and it is unique across the context only when the `unique` parameter
+        is enabled.
+
+        Parameters
+        ----------
+        context : MimeoContext
+            A Mimeo Context to render the value in
+
+        Returns
+        -------
+        str
+            A currency detail
+
         Raises
         ------
         InvalidValueError
@@ -943,7 +1487,7 @@ class CurrencyUtil(MimeoUtil):
             if self._unique:
                 index = context.next_currency_index()
             else:
-                index = random.randrange(MimeoDB.NUM_OF_CURRENCIES)
+                index = self._get_random(context).randrange(MimeoDB.NUM_OF_CURRENCIES)
             currency = self._MIMEO_DB.get_currency_at(index)
         else:
             currency = self._MIMEO_DB.get_currency_of(self._country)
@@ -965,6 +1509,12 @@ class FirstNameUtil(MimeoUtil):
     -------
     render
         Render a first name.
+    render_in_context
+        Render a first name in a specific Mimeo Context.
+    render_batch
+        Render a number of first names at once.
+    is_batchable
+        Verify if values can be rendered ahead in batches.
 
     Attributes
     ----------
@@ -1018,6 +1568,35 @@ class FirstNameUtil(MimeoUtil):
         str
             A first name
 
+        Raises
+        ------
+        OutOfStockError
+            If all unique first names have been consumed already
+        InvalidSexError
+            If the `sex` parameter value is not supported
+        """
+        return self.render_in_context(context)
+
+    def render_in_context(
+            self,
+            context: MimeoContext,
+    ) -> str:
+        """Render a first name in a specific Mimeo Context.
+
+        Unique forenames are taken from indexes assigned to the context,
+        separately for every `sex`. Non-unique forenames are drawn at random,
+        so they do not consume the context's indexes.
+
+        Parameters
+        ----------
+        context : MimeoContext
+            A Mimeo Context to render the value in
+
+        Returns
+        -------
+        str
+            A first name
+
         Raises
         ------
         OutOfStockError
@@ -1029,7 +1608,7 @@ class FirstNameUtil(MimeoUtil):
             if self._unique:
                 index = context.next_first_name_index()
             else:
-                index = random.randrange(MimeoDB.NUM_OF_FIRST_NAMES)
+                index = self._get_random(context).randrange(MimeoDB.NUM_OF_FIRST_NAMES)
             first_name = self.__MIMEO_DB.get_first_name_at(index)
         else:
             first_name_for_sex = self.__MIMEO_DB.get_first_names_by_sex(self._sex)
@@ -1038,11 +1617,62 @@ class FirstNameUtil(MimeoUtil):
             if self._unique:
                 index = context.next_first_name_index(self._sex)
             else:
-                index = random.randrange(first_name_for_sex_count)
+                index = self._get_random(context).randrange(first_name_for_sex_count)
             first_name = first_name_for_sex[index]
 
         return first_name.name
 
+    def render_batch(
+            self,
+            num_of_values: int,
+    ) -> list[str]:
+        """Render a number of first names at once.
+
+        Extends MimeoUtil's implementation by drawing indexes of non-unique first
+        names in bulk.
+
+        Parameters
+        ----------
+        num_of_values : int
+            A number of values to render
+
+        Returns
+        -------
+        list[str]
+            First names
+
+        Raises
+        ------
+        OutOfStockError
+            If all unique first names have been consumed already
+        """
+        if self._unique:
+            return super().render_batch(num_of_values)
+
+        random_engine = self._get_random_engine()
+        if self._sex is None:
+            get_first_name_at = self.__MIMEO_DB.get_first_name_at
+            indexes = random_engine.integers(0, MimeoDB.NUM_OF_FIRST_NAMES,
+                                             num_of_values)
+            return [get_first_name_at(index).name for index in indexes]
+
+        first_name_for_sex = self.__MIMEO_DB.get_first_names_by_sex(self._sex)
+        return [first_name.name
+                for first_name in random_engine.choices(first_name_for_sex,
+                                                        num_of_values)]
+
+    def is_batchable(
+            self,
+    ) -> bool:
+        """Verify if values can be rendered ahead in batches.
+
+        Returns
+        -------
+        bool
+            True if values are not unique. Otherwise, False.
+        """
+        return not self._unique
+
     @classmethod
     def _standardize_sex(
             cls,
@@ -1067,6 +1697,12 @@ class LastNameUtil(MimeoUtil):
     -------
     render
         Render a last name.
+    render_in_context
+        Render a last name in a specific Mimeo Context.
+    render_batch
+        Render a number of last names at once.
+    is_batchable
+        Verify if values can be rendered ahead in batches.
 
     Attributes
     ----------
@@ -1087,7 +1723,7 @@ class LastNameUtil(MimeoUtil):
         Parameters
         ----------
         unique : bool, default True
-            Indicates if rendered forenames will be unique across
+            Indicates if rendered surnames will be unique across
             a Mimeo Context
         kwargs : dict
             Arbitrary keyword arguments (ignored)
@@ -1101,7 +1737,7 @@ class LastNameUtil(MimeoUtil):
     ) -> str:
         """Render a last name.
 
-        By default, First Name Mimeo Util generates a unique surname
+        By default, Last Name Mimeo Util generates a unique surname
         across a Mimeo Context.
 
         Parameters
@@ -1114,13 +1750,84 @@ class LastNameUtil(MimeoUtil):
         str
             A last name
 
+        Raises
+        ------
+        OutOfStockError
+            If all unique last names have been consumed already
+        """
+        return self.render_in_context(context)
+
+    def render_in_context(
+            self,
+            context: MimeoContext,
+    ) -> str:
+        """Render a last name in a specific Mimeo Context.
+
+        Unique surnames are taken from last names' indexes assigned to
+        the context. Non-unique surnames are drawn at random, so they do not
+        consume the context's indexes.
+
+        Parameters
+        ----------
+        context : MimeoContext
+            A Mimeo Context to render the value in
+
+        Returns
+        -------
+        str
+            A last name
+
         Raises
         ------
         OutOfStockError
             If all unique last names have been consumed already
         """
         if self._unique:
-            index = context.next_first_name_index()
+            index = context.next_last_name_index()
         else:
-            index = random.randrange(MimeoDB.NUM_OF_FIRST_NAMES)
+            index = self._get_random(context).randrange(MimeoDB.NUM_OF_LAST_NAMES)
         return self.__MIMEO_DB.get_last_name_at(index)
+
+    def render_batch(
+            self,
+            num_of_values: int,
+    ) -> list[str]:
+        """Render a number of last names at once.
+
+        Extends MimeoUtil's implementation by drawing indexes of non-unique last
+        names in bulk.
+
+        Parameters
+        ----------
+        num_of_values : int
+            A number of values to render
+
+        Returns
+        -------
+        list[str]
+            Last names
+
+        Raises
+        ------
+        OutOfStockError
+            If all unique last names have been consumed already
+        """
+        if self._unique:
+            return super().render_batch(num_of_values)
+
+        get_last_name_at = self.__MIMEO_DB.get_last_name_at
+        indexes = self._get_random_engine().integers(0, MimeoDB.NUM_OF_LAST_NAMES,
+                                                     num_of_values)
+        return [get_last_name_at(index) for index in indexes]
+
+    def is_batchable(
+            self,
+    ) -> bool:
+        """Verify if values can be rendered ahead in batches.
+
+        Returns
+        -------
+        bool
+            True if values are not unique. Otherwise, False.
+        """
+        return not self._unique
@@ -12,6 +12,10 @@ the following renderers:
         A class rendering Mimeo Refs.
     * SpecialFieldsRenderer
         A class rendering Mimeo Special Fields.
+
+It exports also a class representing a parsed string value:
+    * StringTemplate
+        A class representing a string value parsed into placeholders.
 """
 from __future__ import annotations
 
@@ -22,6 +26,8 @@ from typing import Any, ClassVar, Pattern
 from mimeo.config import constants as cc
 from mimeo.context import MimeoContext, MimeoContextManager
 from mimeo.context.decorators import mimeo_context
+from mimeo.context.exc import VarNotFoundError
+from mimeo.meta import LRUCache
 from mimeo.utils import (AutoIncrementUtil, CityUtil, CountryUtil,
                          CurrencyUtil, CurrentIterationUtil, DateTimeUtil,
                          DateUtil, FirstNameUtil, KeyUtil, LastNameUtil,
@@ -43,6 +49,10 @@ class UtilsRenderer:
         Render a Mimeo Util in a raw form.
     render_parametrized(mimeo_util_config: dict) -> Any
         Render a Mimeo Util in a parametrized form.
+    create_mimeo_util(config: dict) -> MimeoUtil
+        Instantiate a Mimeo Util based on the configuration.
+    get_mimeo_util_name(config: dict) -> str
+        Return a verified Mimeo Util name.
     """
 
     MIMEO_UTILS: ClassVar[dict] = {
@@ -61,7 +71,7 @@ class UtilsRenderer:
         FirstNameUtil.KEY: FirstNameUtil,
         LastNameUtil.KEY: LastNameUtil,
     }
-    _INSTANCES: ClassVar[dict] = {}
+    _INSTANCES: ClassVar[LRUCache] = LRUCache(1_000)
 
     @classmethod
     def render_raw(
@@ -128,9 +138,12 @@ class UtilsRenderer:
     ) -> MimeoUtil:
         """Get a Mimeo Util instance based on the configuration.
 
-        All instances are cached to not re-create a Util with the same
-        parameters. This method instantiate a Mimeo Util for the first
-        time and use the one in the future.
+        Instances are cached to not re-create a Util with the same
+        parameters. Within data generation, the cache of the current
+        MimeoContextManager is used, so it is scoped to a single Mimeo
+        Configuration processing. Otherwise, a cache shared by all renderings
+        is used. Both caches are bounded and evict the least recently used
+        instances.
 
         Parameters
         ----------
@@ -149,10 +162,16 @@ class UtilsRenderer:
             Util name, or the parametrized name does not match any
             existing Mimeo Util.
         """
+        mimeo_manager = MimeoContextManager()
+        cache = (mimeo_manager.get_utils_cache()
+                 if mimeo_manager.is_alive()
+                 else cls._INSTANCES)
         cache_key = cls._generate_cache_key(config)
-        if cache_key not in cls._INSTANCES:
-            return cls._instantiate_mimeo_util(cache_key, config)
-        return cls._INSTANCES.get(cache_key)
+        mimeo_util = cache.get(cache_key)
+        if mimeo_util is None:
+            mimeo_util = cls.create_mimeo_util(config)
+            cache.put(cache_key, mimeo_util)
+        return mimeo_util
 
     @staticmethod
     def _generate_cache_key(
@@ -176,19 +195,16 @@ class UtilsRenderer:
         return "-".join(":".join([key, str(val)]) for key, val in config.items())
 
     @classmethod
-    def _instantiate_mimeo_util(
+    def create_mimeo_util(
             cls,
-            cache_key: str,
             config: dict,
     ) -> MimeoUtil:
         """Instantiate a Mimeo Util based on the configuration.
 
-        After instantiation the Mimeo Util is cached for the future.
+        The Mimeo Util is not cached.
 
         Parameters
         ----------
-        cache_key : str
-            An internal Mimeo Util cache key
         config : dict
             A Mimeo Util configuration
 
@@ -206,9 +222,7 @@ class UtilsRenderer:
         """
         mimeo_util_name = cls.get_mimeo_util_name(config)
         config = cls._adjust_built_in_names(config)
-        mimeo_util = cls.MIMEO_UTILS.get(mimeo_util_name)(**config)
-        cls._INSTANCES[cache_key] = mimeo_util
-        return mimeo_util
+        return cls.MIMEO_UTILS.get(mimeo_util_name)(**config)
 
     @classmethod
     def get_mimeo_util_name(
@@ -391,6 +405,103 @@ class SpecialFieldsRenderer:
         return context.curr_iteration().get_special_field(field)
 
 
+class StringTemplate:
+    """A class representing a string value parsed into placeholders.
+
+    A string value is split into literal segments and placeholders (Mimeo Special
+    Fields and Mimeo Vars) once, so it can be rendered in a single pass.
+
+    Attributes
+    ----------
+    value : str
+        A source string value
+    segments : list[str]
+        Literal segments surrounding placeholders (one more than placeholders)
+    placeholders : list[str]
+        Wrapped placeholders in order of appearance, e.g. {:Field:} or {VAR}
+    special_fields : list[str]
+        Distinct wrapped special fields in order of rendering
+    vars : list[str]
+        Distinct wrapped vars in order of rendering
+    is_raw_mimeo_util : bool
+        A flag indicating if the value is a raw Mimeo Util
+    is_ambiguous : bool
+        A flag indicating if literal segments contain curly braces, so
+        placeholders could be formed only after rendering
+    """
+
+    def __init__(
+            self,
+            value: str,
+            segments: list[str],
+            placeholders: list[str],
+            rendering_order: list[str],
+            is_raw_mimeo_util: bool,
+    ):
+        """Initialize StringTemplate class.
+
+        Parameters
+        ----------
+        value : str
+            A source string value
+        segments : list[str]
+            Literal segments surrounding placeholders
+        placeholders : list[str]
+            Wrapped placeholders in order of appearance
+        rendering_order : list[str]
+            Distinct wrapped placeholders in order of rendering
+        is_raw_mimeo_util : bool
+            A flag indicating if the value is a raw Mimeo Util
+        """
+        self.value: str = value
+        self.segments: list[str] = segments
+        self.placeholders: list[str] = placeholders
+        self.special_fields: list[str] = [placeholder
+                                          for placeholder in rendering_order
+                                          if placeholder.startswith("{:")]
+        self.vars: list[str] = [placeholder
+                                for placeholder in rendering_order
+                                if not placeholder.startswith("{:")]
+        self.is_raw_mimeo_util: bool = is_raw_mimeo_util
+        self.is_ambiguous: bool = any("{" in segment for segment in segments)
+
+    def is_single_placeholder(
+            self,
+    ) -> bool:
+        """Verify if the value consists of a single placeholder only.
+
+        Returns
+        -------
+        bool
+            True if the value is a single placeholder. Otherwise, False.
+        """
+        return len(self.placeholders) == 1 and self.segments == ["", ""]
+
+    def substitute(
+            self,
+            values: dict[str, str],
+    ) -> str:
+        """Substitute placeholders with their stringified values.
+
+        Placeholders without a value provided are left as they are.
+
+        Parameters
+        ----------
+        values : dict[str, str]
+            Stringified values of placeholders
+
+        Returns
+        -------
+        str
+            A string value with placeholders substituted
+        """
+        parts = [self.segments[0]]
+        for placeholder, segment in zip(self.placeholders, self.segments[1:]):
+            parts.append(values.get(placeholder, placeholder))
+            parts.append(segment)
+        return "".join(parts)
+
+
 class MimeoRenderer:
     """A Facade class rendering Mimeo Utils, Vars and Special Fields.
 
@@ -408,10 +519,35 @@ class MimeoRenderer:
         Verify if the value is a raw Mimeo Util.
     is_parametrized_mimeo_util(value: dict)
         Verify if the value is a parametrized Mimeo Util.
+    is_reference(value: str) -> bool
+        Verify if the value is a Mimeo Reference.
+    has_special_field(value: str) -> bool
+        Verify if the value contains a Mimeo Special Field.
+    has_var(value: str) -> bool
+        Verify if the value contains a Mimeo Var.
+    parse(value: str) -> StringTemplate
+        Parse a string value into placeholders.
+    render_template(template: StringTemplate) -> Any
+        Render a parsed string value.
+    propagate_vars(value: str) -> Any
+        Substitute Mimeo Vars bound to literals.
+    render_special_field(value: str) -> Any
+        Render a value containing a Mimeo Special Field.
+    render_var(value: str) -> Any
+        Render a value containing a Mimeo Var.
+    render_reference(value: str) -> Any
+        Render a Mimeo Ref.
+    render_raw_mimeo_util(value: str) -> Any
+        Render a raw Mimeo Util.
+    render_parametrized_mimeo_util(value: dict) -> Any
+        Render a parametrized Mimeo Util.
     """
 
     _VARS_PATTERN: Pattern = re.compile(".*({[A-Z_0-9]+})")
     _SPECIAL_FIELDS_PATTERN: Pattern = re.compile(".*({:([a-zA-Z]+:)?[-_a-zA-Z0-9]+:})")
+    _PLACEHOLDERS_PATTERN: Pattern = re.compile(
+        "{:(?:[a-zA-Z]+:)?[-_a-zA-Z0-9]+:}|{[A-Z_0-9]+}")
+    _TEMPLATES: ClassVar[LRUCache] = LRUCache(10_000)
 
     @classmethod
     def get_special_field_name(
@@ -522,11 +658,49 @@ class MimeoRenderer:
         bool
             True if the value is a Mimeo Reference. Otherwise, False.
         """
-        reference_names = MimeoContextManager().get_ref_names()
-        if len(reference_names) == 0:
-            return False
-        reference_re = "^{(" + "|".join(reference_names) + ")}$"
-        return bool(re.match(reference_re, value))
+        return (value.startswith("{") and
+                value.endswith("}") and
+                MimeoContextManager().has_ref(value[1:][:-1]))
+
+    @classmethod
+    def has_special_field(
+            cls,
+            value: str,
+    ) -> bool:
+        """Verify if the value contains a Mimeo Special Field.
+
+        Parameters
+        ----------
+        value : str
+            A string value
+
+        Returns
+        -------
+        bool
+            True if the value contains a Mimeo Special Field, e.g. {:Field:}.
+            Otherwise, False.
+        """
+        return bool(cls._SPECIAL_FIELDS_PATTERN.match(value))
+
+    @classmethod
+    def has_var(
+            cls,
+            value: str,
+    ) -> bool:
+        """Verify if the value contains a Mimeo Var.
+
+        Parameters
+        ----------
+        value : str
+            A string value
+
+        Returns
+        -------
+        bool
+            True if the value contains a Mimeo Var, e.g. {VAR}.
+            Otherwise, False.
+        """
+        return bool(cls._VARS_PATTERN.match(value))
 
     @classmethod
     def render(
@@ -587,7 +761,7 @@ class MimeoRenderer:
             if isinstance(value, str):
                 value = cls._render_string_value(value)
             if cls.is_parametrized_mimeo_util(value):
-                value = cls._render_parametrized_mimeo_util(value)
+                value = cls.render_parametrized_mimeo_util(value)
         except Exception:
             logger.exception("An error occurred for [%s].", value)
             raise
@@ -613,26 +787,302 @@ class MimeoRenderer:
         Any
             A rendered value
         """
-        if cls._SPECIAL_FIELDS_PATTERN.match(value):
-            return cls._render_special_field(value)
-        if cls._VARS_PATTERN.match(value):
-            return cls._render_var(value)
-        if cls.is_raw_mimeo_util(value):
-            return cls._render_raw_mimeo_util(value)
+        if "{" not in value:
+            return value
+        return cls.render_template(cls.parse(value))
+
+    @classmethod
+    def parse(
+            cls,
+            value: str,
+    ) -> StringTemplate:
+        """Parse a string value into placeholders.
+
+        Recently parsed values are cached, so a string value is parsed once
+        as long as it is used frequently.
+        Only placeholders in the first line are recognized, but all their
+        occurrences are substituted while rendering.
+
+        Parameters
+        ----------
+        value : str
+            A string value
+
+        Returns
+        -------
+        StringTemplate
+            A parsed string value
+        """
+        template = cls._TEMPLATES.get(value)
+        if template is not None:
+            return template
+
+        first_line_end = value.find("\n")
+        if first_line_end == -1:
+            first_line_end = len(value)
+        matches = list(cls._PLACEHOLDERS_PATTERN.finditer(value))
+        last_positions = {match.group(): match.start()
+                          for match in matches
+                          if match.start() < first_line_end}
+        segments = []
+        placeholders = []
+        position = 0
+        for match in matches:
+            if match.group() in last_positions:
+                segments.append(value[position:match.start()])
+                placeholders.append(match.group())
+                position = match.end()
+        segments.append(value[position:])
+        rendering_order = sorted(last_positions,
+                                 key=last_positions.get,
+                                 reverse=True)
+        template = StringTemplate(
+            value=value,
+            segments=segments,
+            placeholders=placeholders,
+            rendering_order=rendering_order,
+            is_raw_mimeo_util=cls.is_raw_mimeo_util(value))
+        cls._TEMPLATES.put(value, template)
+        return template
+
+    @classmethod
+    def render_template(
+            cls,
+            template: StringTemplate,
+    ) -> Any:
+        """Render a parsed string value.
+
+        Special fields are rendered before vars, and each of them only once.
+        A value being a single placeholder is rendered to the placeholder's value.
+        Otherwise, all placeholders are substituted with stringified values
+        in a single pass.
+
+        Parameters
+        ----------
+        template : StringTemplate
+            A parsed string value
+
+        Returns
+        -------
+        Any
+            A rendered value
+
+        Raises
+        ------
+        InstanceNotAliveError
+            If the MimeoContextManager instance is not alive
+        UninitializedContextIterationError
+            If no iteration has been initialized yet for the context
+        SpecialFieldNotFoundError
+            If the special field does not exist.
+        VarNotFoundError
+            If the Mimeo Var does not exist
+        """
+        value = template.value
+        if template.special_fields or template.vars:
+            if template.is_ambiguous:
+                return (cls._render_last_special_field(value)
+                        if template.special_fields
+                        else cls._render_last_var(value))
+            if template.is_single_placeholder():
+                return cls.render(cls._render_placeholder(template.placeholders[0]))
+            return cls._interpolate(template)
+        if template.is_raw_mimeo_util:
+            return cls.render_raw_mimeo_util(value)
         if cls.is_reference(value):
-            return cls._render_reference(value)
+            return cls.render_reference(value)
         return value
 
     @classmethod
-    def _render_special_field(
+    def _interpolate(
+            cls,
+            template: StringTemplate,
+    ) -> str:
+        """Substitute all placeholders of a parsed string value.
+
+        When a placeholder's value is empty, or contains curly braces or a new
+        line, it could change remaining placeholders. In such case, the value
+        substituted so far is rendered from scratch.
+
+        Parameters
+        ----------
+        template : StringTemplate
+            A parsed string value
+
+        Returns
+        -------
+        str
+            A rendered value
+        """
+        values = {}
+        for placeholder in template.special_fields + template.vars:
+            r_val = cls._render_placeholder(placeholder)
+            r_val = str(r_val).lower() if isinstance(r_val, bool) else str(r_val)
+            values[placeholder] = r_val
+            if not r_val or "{" in r_val or "\n" in r_val:
+                return cls.render(template.substitute(values))
+        return template.substitute(values)
+
+    @classmethod
+    def _render_placeholder(
+            cls,
+            placeholder: str,
+    ) -> Any:
+        """Render a single placeholder.
+
+        Parameters
+        ----------
+        placeholder : str
+            A wrapped special field or var
+
+        Returns
+        -------
+        Any
+            A special field value or a var value (with a parametrized
+            Mimeo Util rendered)
+        """
+        if placeholder.startswith("{:"):
+            r_val = SpecialFieldsRenderer.render(placeholder[2:][:-2])
+            logger.fine("Rendered special field value [%s]", r_val)
+            return r_val
+
+        r_val = VarsRenderer.render(placeholder[1:][:-1])
+        logger.fine("Rendered variable value [%s]", r_val)
+        if cls.is_parametrized_mimeo_util(r_val):
+            r_val = cls.render_parametrized_mimeo_util(r_val)
+        return r_val
+
+    @classmethod
+    def propagate_vars(
+            cls,
+            value: str,
+    ) -> Any:
+        """Substitute Mimeo Vars bound to literals.
+
+        Mimeo Vars are fixed for a whole Mimeo Configuration, so the ones
+        resolving to literals can be substituted once, while compiling
+        a Mimeo Template. When a value contains such vars only, it is rendered
+        completely. Otherwise, literal vars are substituted, and the remaining
+        placeholders are left to be rendered in every iteration. Vars bound to
+        Mimeo Utils (directly or through other vars) are always left as they are.
+        When any literal var is empty, or contains curly braces or a new line,
+        its substitution could change remaining placeholders, so the value
+        is left untouched.
+
+        Parameters
+        ----------
+        value : str
+            A string value
+
+        Returns
+        -------
+        Any
+            A value with literal vars substituted or a rendered value
+
+        Raises
+        ------
+        InstanceNotAliveError
+            If the MimeoContextManager instance is not alive
+        """
+        template = cls.parse(value)
+        if template.is_ambiguous or not template.vars:
+            return value
+
+        literal_vars = [var for var in template.vars
+                        if cls._is_literal_var(var[1:][:-1], frozenset())]
+        if not template.special_fields and len(literal_vars) == len(template.vars):
+            return cls.render_template(template)
+
+        values = {}
+        for var in literal_vars:
+            r_val = cls._render_placeholder(var)
+            r_val = str(r_val).lower() if isinstance(r_val, bool) else str(r_val)
+            if not r_val or any(char in r_val for char in "{}\n"):
+                return value
+            values[var] = r_val
+        return template.substitute(values) if values else value
+
+    @classmethod
+    def _is_literal_var(
+            cls,
+            var: str,
+            visited: frozenset[str],
+    ) -> bool:
+        """Verify if a Mimeo Var resolves to a literal.
+
+        A var resolves to a literal when its value is atomic and does not
+        contain any placeholder, or it consists of literal vars only.
+
+        Parameters
+        ----------
+        var : str
+            A variable name
+        visited : frozenset[str]
+            Names of vars referring to this one
+
+        Returns
+        -------
+        bool
+            True if the var resolves to a literal. Otherwise, False.
+        """
+        try:
+            var_value = MimeoContextManager().get_var(var)
+        except VarNotFoundError:
+            return False
+        if cls.is_parametrized_mimeo_util(var_value):
+            return False
+        if not isinstance(var_value, str) or "{" not in var_value:
+            return True
+        if var in visited:
+            return False
+
+        template = cls.parse(var_value)
+        return (not template.special_fields and
+                not template.is_ambiguous and
+                len(template.vars) > 0 and
+                all(cls._is_literal_var(nested_var[1:][:-1], visited | {var})
+                    for nested_var in template.vars))
+
+    @classmethod
+    def render_special_field(
             cls,
             value: str,
     ) -> Any:
         """Render a value containing a Mimeo Special Field.
 
-        This method finds first special field and replaces all
+        The value is parsed once and all its special fields and vars are
+        rendered in a single pass.
+
+        Parameters
+        ----------
+        value : str
+            A value containing a Mimeo Special Field
+
+        Returns
+        -------
+        Any
+            A rendered value
+
+        Raises
+        ------
+        UninitializedContextIterationError
+            If no iteration has been initialized yet for the context
+        SpecialFieldNotFoundError
+            If the special field does not exist.
+        """
+        return cls.render_template(cls.parse(value))
+
+    @classmethod
+    def _render_last_special_field(
+            cls,
+            value: str,
+    ) -> Any:
+        """Render the last Mimeo Special Field of a value.
+
+        This method finds the last special field and replaces all
         occurrences. Then the result is passed to the render() method
-        again, to return a final value.
+        again, to return a final value. It is used for values, which
+        placeholders could be formed only after rendering.
 
         Parameters
         ----------
@@ -661,15 +1111,44 @@ class MimeoRenderer:
         return cls.render(r_val)
 
     @classmethod
-    def _render_var(
+    def render_var(
             cls,
             value: str,
     ) -> Any:
         """Render a value containing a Mimeo Var.
 
-        This method finds first variable and replaces all occurrences.
+        The value is parsed once and all its vars are rendered in a single pass.
+
+        Parameters
+        ----------
+        value : str
+            A value containing a Mimeo Var
+
+        Returns
+        -------
+        Any
+            A rendered value
+
+        Raises
+        ------
+        InstanceNotAliveError
+            If the MimeoContextManager instance is not alive
+        VarNotFoundError
+            If the Mimeo Var with the `var` provided does not exist
+        """
+        return cls.render_template(cls.parse(value))
+
+    @classmethod
+    def _render_last_var(
+            cls,
+            value: str,
+    ) -> Any:
+        """Render the last Mimeo Var of a value.
+
+        This method finds the last variable and replaces all occurrences.
         Then the result is passed to the render() method again, to
-        return a final value.
+        return a final value. It is used for values, which placeholders
+        could be formed only after rendering.
 
         Parameters
         ----------
@@ -693,14 +1172,14 @@ class MimeoRenderer:
         r_val = VarsRenderer.render(wrapped_var[1:][:-1])
         logger.fine("Rendered variable value [%s]", r_val)
         if cls.is_parametrized_mimeo_util(r_val):
-            r_val = cls._render_parametrized_mimeo_util(r_val)
+            r_val = cls.render_parametrized_mimeo_util(r_val)
         if len(wrapped_var) != len(value):
             r_val = str(r_val).lower() if isinstance(r_val, bool) else str(r_val)
             r_val = value.replace(wrapped_var, str(r_val))
         return cls.render(r_val)
 
     @classmethod
-    def _render_reference(
+    def render_reference(
             cls,
             value: str,
     ) -> Any:
@@ -732,7 +1211,7 @@ class MimeoRenderer:
         return cls.render(rendered_value)
 
     @classmethod
-    def _render_raw_mimeo_util(
+    def render_raw_mimeo_util(
             cls,
             value: str,
     ) -> Any:
@@ -759,7 +1238,7 @@ class MimeoRenderer:
         return cls.render(rendered_value)
 
     @classmethod
-    def _render_parametrized_mimeo_util(
+    def render_parametrized_mimeo_util(
             cls,
             value: dict,
     ) -> Any:
@@ -2094,3 +2094,29 @@ def test_logging_mode_fine():
     mimeo_cli.main()
 
     assert logger.getEffectiveLevel() == logging.FINE
+
+
+@pytest.mark.parametrize("chunk_size", ["0", "-1", "abc"])
+def test_non_positive_chunk_size(capsys, chunk_size):
+    sys.argv = ["mimeo", "test_mimeo_cli-dir/default-config.json",
+                "--chunk-size", chunk_size]
+
+    with pytest.raises(SystemExit):
+        mimeo_cli.main()
+
+    _, err = capsys.readouterr()
+    assert (f"argument --chunk-size: invalid positive int value: '{chunk_size}'"
+            in err)
+
+
+@pytest.mark.parametrize("generators", ["0", "-1", "abc"])
+def test_non_positive_generators(capsys, generators):
+    sys.argv = ["mimeo", "test_mimeo_cli-dir/default-config.json",
+                "--generators", generators]
+
+    with pytest.raises(SystemExit):
+        mimeo_cli.main()
+
+    _, err = capsys.readouterr()
+    assert (f"argument --generators: invalid positive int value: '{generators}'"
+            in err)
@@ -1,6 +1,7 @@
 from mimeo.config import MimeoConfigFactory
 from mimeo.config.exc import (InvalidMimeoConfigError, InvalidRefsError,
-                              InvalidVarsError, UnsupportedPropertyValueError)
+                              InvalidSeedError, InvalidVarsError,
+                              UnsupportedPropertyValueError)
 from tests.utils import assert_throws
 
 
@@ -116,6 +117,28 @@ def test_parsing_config_default():
     assert mimeo_config.output.direction == "file"
     assert mimeo_config.output.directory_path == "mimeo-output"
     assert mimeo_config.output.file_name == "mimeo-output-{}.xml"
+    assert mimeo_config.seed is None
+
+
+def test_parsing_config_with_seed():
+    config = {
+        "seed": 42,
+        "_templates_": [],
+    }
+
+    mimeo_config = MimeoConfigFactory.parse(config)
+    assert mimeo_config.seed == 42
+
+
+@assert_throws(err_type=InvalidSeedError,
+               msg="Provided seed [{seed}] is not an integer!",
+               seed="abc")
+def test_parsing_config_with_invalid_seed():
+    config = {
+        "seed": "abc",
+        "_templates_": [],
+    }
+    MimeoConfigFactory.parse(config)
 
 
 @assert_throws(err_type=InvalidMimeoConfigError,
@@ -337,6 +360,53 @@ def test_parsing_config_invalid_refs_missing_details():
     MimeoConfigFactory.parse(config)
 
 
+@assert_throws(err_type=InvalidRefsError,
+               msg="A reference's capacity needs to be a positive integer and can be "
+                   "configured only for 'any' refs. Please fix following refs: "
+                   "[{refs}]",
+               refs="custom_ref_1, custom_ref_2, custom_ref_3")
+def test_parsing_config_invalid_refs_capacity():
+    config = {
+        "refs": {
+            "custom_ref_1": {
+                "context": "SomeEntity",
+                "field": "ChildNode",
+                "type": "any",
+                "capacity": 0,
+            },
+            "custom_ref_2": {
+                "context": "SomeEntity",
+                "field": "ChildNode",
+                "type": "any",
+                "capacity": "10",
+            },
+            "custom_ref_3": {
+                "context": "SomeEntity",
+                "field": "ChildNode",
+                "type": "parallel",
+                "capacity": 10,
+            },
+            "custom_ref_4": {
+                "context": "SomeEntity",
+                "field": "ChildNode",
+                "type": "any",
+                "capacity": 10,
+            },
+        },
+        "_templates_": [
+            {
+                "count": 5,
+                "model": {
+                    "SomeEntity": {
+                        "ChildNode": "value",
+                    },
+                },
+            },
+        ],
+    }
+    MimeoConfigFactory.parse(config)
+
+
 @assert_throws(err_type=InvalidRefsError,
                msg="A reference can't be configured using name of Mimeo Utils "
                    "or existing Vars. Please rename following refs: [{refs}]",
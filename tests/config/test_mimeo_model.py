@@ -1,6 +1,8 @@
 
-from mimeo.config.exc import InvalidMimeoModelError
-from mimeo.config.mimeo_config import MimeoModel
+import pickle
+
+from mimeo.config.exc import InvalidMimeoModelError, InvalidMimeoTemplateError
+from mimeo.config.mimeo_config import MimeoModel, MimeoTemplate
 from tests.utils import assert_throws
 
 
@@ -47,6 +49,107 @@ def test_parsing_raw_model():
     }
 
 
+def test_parsing_model_with_nested_templates():
+    nested_templates = [
+        {
+            "count": 5,
+            "model": {
+                "NestedEntity": {
+                    "_templates_": [
+                        {
+                            "count": 2,
+                            "model": {
+                                "DeeplyNestedEntity": "value",
+                            },
+                        },
+                    ],
+                },
+            },
+        },
+    ]
+    model = {
+        "SomeEntity": {
+            "ChildNodes": {
+                "_templates_": nested_templates,
+            },
+        },
+    }
+
+    mimeo_model = MimeoModel(model)
+    templates = mimeo_model.get_nested_templates(nested_templates)
+    assert len(templates) == 1
+    assert isinstance(templates[0], MimeoTemplate)
+    assert templates[0].count == 5
+    assert templates[0].model.root_name == "NestedEntity"
+    assert mimeo_model.get_nested_templates(nested_templates) is templates
+
+    deeply_nested_templates = model["SomeEntity"]["ChildNodes"]["_templates_"][0][
+        "model"]["NestedEntity"]["_templates_"]
+    nested_model = templates[0].model
+    assert (nested_model.get_nested_templates(deeply_nested_templates) is
+            nested_model.get_nested_templates(deeply_nested_templates))
+
+
+def test_get_nested_templates_not_belonging_to_model():
+    mimeo_model = MimeoModel({
+        "SomeEntity": {
+            "ChildNode": "value",
+        },
+    })
+    templates = mimeo_model.get_nested_templates([
+        {
+            "count": 5,
+            "model": {
+                "NestedEntity": "value",
+            },
+        },
+    ])
+    assert len(templates) == 1
+    assert templates[0].count == 5
+    assert templates[0].model.root_name == "NestedEntity"
+
+
+def test_pickling_model_with_nested_templates():
+    mimeo_model = MimeoModel({
+        "SomeEntity": {
+            "ChildNodes": {
+                "_templates_": [
+                    {
+                        "count": 5,
+                        "model": {
+                            "NestedEntity": "value",
+                        },
+                    },
+                ],
+            },
+        },
+    })
+
+    unpickled_model = pickle.loads(pickle.dumps(mimeo_model))
+    assert unpickled_model.root_data == mimeo_model.root_data
+    nested_templates = unpickled_model.root_data["ChildNodes"]["_templates_"]
+    templates = unpickled_model.get_nested_templates(nested_templates)
+    assert templates[0].count == 5
+    assert unpickled_model.get_nested_templates(nested_templates) is templates
+
+
+@assert_throws(err_type=InvalidMimeoTemplateError,
+               msg="No count property in the Mimeo Template: {tmplt}",
+               tmplt="{'model': {'NestedEntity': 'value'}}")
+def test_parsing_model_with_invalid_nested_template():
+    MimeoModel({
+        "SomeEntity": {
+            "_templates_": [
+                {
+                    "model": {
+                        "NestedEntity": "value",
+                    },
+                },
+            ],
+        },
+    })
+
+
 @assert_throws(err_type=InvalidMimeoModelError,
                msg="No root data in Mimeo Model: {model}",
                model="{'context': 'My Context'}")
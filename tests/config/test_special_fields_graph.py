@@ -0,0 +1,87 @@
+from mimeo.config import MimeoConfigFactory, SpecialFieldsGraph
+
+
+def test_special_fields_graph():
+    config = MimeoConfigFactory.parse({
+        "vars": {
+            "LABEL": "{:Name:}-label",
+            "NESTED_LABEL": "{LABEL}",
+        },
+        "_templates_": [
+            {
+                "count": 5,
+                "model": {
+                    "SomeEntity": {
+                        ":Id:": "{auto_increment}",
+                        ":Name:": "{first_name}",
+                        ":Unused:": "value",
+                        "Label": "{NESTED_LABEL}",
+                        "Code": {
+                            "_mimeo_util": {
+                                "_name": "random_item",
+                                "items": ["{:Id:}", "x"],
+                            },
+                        },
+                        "Children": {
+                            "_templates_": [
+                                {
+                                    "count": 2,
+                                    "model": {
+                                        "context": "Child",
+                                        "ChildEntity": {
+                                            ":Id:": "{auto_increment}",
+                                            "Parent": "value",
+                                        },
+                                    },
+                                },
+                            ],
+                        },
+                    },
+                },
+            },
+        ],
+    })
+    graph = SpecialFieldsGraph(config)
+    assert graph.is_complete
+    assert graph.definitions == {
+        "SomeEntity": ["Id", "Name", "Unused"],
+        "Child": ["Id"],
+    }
+    assert graph.references == {
+        "SomeEntity": {
+            "Name": ["SomeEntity/Label"],
+            "Id": ["SomeEntity/Code"],
+        },
+        "Child": {},
+    }
+    assert graph.is_referenced("SomeEntity", "Id")
+    assert graph.is_referenced("SomeEntity", "Name")
+    assert not graph.is_referenced("SomeEntity", "Unused")
+    assert not graph.is_referenced("Child", "Id")
+    assert graph.has_references("SomeEntity")
+    assert not graph.has_references("Child")
+    assert graph.has_references("NotAnalyzed")
+
+
+def test_special_fields_graph_incomplete():
+    config = MimeoConfigFactory.parse({
+        "vars": {
+            "FIELD": "Name",
+        },
+        "_templates_": [
+            {
+                "count": 5,
+                "model": {
+                    "SomeEntity": {
+                        ":Name:": "{first_name}",
+                        ":Unused:": "value",
+                        "Label": "{:{FIELD}:}",
+                    },
+                },
+            },
+        ],
+    })
+    graph = SpecialFieldsGraph(config)
+    assert not graph.is_complete
+    assert graph.is_referenced("SomeEntity", "Unused")
+    assert graph.has_references("SomeEntity")
@@ -1,3 +1,4 @@
+import asyncio
 import shutil
 from pathlib import Path
 
@@ -97,3 +98,37 @@ async def test_consume_json():
             with Path(file_path).open() as file_content:
                 assert file_content.readline() == '{"SomeEntity": null}'
 
+
+def test_consume_in_chunks():
+    config = {
+        "output": {
+            "direction": "file",
+            "format": "json",
+            "directory_path": "test_file_consumer-dir",
+            "file_name": "test-output",
+        },
+        "_templates_": [
+            {
+                "count": 3,
+                "model": {
+                    "SomeEntity": "{auto_increment}",
+                },
+            },
+        ],
+    }
+    mimeo_config = MimeoConfigFactory.parse(config)
+    consumer = ConsumerFactory.get_consumer(mimeo_config)
+
+    with MimeoContextManager(mimeo_config):
+        generator = GeneratorFactory.get_generator(mimeo_config)
+        data = [generator.stringify(root)
+                for root in generator.generate(mimeo_config.templates)]
+
+        asyncio.run(consumer.consume(data[:2]))
+        asyncio.run(consumer.consume(data[2:]))
+
+    for i in range(1, 4):
+        file_path = f"test_file_consumer-dir/test-output-{i}.json"
+        with Path(file_path).open() as file_content:
+            assert file_content.readline() == f'{{"SomeEntity": "{i:05d}"}}'
+
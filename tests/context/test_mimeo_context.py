@@ -1,3 +1,7 @@
+import uuid
+
+import pytest
+
 from mimeo.context import MimeoContext
 from mimeo.context.exc import (ContextIterationNotFoundError,
                                MinimumIdentifierReachedError,
@@ -52,6 +56,21 @@ def test_next_iteration():
     assert ctx.next_iteration().id == 3
 
 
+def test_next_iteration_keys():
+    context = MimeoContext("SomeContext")
+    keys = [context.next_iteration().key for _ in range(1_000)]
+    assert len(set(keys)) == 1_000
+    assert all(uuid.UUID(key).version == 4 for key in keys)
+
+
+def test_next_iteration_keys_of_seeded_contexts():
+    context_1 = MimeoContext("SomeContext", "42:SomeContext")
+    context_2 = MimeoContext("SomeContext", "42:SomeContext")
+    keys_1 = [context_1.next_iteration().key for _ in range(300)]
+    keys_2 = [context_2.next_iteration().key for _ in range(300)]
+    assert keys_1 == keys_2
+
+
 def test_curr_iteration():
     ctx = MimeoContext("SomeContext")
     ctx.next_iteration()
@@ -83,6 +102,45 @@ def test_get_iteration():
     assert ctx.get_iteration(3).id == 3
 
 
+def test_get_iteration_with_offset():
+    ctx = MimeoContext("SomeContext")
+    ctx.assign_shard({}, iteration_offset=5)
+    for _ in range(3):
+        ctx.next_iteration()
+
+    assert ctx.get_iteration(6).id == 6
+    assert ctx.get_iteration(8).id == 8
+    assert ctx.get_iteration(7.0).id == 7
+
+
+def test_retain_iterations():
+    ctx = MimeoContext("SomeContext")
+    for _ in range(3):
+        ctx.next_iteration()
+    ctx.retain_iterations(1)
+    assert ctx.get_iteration(3).id == 3
+
+    ctx.next_iteration()
+    assert ctx.curr_iteration().id == 4
+    assert ctx.get_iteration(4).id == 4
+
+    ctx.retain_iterations(None)
+    ctx.next_iteration()
+    assert ctx.get_iteration(4).id == 4
+    assert ctx.get_iteration(5).id == 5
+
+
+@assert_throws(err_type=ContextIterationNotFoundError,
+               msg="No iteration with id [{iter}] has been initialized "
+                   "for the current context [{ctx}]",
+               iter=4, ctx="SomeContext")
+def test_get_iteration_out_of_range():
+    ctx = MimeoContext("SomeContext")
+    for _ in range(3):
+        ctx.next_iteration()
+    ctx.get_iteration(4)
+
+
 @assert_throws(err_type=ContextIterationNotFoundError,
                msg="No iteration with id [{iter}] has been initialized "
                    "for the current context [{ctx}]",
@@ -104,6 +162,42 @@ def test_clear_iterations():
     assert ctx.next_iteration().id == 3
 
 
+def test_assign_shard():
+    ctx = MimeoContext("SomeContext")
+    ctx.assign_shard({}, id_offset=10, iteration_offset=5)
+    assert ctx.next_id() == 11
+    assert ctx.next_iteration().id == 6
+    assert ctx.next_iteration().id == 7
+
+    ctx.clear_iterations()
+    assert ctx.next_iteration().id == 6
+
+
+def test_assign_shard_unique_indexes():
+    unique_slices = [(0, 30, 100), (30, 60, 100), (60, 90, 100), (90, 100, 100)]
+    indexes = []
+    for start, stop, total in unique_slices:
+        ctx = MimeoContext("SomeContext")
+        ctx.assign_shard({MimeoContext.COUNTRIES: (start, stop, total)})
+        first_index = MimeoDB.NUM_OF_COUNTRIES * start // total
+        last_index = MimeoDB.NUM_OF_COUNTRIES * stop // total
+        shard_indexes = [ctx.next_country_index()
+                         for _ in range(first_index, last_index)]
+        assert all(first_index <= index < last_index for index in shard_indexes)
+        with pytest.raises(OutOfStockError):
+            ctx.next_country_index()
+        indexes.extend(shard_indexes)
+    assert sorted(indexes) == list(range(MimeoDB.NUM_OF_COUNTRIES))
+
+
+def test_assign_shard_without_unique_slice():
+    ctx = MimeoContext("SomeContext")
+    ctx.assign_shard({MimeoContext.COUNTRIES: (0, 10, 10)})
+    assert ctx.next_country_index() < MimeoDB.NUM_OF_COUNTRIES
+    with pytest.raises(OutOfStockError):
+        ctx.next_currency_index()
+
+
 def test_next_country_index():
     ctx = MimeoContext("SomeContext")
     for _ in range(MimeoDB.NUM_OF_COUNTRIES):
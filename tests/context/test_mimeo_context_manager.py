@@ -1,12 +1,16 @@
+import logging
+
 import pytest
 
 from mimeo.config import MimeoConfigFactory
 from mimeo.context import MimeoContextManager
-from mimeo.context.exc import (InvalidReferenceValueError,
+from mimeo.context.exc import (ContextIterationNotFoundError,
+                               InvalidReferenceValueError,
                                NoCorrespondingReferenceError,
                                NonPopulatedReferenceError,
                                ReferenceNotFoundError, VarNotFoundError)
 from mimeo.meta.exc import InstanceNotAliveError
+from mimeo.utils import MimeoRenderer
 from tests.utils import assert_throws
 
 
@@ -167,12 +171,100 @@ def test_ref_bool(default_config):
         assert mimeo_manager.get_ref("custom_ref_any") is False
 
 
+def test_ref_any_with_capacity():
+    mimeo_config = MimeoConfigFactory.parse({
+        "refs": {
+            "custom_ref_any": {
+                "context": "SomeContext",
+                "field": "ChildNode",
+                "type": "any",
+                "capacity": 5,
+            },
+        },
+        "_templates_": [
+            {
+                "count": 10,
+                "model": {
+                    "SomeEntity": {
+                        "ChildNode": 1,
+                    },
+                },
+            },
+        ],
+    })
+    with MimeoContextManager(mimeo_config) as mimeo_manager:
+        context = mimeo_manager.get_context("SomeContext")
+        mimeo_manager.set_current_context(context)
+
+        for value in range(100):
+            mimeo_manager.cache_ref("ChildNode", value)
+        values = {mimeo_manager.get_ref("custom_ref_any") for _ in range(100)}
+        assert len(values) <= 5
+        assert values <= set(range(100))
+
+
+def test_get_refs_memory_usage(default_config):
+    with MimeoContextManager(default_config) as mimeo_manager:
+        context = mimeo_manager.get_context("SomeContext")
+        mimeo_manager.set_current_context(context)
+        empty_usage = mimeo_manager.get_refs_memory_usage()
+
+        for value in range(100):
+            mimeo_manager.cache_ref("ChildNode", value)
+        usage = mimeo_manager.get_refs_memory_usage()
+        assert list(usage.keys()) == ["custom_ref_any", "custom_ref_parallel"]
+        assert usage["custom_ref_any"] > empty_usage["custom_ref_any"]
+        assert usage["custom_ref_parallel"] > empty_usage["custom_ref_parallel"]
+        assert usage["custom_ref_parallel"] < usage["custom_ref_any"]
+
+
+
+def test_exit_logs_refs_memory_usage(default_config, caplog):
+    caplog.set_level(logging.DEBUG, logger="mimeo.context")
+    with MimeoContextManager(default_config) as mimeo_manager:
+        context = mimeo_manager.get_context("SomeContext")
+        mimeo_manager.set_current_context(context)
+        mimeo_manager.cache_ref("ChildNode", 1)
+        usage = mimeo_manager.get_refs_memory_usage()
+
+    assert caplog.messages[-2:] == [
+        f"Ref [custom_ref_any] uses [{usage['custom_ref_any']}] bytes",
+        f"Ref [custom_ref_parallel] uses [{usage['custom_ref_parallel']}] bytes",
+    ]
+
 def test_get_ref_names(default_config):
     with MimeoContextManager(default_config) as mimeo_manager:
         expected_ref_names = ["custom_ref_any", "custom_ref_parallel"]
         assert mimeo_manager.get_ref_names() == expected_ref_names
 
 
+def test_is_referenced(default_config):
+    with MimeoContextManager(default_config) as mimeo_manager:
+        assert mimeo_manager.is_referenced("SomeContext", "ChildNode")
+        assert not mimeo_manager.is_referenced("SomeContext", "ChildNode1")
+        assert not mimeo_manager.is_referenced("SomeEntity", "ChildNode")
+
+
+def test_has_ref(default_config):
+    with MimeoContextManager(default_config) as mimeo_manager:
+        assert mimeo_manager.has_ref("custom_ref_any")
+        assert mimeo_manager.has_ref("custom_ref_parallel")
+        assert not mimeo_manager.has_ref("custom_ref")
+
+
+def test_cache_ref_in_other_context(default_config):
+    with MimeoContextManager(default_config) as mimeo_manager:
+        context = mimeo_manager.get_context("SomeEntity")
+        mimeo_manager.set_current_context(context)
+        mimeo_manager.cache_ref("ChildNode", 1)
+
+        context = mimeo_manager.get_context("SomeContext")
+        mimeo_manager.set_current_context(context)
+        mimeo_manager.cache_ref("ChildNode1", 2)
+        mimeo_manager.cache_ref("ChildNode", 3)
+        assert mimeo_manager.get_ref("custom_ref_any") == 3
+
+
 @assert_throws(err_type=InvalidReferenceValueError,
                msg="Provided reference value [{v}] is invalid (use any atomic value)!",
                v="{}")
@@ -240,3 +332,86 @@ def test_get_ref_no_corresponding(default_config):
         mimeo_manager.get_ref("custom_ref_parallel")
 
 
+def test_get_random_of_seeded_contexts():
+    config = MimeoConfigFactory.parse({
+        "seed": 42,
+        "_templates_": [],
+    })
+    with MimeoContextManager(config) as mimeo_manager:
+        context_1 = mimeo_manager.get_context("SomeContext")
+        context_2 = mimeo_manager.get_context("OtherContext")
+        mimeo_manager.set_current_context(context_1)
+        assert mimeo_manager.get_random() is context_1.rng
+        values_1 = [context_1.rng.random() for _ in range(5)]
+        values_2 = [context_2.rng.random() for _ in range(5)]
+        assert values_1 != values_2
+
+    with MimeoContextManager(config) as mimeo_manager:
+        context_1 = mimeo_manager.get_context("SomeContext")
+        assert [context_1.rng.random() for _ in range(5)] == values_1
+
+
+@assert_throws(err_type=InstanceNotAliveError,
+               msg="The instance is not alive!")
+def test_get_random_without_mimeo_manager_initialized():
+    MimeoContextManager().get_random()
+
+
+def test_get_utils_cache(default_config):
+    with MimeoContextManager(default_config) as mimeo_manager:
+        utils_cache = mimeo_manager.get_utils_cache()
+        MimeoRenderer.render({"_mimeo_util": {"_name": "random_int", "end": 5}})
+        MimeoRenderer.render({"_mimeo_util": {"_name": "random_int", "end": 5}})
+        assert len(utils_cache) == 1
+        assert utils_cache.misses == 1
+        assert utils_cache.hits == 1
+
+    with MimeoContextManager(default_config) as mimeo_manager:
+        assert mimeo_manager.get_utils_cache() is not utils_cache
+        assert len(mimeo_manager.get_utils_cache()) == 0
+
+
+def test_get_utils_cache_bounded(default_config, monkeypatch):
+    monkeypatch.setattr(MimeoContextManager, "_UTILS_CACHE_SIZE", 10)
+    with MimeoContextManager(default_config) as mimeo_manager:
+        for end in range(1, 101):
+            MimeoRenderer.render({"_mimeo_util": {"_name": "random_int", "end": end}})
+        utils_cache = mimeo_manager.get_utils_cache()
+        assert len(utils_cache) == 10
+        assert utils_cache.evictions == 90
+
+
+def test_get_special_fields_graph(default_config):
+    with MimeoContextManager(default_config) as mimeo_manager:
+        graph = mimeo_manager.get_special_fields_graph()
+        assert graph.is_complete
+        assert graph.references == {"SomeEntity": {}}
+
+
+def test_keep_iterations_history(default_config):
+    with MimeoContextManager(default_config) as mimeo_manager:
+        context_1 = mimeo_manager.get_context("SomeContext")
+        mimeo_manager.keep_iterations_history(["OtherContext"])
+        context_2 = mimeo_manager.get_context("OtherContext")
+        context_3 = mimeo_manager.get_context("ThirdContext")
+        for context in (context_1, context_2, context_3):
+            context.next_iteration()
+            context.next_iteration()
+
+        assert context_1.curr_iteration().id == 2
+        assert context_2.get_iteration(1).id == 1
+        assert context_3.curr_iteration().id == 2
+        with pytest.raises(ContextIterationNotFoundError):
+            context_1.get_iteration(1)
+        with pytest.raises(ContextIterationNotFoundError):
+            context_3.get_iteration(1)
+
+        mimeo_manager.keep_iterations_history(None)
+        context_1.next_iteration()
+        assert context_1.get_iteration(2).id == 2
+
+
+@assert_throws(err_type=InstanceNotAliveError,
+               msg="The instance is not alive!")
+def test_get_utils_cache_without_mimeo_manager_initialized():
+    MimeoContextManager().get_utils_cache()
@@ -21,6 +21,24 @@ def test_iteration_key():
     assert key3 != key1
 
 
+def test_iteration_key_generated_lazily():
+    keys = iter(["key-1", "key-2"])
+    calls = []
+
+    def key_factory():
+        calls.append(1)
+        return next(keys)
+
+    iteration = MimeoIteration(1, key_factory=key_factory)
+    assert calls == []
+    assert iteration.key == "key-1"
+    assert iteration.key == "key-1"
+    assert calls == [1]
+    iteration = MimeoIteration(1, key="custom-key", key_factory=key_factory)
+    assert iteration.key == "custom-key"
+    assert calls == [1]
+
+
 def test_iteration_special_fields():
     iteration = MimeoIteration(1)
     iteration.add_special_field("SomeField1", 1)
@@ -0,0 +1,50 @@
+import random
+from collections import Counter
+
+from mimeo.context.permutations import IndexPermutation
+from tests.utils import assert_throws
+
+
+def test_index_permutation_provides_all_indexes_once():
+    for num_of_entries in (1, 2, 3, 17, 250, 42_904):
+        permutation = IndexPermutation(range(num_of_entries), random.Random(1))
+        assert len(permutation) == num_of_entries
+
+        indexes = [permutation.pop() for _ in range(num_of_entries)]
+        assert len(permutation) == 0
+        assert sorted(indexes) == list(range(num_of_entries))
+
+
+def test_index_permutation_of_stepped_range():
+    population = range(2, 100, 3)
+    permutation = IndexPermutation(population, random.Random(1))
+
+    indexes = [permutation.pop() for _ in range(len(population))]
+    assert sorted(indexes) == list(population)
+
+
+def test_index_permutation_empty():
+    permutation = IndexPermutation(range(0), random.Random(1))
+    assert len(permutation) == 0
+
+
+@assert_throws(err_type=IndexError,
+               msg="pop from an exhausted permutation")
+def test_index_permutation_exhausted():
+    permutation = IndexPermutation(range(1), random.Random(1))
+    permutation.pop()
+    permutation.pop()
+
+
+def test_index_permutation_seeded():
+    permutation_1 = IndexPermutation(range(1_000), random.Random("seed"))
+    permutation_2 = IndexPermutation(range(1_000), random.Random("seed"))
+    assert ([permutation_1.pop() for _ in range(1_000)] ==
+            [permutation_2.pop() for _ in range(1_000)])
+
+
+def test_index_permutation_uniform():
+    counts = Counter(IndexPermutation(range(10), random.Random(seed)).pop()
+                     for seed in range(10_000))
+    assert set(counts) == set(range(10))
+    assert all(800 < count < 1_200 for count in counts.values())
@@ -0,0 +1,73 @@
+import random
+import string
+
+from mimeo.context.random_engines import (NumpyRandomEngine,
+                                          PythonRandomEngine,
+                                          RandomEngineFactory)
+
+
+def _engines(seed):
+    return [
+        PythonRandomEngine(random.Random(seed)),
+        NumpyRandomEngine(random.Random(seed), seed),
+    ]
+
+
+def test_random_engine_factory():
+    random_engine = RandomEngineFactory.get_random_engine(random.Random(), 1)
+    assert isinstance(random_engine, NumpyRandomEngine)
+
+
+def test_python_random_engine_matches_random():
+    random_engine = PythonRandomEngine(random.Random(1))
+    rng = random.Random(1)
+    assert random_engine.integers(1, 101, 10) == [rng.randrange(1, 101)
+                                                  for _ in range(10)]
+
+
+def test_random_engine_integers():
+    for random_engine in _engines(1):
+        integers = random_engine.integers(-5, 5, 1_000)
+        assert len(integers) == 1_000
+        assert all(isinstance(integer, int) for integer in integers)
+        assert set(integers) == set(range(-5, 5))
+
+
+def test_random_engine_integers_out_of_64_bit_range():
+    for random_engine in _engines(1):
+        integers = random_engine.integers(2 ** 64, 2 ** 64 + 3, 100)
+        assert set(integers) == {2 ** 64, 2 ** 64 + 1, 2 ** 64 + 2}
+
+
+def test_random_engine_choices():
+    population = ["a", 1, 2.5]
+    for random_engine in _engines(1):
+        items = random_engine.choices(population, 100)
+        assert len(items) == 100
+        assert set(items) == {"a", 1, 2.5}
+
+
+def test_random_engine_strings():
+    for random_engine in _engines(1):
+        strings = random_engine.strings(string.digits, 5, 100)
+        assert len(strings) == 100
+        assert all(len(value) == 5 and value.isdigit() for value in strings)
+
+
+def test_random_engine_strings_with_non_ascii_alphabet():
+    for random_engine in _engines(1):
+        strings = random_engine.strings("ąę", 3, 10)
+        assert all(len(value) == 3 and set(value) <= {"ą", "ę"}
+                   for value in strings)
+
+
+def test_random_engine_strings_with_length_zero():
+    for random_engine in _engines(1):
+        assert random_engine.strings(string.ascii_letters, 0, 3) == ["", "", ""]
+
+
+def test_numpy_random_engine_seeded():
+    random_engine_1 = NumpyRandomEngine(random.Random(1), "seed")
+    random_engine_2 = NumpyRandomEngine(random.Random(1), "seed")
+    assert (random_engine_1.strings(string.ascii_letters, 10, 10) ==
+            random_engine_2.strings(string.ascii_letters, 10, 10))
@@ -0,0 +1,109 @@
+import random
+import sys
+from collections import Counter
+
+from mimeo.context.reference_stores import (AnyReferenceStore,
+                                            ParallelReferenceStore)
+
+
+def test_any_reference_store_unlimited():
+    store = AnyReferenceStore(lambda: random.Random(0))
+    for value in range(100):
+        store.append(value)
+
+    assert len(store) == 100
+    assert store.seen == 100
+    assert [store[index] for index in range(100)] == list(range(100))
+
+
+def test_any_reference_store_bounded():
+    rng = random.Random(0)
+    store = AnyReferenceStore(lambda: rng, 10)
+    for value in range(1_000):
+        store.append(value)
+
+    values = [store[index] for index in range(len(store))]
+    assert len(store) == 10
+    assert store.seen == 1_000
+    assert len(set(values)) == 10
+    assert all(0 <= value < 1_000 for value in values)
+
+
+def test_any_reference_store_bounded_uniform():
+    rng = random.Random(0)
+    counts = Counter()
+    for _ in range(2_000):
+        store = AnyReferenceStore(lambda: rng, 5)
+        for value in range(20):
+            store.append(value)
+        counts.update(store[index] for index in range(len(store)))
+
+    # each value is expected to be sampled 500 times
+    assert all(400 < counts[value] < 600 for value in range(20))
+
+
+def test_any_reference_store_nbytes():
+    store = AnyReferenceStore(lambda: random.Random(0), 10)
+    empty_nbytes = store.nbytes()
+    for value in range(1_000):
+        store.append(f"value-{value}")
+
+    assert store.nbytes() > empty_nbytes
+    assert store.nbytes() < 2_000
+
+
+def test_parallel_reference_store_empty():
+    store = ParallelReferenceStore()
+    assert len(store) == 0
+    assert store.nbytes() == 0
+
+
+def test_parallel_reference_store_str():
+    store = ParallelReferenceStore()
+    values = ["value-1", "", "zażółć", "\ud83d"]
+    for value in values:
+        store.append(value)
+
+    assert len(store) == 4
+    assert [store[index] for index in range(4)] == values
+
+
+def test_parallel_reference_store_numbers():
+    for values in ([1, -2, 3], [1.5, -2.25, 3.0], [True, False, True]):
+        store = ParallelReferenceStore()
+        for value in values:
+            store.append(value)
+
+        stored = [store[index] for index in range(len(store))]
+        assert stored == values
+        assert [type(value) for value in stored] == [type(value) for value in values]
+
+
+def test_parallel_reference_store_mixed_types():
+    store = ParallelReferenceStore()
+    values = ["value-1", "value-2", 3, True, None, 4.5]
+    for value in values:
+        store.append(value)
+
+    stored = [store[index] for index in range(len(store))]
+    assert stored == values
+    assert [type(value) for value in stored] == [type(value) for value in values]
+
+
+def test_parallel_reference_store_big_int():
+    store = ParallelReferenceStore()
+    values = [1, 2 ** 70, 3]
+    for value in values:
+        store.append(value)
+
+    assert [store[index] for index in range(len(store))] == values
+
+
+def test_parallel_reference_store_nbytes():
+    store = ParallelReferenceStore()
+    values = [f"value-{value}" for value in range(10_000)]
+    for value in values:
+        store.append(value)
+
+    list_nbytes = sys.getsizeof(values) + sum(map(sys.getsizeof, values))
+    assert store.nbytes() < list_nbytes / 3
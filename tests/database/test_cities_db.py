@@ -60,3 +60,19 @@ def test_get_city_of_non_existing_country():
     nec_cities = db.get_cities_of("NEC")
 
     assert len(nec_cities) == 0
+
+
+def test_get_cities_view_of():
+    db = CitiesDB()
+    cities_view = db.get_cities_view_of("GBR")
+    assert isinstance(cities_view, tuple)
+    assert cities_view is db.get_cities_view_of("GBR")
+    assert list(cities_view) == db.get_cities_of("GBR")
+    assert all(city.country == "GBR" for city in cities_view)
+
+
+def test_get_cities_of_returns_copy():
+    db = CitiesDB()
+    cities = db.get_cities_of("GBR")
+    cities.clear()
+    assert len(db.get_cities_of("GBR")) > 0
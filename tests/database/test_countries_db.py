@@ -69,6 +69,17 @@ def test_get_country_by_name():
     assert country.name == "United Kingdom"
 
 
+def test_get_country():
+    db = CountriesDB()
+    for country_detail in ("GBR", "GB", "United Kingdom"):
+        country = db.get_country(country_detail)
+        assert country.iso_3 == "GBR"
+        assert country.iso_2 == "GB"
+        assert country.name == "United Kingdom"
+
+    assert db.get_country("Non Existing Country") is None
+
+
 def test_get_non_existing_country():
     db = CountriesDB()
     country = db.get_country_by_iso_3("NEC")
@@ -53,6 +53,12 @@ def test_get_currency_of():
     assert "India" in india_currency.countries
 
 
+def test_get_currency_of_country_with_long_form_name():
+    db = CurrenciesDB()
+    assert db.get_currency_of("Russian Federation").code == "RUB"
+    assert db.get_currency_of("Bolivia").code == "BOB"
+
+
 def test_get_currency_of_non_existing_country():
     db = CurrenciesDB()
     nec_currency = db.get_currency_of("NEC")
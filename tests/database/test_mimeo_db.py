@@ -1,6 +1,46 @@
 from mimeo.database import (CitiesDB, CountriesDB, CurrenciesDB, FirstNamesDB,
                             LastNamesDB, MimeoDB)
 
+CURRENCY_CODES = {
+    "ABW": "AWG", "AFG": "AFN", "AGO": "AOA", "AIA": "XCD", "ALB": "ALL", "AND": "EUR",
+    "ARE": "AED", "ARG": "ARS", "ARM": "AMD", "ASM": "USD", "ATG": "XCD", "AUS": "AUD",
+    "AUT": "EUR", "AZE": "AZN", "BDI": "BIF", "BEL": "EUR", "BEN": "XOF", "BFA": "XOF",
+    "BGD": "BDT", "BGR": "BGN", "BHR": "BHD", "BIH": "BAM", "BLM": "EUR", "BLR": "BYN",
+    "BLZ": "BZD", "BMU": "BMD", "BOL": "BOB", "BRA": "BRL", "BRB": "BBD", "BRN": "BND",
+    "BTN": "BTN", "BWA": "BWP", "CAF": "XAF", "CAN": "CAD", "CHE": "CHE", "CHL": "CLF",
+    "CHN": "CNY", "CMR": "XAF", "COK": "NZD", "COL": "COP", "COM": "KMF", "CPV": "CVE",
+    "CRI": "CRC", "CUB": "CUC", "CUW": "ANG", "CXR": "AUD", "CYM": "KYD", "CYP": "EUR",
+    "CZE": "CZK", "DEU": "EUR", "DJI": "DJF", "DMA": "DOP", "DNK": "DKK", "DOM": "DOP",
+    "DZA": "DZD", "ECU": "USD", "EGY": "EGP", "ERI": "ERN", "ESP": "EUR", "EST": "EUR",
+    "ETH": "ETB", "FIN": "EUR", "FJI": "FJD", "FRA": "EUR", "FRO": "DKK", "GAB": "XAF",
+    "GBR": "GBP", "GEO": "GEL", "GHA": "GHS", "GIB": "GIP", "GIN": "GNF", "GLP": "EUR",
+    "GNB": "XOF", "GNQ": "XAF", "GRC": "EUR", "GRD": "XCD", "GRL": "DKK", "GTM": "GTQ",
+    "GUF": "EUR", "GUM": "USD", "GUY": "GYD", "HKG": "HKD", "HND": "HNL", "HRV": "HRK",
+    "HTI": "HTG", "HUN": "HUF", "IDN": "IDR", "IMN": "GBP", "IND": "INR", "IRL": "EUR",
+    "IRN": "IRR", "IRQ": "IQD", "ISL": "ISK", "ISR": "ILS", "ITA": "EUR", "JAM": "JMD",
+    "JEY": "GBP", "JOR": "JOD", "JPN": "JPY", "KAZ": "KZT", "KEN": "KES", "KGZ": "KGS",
+    "KHM": "KHR", "KIR": "AUD", "KNA": "XCD", "KWT": "KWD", "LBN": "LBP", "LBR": "LRD",
+    "LBY": "LYD", "LCA": "XCD", "LIE": "CHF", "LKA": "LKR", "LSO": "LSL", "LTU": "EUR",
+    "LUX": "EUR", "LVA": "EUR", "MAF": "EUR", "MAR": "MAD", "MCO": "EUR", "MDA": "MDL",
+    "MDG": "MGA", "MDV": "MVR", "MEX": "MXN", "MHL": "USD", "MKD": "MKD", "MLI": "XOF",
+    "MLT": "EUR", "MMR": "MMK", "MNE": "EUR", "MNG": "MNT", "MNP": "USD", "MOZ": "MZN",
+    "MRT": "MRU", "MSR": "XCD", "MTQ": "EUR", "MUS": "MUR", "MWI": "MWK", "MYS": "MYR",
+    "MYT": "EUR", "NAM": "NAD", "NCL": "XPF", "NER": "NGN", "NFK": "AUD", "NGA": "NGN",
+    "NIC": "NIO", "NIU": "NZD", "NLD": "EUR", "NOR": "NOK", "NPL": "NPR", "NRU": "AUD",
+    "NZL": "NZD", "OMN": "OMR", "PAK": "PKR", "PAN": "PAB", "PER": "PEN", "PHL": "PHP",
+    "PLW": "USD", "PNG": "PGK", "POL": "PLN", "PRI": "USD", "PRT": "EUR", "PRY": "PYG",
+    "PYF": "XPF", "QAT": "QAR", "REU": "EUR", "ROU": "RON", "RUS": "RUB", "RWA": "RWF",
+    "SAU": "SAR", "SDN": "SDG", "SEN": "XOF", "SGP": "SGD", "SLB": "SBD", "SLE": "SLL",
+    "SLV": "SVC", "SMR": "EUR", "SOM": "SOS", "SPM": "EUR", "SRB": "RSD", "SSD": "SSP",
+    "STP": "STN", "SUR": "SRD", "SVK": "EUR", "SVN": "EUR", "SWE": "SEK", "SXM": "ANG",
+    "SYC": "SCR", "SYR": "SYP", "TCA": "USD", "TCD": "XAF", "TGO": "XOF", "THA": "THB",
+    "TJK": "TJS", "TKM": "TMT", "TLS": "USD", "TON": "TOP", "TTO": "TTD", "TUN": "TND",
+    "TUR": "TRY", "TUV": "AUD", "TWN": "TWD", "TZA": "TZS", "UGA": "UGX", "UKR": "UAH",
+    "URY": "UYI", "USA": "USD", "UZB": "UZS", "VCT": "XCD", "VEN": "VES", "VUT": "VUV",
+    "WLF": "XPF", "WSM": "USD", "XSV": "NOK", "YEM": "YER", "ZAF": "ZAR", "ZMB": "ZMW",
+    "ZWE": "ZWL",
+}
+
 
 def test_get_cities():
     mimeo_db = MimeoDB()
@@ -70,6 +110,14 @@ def test_get_city_of_non_existing_country():
     assert len(cities) == 0
 
 
+def test_get_cities_view_of():
+    mimeo_db = MimeoDB()
+    cities_view = mimeo_db.get_cities_view_of("United Kingdom")
+    assert isinstance(cities_view, tuple)
+    assert cities_view is CitiesDB().get_cities_view_of("GBR")
+    assert mimeo_db.get_cities_view_of("NEC") == ()
+
+
 def test_get_countries():
     mimeo_db = MimeoDB()
     countries_from_countries_db = CountriesDB().get_countries()
@@ -122,6 +170,15 @@ def test_get_country_by_name():
     assert country_from_mimeo_db is country_from_cities_db
 
 
+def test_get_country():
+    mimeo_db = MimeoDB()
+    countries_db = CountriesDB()
+    country_from_countries_db = countries_db.get_country("GB")
+    country_from_mimeo_db = mimeo_db.get_country("GB")
+    assert country_from_mimeo_db is not None
+    assert country_from_mimeo_db is country_from_countries_db
+
+
 def test_get_first_names():
     mimeo_db = MimeoDB()
     first_names_form_first_names_db = FirstNamesDB().get_first_names()
@@ -241,3 +298,12 @@ def test_get_currency_of_non_existing_country():
     currency = mimeo_db.get_currency_of("NEC")
 
     assert currency is None
+
+
+def test_get_currency_of_all_countries():
+    mimeo_db = MimeoDB()
+    currencies = {country.iso_3: mimeo_db.get_currency_of(country.iso_3)
+                  for country in mimeo_db.get_countries()}
+    assert {iso_3: currency.code
+            for iso_3, currency in currencies.items()
+            if currency is not None} == CURRENCY_CODES
@@ -36,6 +36,7 @@ class ValidGenerator(Generator):
             cls,
             parent: ElemTree.Element | dict | list | None,
             node_meta: dict,
+            context: MimeoContext,
     ) -> ElemTree.Element | dict | list | None:
         pass
 
@@ -69,6 +70,7 @@ class InvalidGenerator1(Generator):
             cls,
             parent: ElemTree.Element | dict | list | None,
             node_meta: dict,
+            context: MimeoContext,
     ) -> ElemTree.Element | dict | list | None:
         pass
 
@@ -101,6 +103,7 @@ class InvalidGenerator2(Generator):
             cls,
             parent: ElemTree.Element | dict | list | None,
             node_meta: dict,
+            context: MimeoContext,
     ) -> ElemTree.Element | dict | list | None:
         pass
 
@@ -128,6 +131,7 @@ class InvalidGenerator3(Generator):
             cls,
             parent: ElemTree.Element | dict | list | None,
             node_meta: dict,
+            context: MimeoContext,
     ) -> ElemTree.Element | dict | list | None:
         pass
 
@@ -1,6 +1,7 @@
 from mimeo.config import MimeoConfig, MimeoConfigFactory
 from mimeo.context import MimeoContextManager
-from mimeo.context.exc import (NoCorrespondingReferenceError,
+from mimeo.context.exc import (ContextIterationNotFoundError,
+                               NoCorrespondingReferenceError,
                                NonPopulatedReferenceError)
 from mimeo.generators import JSONGenerator
 from mimeo.utils.exc import InvalidValueError
@@ -1496,6 +1497,211 @@ def test_stringify_without_indent():
     _test(config_from_xml)
 
 
+
+def test_generate_stringified_with_indent():
+    config = MimeoConfigFactory.parse({
+        "output": {
+            "format": "json",
+            "indent": 2,
+        },
+        "_templates_": [
+            {
+                "count": 2,
+                "model": {
+                    "SomeEntity": {
+                        "Id": "{auto_increment}",
+                        ":Special:": "value-\"1\"",
+                        "Static": {
+                            "ChildNode1": [1, 2.5, None],
+                            "ChildNode2": {},
+                        },
+                        "List": [
+                            "{:Special:}",
+                            True,
+                            {
+                                "_templates_": [
+                                    {
+                                        "count": 2,
+                                        "model": {
+                                            "Nested": "{curr_iter}",
+                                        },
+                                    },
+                                ],
+                            },
+                        ],
+                        "Children": {
+                            "_templates_": [
+                                {
+                                    "count": 1,
+                                    "model": {
+                                        "Child": "{auto_increment}",
+                                    },
+                                },
+                            ],
+                        },
+                    },
+                },
+            },
+        ],
+    })
+    generator = JSONGenerator(config)
+    with MimeoContextManager(config):
+        data = list(generator.generate_stringified(config.templates))
+
+    assert data[1] == ('{\n'
+                       '  "SomeEntity": {\n'
+                       '    "Id": "00002",\n'
+                       '    "Special": "value-\\"1\\"",\n'
+                       '    "Static": {\n'
+                       '      "ChildNode1": [\n'
+                       '        1,\n'
+                       '        2.5,\n'
+                       '        null\n'
+                       '      ],\n'
+                       '      "ChildNode2": {}\n'
+                       '    },\n'
+                       '    "List": [\n'
+                       '      "value-\\"1\\"",\n'
+                       '      true,\n'
+                       '      {\n'
+                       '        "Nested": 1\n'
+                       '      },\n'
+                       '      {\n'
+                       '        "Nested": 2\n'
+                       '      }\n'
+                       '    ],\n'
+                       '    "Children": [\n'
+                       '      {\n'
+                       '        "Child": "00002"\n'
+                       '      }\n'
+                       '    ]\n'
+                       '  }\n'
+                       '}')
+    with MimeoContextManager(config):
+        assert data == [generator.stringify(data_unit)
+                        for data_unit in generator.generate(config.templates)]
+
+
+def test_generate_stringified_without_indent():
+    config = MimeoConfigFactory.parse({
+        "output": {
+            "format": "json",
+        },
+        "_templates_": [
+            {
+                "count": 2,
+                "model": {
+                    "SomeEntity": {
+                        "Id": "{auto_increment}",
+                        "Text": "zażółć",
+                        "List": [[], [{"ChildNode": "{curr_iter}"}]],
+                        "Children": {
+                            "_templates_": [
+                                {
+                                    "count": 0,
+                                    "model": {
+                                        "Child": "{auto_increment}",
+                                    },
+                                },
+                            ],
+                        },
+                    },
+                },
+            },
+        ],
+    })
+    generator = JSONGenerator(config)
+    with MimeoContextManager(config):
+        data = list(generator.generate_stringified(config.templates))
+
+    assert data[0] == ('{"SomeEntity": {'
+                       '"Id": "00001", '
+                       '"Text": "za\\u017c\\u00f3\\u0142\\u0107", '
+                       '"List": [[], [{"ChildNode": 1}]], '
+                       '"Children": []'
+                       '}}')
+    with MimeoContextManager(config):
+        assert data == [generator.stringify(data_unit)
+                        for data_unit in generator.generate(config.templates)]
+
+
+def test_generate_stringified_multiple_templates_with_static_subtrees():
+    config = MimeoConfigFactory.parse({
+        "output": {
+            "format": "json",
+        },
+        "_templates_": [
+            {
+                "count": 1,
+                "model": {
+                    "SomeEntity": {
+                        "Static": {"x": i, "y": f"t{i}"},
+                        "Random": "{random_int}",
+                    },
+                },
+            }
+            for i in range(30)
+        ],
+    })
+    generator = JSONGenerator(config)
+    with MimeoContextManager(config):
+        data = list(generator.generate_stringified(config.templates))
+
+    assert len(data) == 30
+    for i, data_unit in enumerate(data):
+        assert data_unit.startswith(f'{{"SomeEntity": {{"Static": {{"x": {i}, '
+                                    f'"y": "t{i}"}}, ')
+
+
+
+def test_generate_does_not_share_static_subtrees():
+    config = MimeoConfigFactory.parse({
+        "output": {
+            "format": "json",
+        },
+        "_templates_": [
+            {
+                "count": 2,
+                "model": {
+                    "SomeEntity": {
+                        "Static": {"x": 1, "List": [1, 2]},
+                        "Random": "{random_int}",
+                    },
+                },
+            },
+        ],
+    })
+    generator = JSONGenerator(config)
+    with MimeoContextManager(config):
+        data = list(generator.generate(config.templates))
+
+    data[0]["SomeEntity"]["Static"]["x"] = 2
+    data[0]["SomeEntity"]["Static"]["List"].append(3)
+    assert data[1]["SomeEntity"]["Static"] == {"x": 1, "List": [1, 2]}
+
+def test_generate_stringified_with_duplicated_names():
+    config = MimeoConfigFactory.parse({
+        "output": {
+            "format": "json",
+        },
+        "_templates_": [
+            {
+                "count": 1,
+                "model": {
+                    "SomeEntity": {
+                        ":ChildNode:": "value-1",
+                        "ChildNode": "{:ChildNode:}-2",
+                    },
+                },
+            },
+        ],
+    })
+    generator = JSONGenerator(config)
+    with MimeoContextManager(config):
+        data = list(generator.generate_stringified(config.templates))
+
+    assert data == ['{"SomeEntity": {"ChildNode": "value-1-2"}}']
+
 def test_generate_using_mimeo_util_raw():
     config_from_dict = MimeoConfigFactory.parse({
         "output": {
@@ -2774,6 +2980,132 @@ def test_generate_using_key_util_in_two_templates_with_customized_iteration():
     _test(config_from_xml)
 
 
+def test_retain_iterations():
+    config = MimeoConfigFactory.parse({
+        "output": {
+            "format": "json",
+        },
+        "_templates_": [
+            {
+                "count": 5,
+                "model": {
+                    "SomeEntity": {
+                        "ChildNode1": "{key}",
+                        "ChildNode2": {
+                            "_templates_": [
+                                {
+                                    "count": 2,
+                                    "model": {
+                                        "NestedEntity": {
+                                            "_mimeo_util": {
+                                                "_name": "key",
+                                                "iteration": 1,
+                                            },
+                                        },
+                                    },
+                                },
+                            ],
+                        },
+                    },
+                },
+            },
+            {
+                "count": 5,
+                "model": {
+                    "OtherEntity": {
+                        "ChildNode1": {
+                            "_mimeo_util": {
+                                "_name": "key",
+                                "context": "SomeEntity",
+                                "iteration": "{curr_iter}",
+                            },
+                        },
+                    },
+                },
+            },
+        ],
+    })
+    with MimeoContextManager(config) as mimeo_manager:
+        generator = JSONGenerator(config)
+        generator.retain_iterations(config)
+        data = list(generator.generate(config.templates))
+        for index in range(5):
+            some_entity = data[index]["SomeEntity"]
+            other_entity = data[index + 5]["OtherEntity"]
+            nested_keys = {nested_entity["NestedEntity"]
+                           for nested_entity in some_entity["ChildNode2"]}
+            assert len(nested_keys) == 1
+            assert other_entity["ChildNode1"] == some_entity["ChildNode1"]
+
+        some_entity_context = mimeo_manager.get_context("SomeEntity")
+        other_entity_context = mimeo_manager.get_context("OtherEntity")
+        nested_entity_context = mimeo_manager.get_context("NestedEntity")
+        assert some_entity_context.get_iteration(1).id == 1
+        assert nested_entity_context.get_iteration(1).id == 1
+        assert other_entity_context.curr_iteration().id == 5
+        assert other_entity_context.get_iteration(5).id == 5
+
+
+@assert_throws(err_type=ContextIterationNotFoundError,
+               msg="No iteration with id [{iter}] has been initialized "
+                   "for the current context [{ctx}]",
+               iter=4, ctx="OtherEntity")
+def test_retain_iterations_drops_past_iterations():
+    config = MimeoConfigFactory.parse({
+        "output": {
+            "format": "json",
+        },
+        "_templates_": [
+            {
+                "count": 5,
+                "model": {
+                    "OtherEntity": {
+                        "ChildNode1": "{key}",
+                    },
+                },
+            },
+        ],
+    })
+    with MimeoContextManager(config) as mimeo_manager:
+        generator = JSONGenerator(config)
+        generator.retain_iterations(config)
+        list(generator.generate(config.templates))
+        mimeo_manager.get_context("OtherEntity").get_iteration(4)
+
+
+def test_retain_iterations_with_dynamic_context():
+    config = MimeoConfigFactory.parse({
+        "output": {
+            "format": "json",
+        },
+        "vars": {
+            "PAST_KEY": {
+                "_mimeo_util": {
+                    "_name": "key",
+                    "iteration": 1,
+                },
+            },
+        },
+        "_templates_": [
+            {
+                "count": 5,
+                "model": {
+                    "SomeEntity": {
+                        "ChildNode1": "{PAST_KEY}",
+                    },
+                },
+            },
+        ],
+    })
+    with MimeoContextManager(config) as mimeo_manager:
+        generator = JSONGenerator(config)
+        generator.retain_iterations(config)
+        data = list(generator.generate(config.templates))
+        keys = {data_unit["SomeEntity"]["ChildNode1"] for data_unit in data}
+        assert len(keys) == 1
+        assert mimeo_manager.get_context("SomeEntity").get_iteration(1).id == 1
+
+
 def test_generate_using_get_key_util_in_two_templates_with_customized_context_name():
     config_from_dict = MimeoConfigFactory.parse({
         "output": {
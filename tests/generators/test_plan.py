@@ -0,0 +1,444 @@
+from mimeo.config import MimeoConfigFactory
+from mimeo.context import MimeoContextManager
+from mimeo.generators import JSONGenerator, XMLGenerator
+from mimeo.generators.exc import UnsupportedStructureError
+from mimeo.generators.plan import (AtomicNode, DictNode, ListNode,
+                                   LiteralValue, ParametrizedUtilValue,
+                                   PlanValue, RawUtilValue, RefValue,
+                                   SpecialFieldValue, StaticNode,
+                                   TemplatesNode, VarValue)
+from tests.utils import assert_throws
+
+
+def test_plan_value_compile_with_literal_vars():
+    config = MimeoConfigFactory.parse({
+        "vars": {
+            "PREFIX": "id",
+            "NUMBER": 1,
+            "FLAG": True,
+            "NESTED": "{PREFIX}-{NUMBER}",
+            "UTIL": {
+                "_mimeo_util": {
+                    "_name": "random_int",
+                },
+            },
+            "NESTED_UTIL": "{PREFIX}-{UTIL}",
+        },
+        "_templates_": [],
+    })
+    with MimeoContextManager(config):
+        value = PlanValue.compile("{NUMBER}")
+        assert isinstance(value, LiteralValue)
+        assert value.render() == 1
+        value = PlanValue.compile("{NESTED}-{FLAG}")
+        assert isinstance(value, LiteralValue)
+        assert value.render() == "id-1-true"
+        value = PlanValue.compile("{:Field:}-{PREFIX}")
+        assert isinstance(value, SpecialFieldValue)
+        assert value.value == "{:Field:}-id"
+        value = PlanValue.compile("{PREFIX}-{UTIL}")
+        assert isinstance(value, VarValue)
+        assert value.value == "id-{UTIL}"
+        assert isinstance(PlanValue.compile("{NESTED_UTIL}"), VarValue)
+        assert isinstance(PlanValue.compile("{MISSING}"), VarValue)
+
+
+def test_plan_value_compile():
+    config = MimeoConfigFactory.parse({
+        "vars": {
+            "CUSTOM_VAR": "value",
+            "UTIL_VAR": "{auto_increment}",
+        },
+        "refs": {
+            "custom_ref": {
+                "context": "SomeEntity",
+                "field": "ChildNode",
+                "type": "any",
+            },
+        },
+        "_templates_": [],
+    })
+    with MimeoContextManager(config):
+        assert isinstance(PlanValue.compile("value"), LiteralValue)
+        assert isinstance(PlanValue.compile(1), LiteralValue)
+        assert isinstance(PlanValue.compile(True), LiteralValue)
+        assert isinstance(PlanValue.compile(None), LiteralValue)
+        assert isinstance(PlanValue.compile("{auto_increment}"), RawUtilValue)
+        assert isinstance(PlanValue.compile("{CUSTOM_VAR}"), LiteralValue)
+        assert isinstance(PlanValue.compile("{UTIL_VAR}"), VarValue)
+        assert isinstance(PlanValue.compile("{custom_ref}"), RefValue)
+        assert isinstance(PlanValue.compile("{:Field:}"), SpecialFieldValue)
+        assert isinstance(PlanValue.compile("{:Field:}-{CUSTOM_VAR}"),
+                          SpecialFieldValue)
+        assert isinstance(PlanValue.compile("id-{auto_increment}"), LiteralValue)
+        assert isinstance(PlanValue.compile({
+            "_mimeo_util": {
+                "_name": "auto_increment",
+            },
+        }), ParametrizedUtilValue)
+
+
+def test_literal_value_render():
+    assert LiteralValue("{auto_increment}").render() == "{auto_increment}"
+    assert LiteralValue(1).render() == 1
+
+
+def test_raw_util_value_render_in_context():
+    config = MimeoConfigFactory.parse({"_templates_": []})
+    with MimeoContextManager(config) as mimeo_manager:
+        context1 = mimeo_manager.get_context("SomeEntity")
+        context2 = mimeo_manager.get_context("SomeOtherEntity")
+        mimeo_manager.set_current_context(context1)
+        context2.next_iteration()
+        context2.next_iteration()
+
+        value = PlanValue.compile("{curr_iter}")
+        assert isinstance(value, RawUtilValue)
+        assert value.render(context2) == 2
+        context1.next_iteration()
+        assert value.render() == 1
+
+
+def test_util_value_render_in_batches():
+    config = MimeoConfigFactory.parse({"_templates_": []})
+    with MimeoContextManager(config) as mimeo_manager:
+        context = mimeo_manager.get_context("SomeEntity")
+        mimeo_manager.set_current_context(context)
+
+        value = PlanValue.compile("{random_str}")
+        value.set_batch_size(3)
+        values = [value.render(context) for _ in range(4)]
+        assert all(isinstance(v, str) and len(v) == 20 for v in values)
+        assert len(value._batch) == 3
+        assert value._batch_index == 1
+
+
+def test_json_compile_template_sets_batch_size():
+    config = MimeoConfigFactory.parse({
+        "output": {
+            "format": "json",
+        },
+        "_templates_": [
+            {
+                "count": 3,
+                "model": {
+                    "SomeEntity": {
+                        "ChildNode1": "{random_str}",
+                        "ChildNode2": ["{random_int}"],
+                    },
+                },
+            },
+        ],
+    })
+    with MimeoContextManager(config):
+        plan = JSONGenerator.compile_template(config.templates[0])
+        child_1, child_2 = plan.root.children
+        assert child_1.value._batch_size == 3
+        assert child_2.children[0].value._batch_size == 3
+
+
+def test_json_compile_template():
+    config = MimeoConfigFactory.parse({
+        "output": {
+            "format": "json",
+        },
+        "_templates_": [
+            {
+                "count": 5,
+                "model": {
+                    "SomeEntity": {
+                        ":ChildNode1:": "value-1",
+                        "ChildNode2": ["{auto_increment}", {"GrandChild": True}],
+                        "ChildNode3": {
+                            "_mimeo_util": {
+                                "_name": "random_int",
+                            },
+                        },
+                        "ChildNode4": {
+                            "_templates_": [
+                                {
+                                    "count": 2,
+                                    "model": {
+                                        "NestedEntity": "{:ChildNode1:}",
+                                    },
+                                },
+                            ],
+                        },
+                    },
+                },
+            },
+        ],
+    })
+    with MimeoContextManager(config):
+        plan = JSONGenerator.compile_template(config.templates[0])
+        assert plan.template is config.templates[0]
+
+        root = plan.root
+        assert isinstance(root, DictNode)
+        assert root.name == "SomeEntity"
+        assert len(root.children) == 4
+
+        child_1, child_2, child_3, child_4 = root.children
+        assert isinstance(child_1, AtomicNode)
+        assert child_1.name == "ChildNode1"
+        assert child_1.special is False
+        assert isinstance(child_1.value, LiteralValue)
+
+        assert isinstance(child_2, ListNode)
+        assert child_2.name == "ChildNode2"
+        assert isinstance(child_2.children[0], AtomicNode)
+        assert child_2.children[0].name is None
+        assert isinstance(child_2.children[0].value, RawUtilValue)
+        assert isinstance(child_2.children[1], StaticNode)
+        assert child_2.children[1].fragment == {"GrandChild": True}
+
+        assert isinstance(child_3, AtomicNode)
+        assert isinstance(child_3.value, ParametrizedUtilValue)
+
+        assert isinstance(child_4, TemplatesNode)
+        assert child_4.name == "ChildNode4"
+        assert len(child_4.plans) == 1
+        nested_templates = config.templates[0].model.get_nested_templates(
+            config.templates[0].model.root_data["ChildNode4"]["_templates_"])
+        assert child_4.plans[0].template is nested_templates[0]
+        nested_root = child_4.plans[0].root
+        assert isinstance(nested_root, AtomicNode)
+        assert nested_root.name == "NestedEntity"
+        assert isinstance(nested_root.value, SpecialFieldValue)
+
+
+def test_xml_compile_template():
+    config = MimeoConfigFactory.parse({
+        "output": {
+            "format": "xml",
+        },
+        "_templates_": [
+            {
+                "count": 5,
+                "model": {
+                    "SomeEntity": {
+                        "@xmlns": "http://mimeo.arch.com/default-namespace",
+                        "ChildNode1": {
+                            "@attr": "value",
+                            "#text": "{auto_increment}",
+                        },
+                        "ChildNode2": ["value-1", "value-2"],
+                        "_templates_": [
+                            {
+                                "count": 2,
+                                "model": {
+                                    "NestedEntity": "value",
+                                },
+                            },
+                        ],
+                    },
+                },
+            },
+        ],
+    })
+    with MimeoContextManager(config):
+        plan = XMLGenerator.compile_template(config.templates[0])
+
+        root = plan.root
+        assert isinstance(root, DictNode)
+        assert root.name == "SomeEntity"
+        assert root.attrs == {"xmlns": "http://mimeo.arch.com/default-namespace"}
+
+        child_1, child_2, child_3 = root.children
+        assert isinstance(child_1, AtomicNode)
+        assert child_1.attrs == {"attr": "value"}
+        assert isinstance(child_1.value, RawUtilValue)
+
+        assert isinstance(child_2, StaticNode)
+        assert [(element.tag, element.text)
+                for element in child_2.fragment] == [("ChildNode2", "value-1"),
+                                                     ("ChildNode2", "value-2")]
+
+        assert isinstance(child_3, TemplatesNode)
+        assert len(child_3.plans) == 1
+
+
+def test_xml_compile_template_unsupported_list():
+    config = MimeoConfigFactory.parse({
+        "output": {
+            "format": "xml",
+        },
+        "_templates_": [
+            {
+                "count": 5,
+                "model": {
+                    "SomeEntity": {
+                        "ChildNode": [["value-1"]],
+                    },
+                },
+            },
+        ],
+    })
+
+    @assert_throws(err_type=UnsupportedStructureError,
+                   msg="An array can include only atomic types (including Mimeo Utils) "
+                       "or only JSON objects (when output format is XML)! Unsupported "
+                       "structure found in {e}: {s}",
+                   e="ChildNode", s="[['value-1']]")
+    def _test():
+        with MimeoContextManager(config):
+            XMLGenerator.compile_template(config.templates[0])
+
+    _test()
+
+
+def test_json_static_subtree_folding():
+    config = MimeoConfigFactory.parse({
+        "output": {
+            "format": "json",
+        },
+        "refs": {
+            "custom_ref": {
+                "context": "SomeEntity",
+                "field": "Referenced",
+                "type": "any",
+            },
+        },
+        "_templates_": [
+            {
+                "count": 3,
+                "model": {
+                    "SomeEntity": {
+                        "Static": {
+                            "ChildNode1": "value-1",
+                            "ChildNode2": [1, 2, {"GrandChild": None}],
+                        },
+                        "WithReference": {
+                            "Referenced": "value-1",
+                        },
+                        "WithSpecialField": {
+                            ":Special:": "value-1",
+                        },
+                        "Dynamic": {
+                            "ChildNode1": "{:Special:}",
+                            "ChildNode2": "{auto_increment}",
+                        },
+                    },
+                },
+            },
+        ],
+    })
+    with MimeoContextManager(config):
+        plan = JSONGenerator.compile_template(config.templates[0])
+        static, with_reference, with_special_field, dynamic = plan.root.children
+        assert isinstance(static, StaticNode)
+        assert static.fragment == {
+            "ChildNode1": "value-1",
+            "ChildNode2": [1, 2, {"GrandChild": None}],
+        }
+        assert isinstance(with_reference, DictNode)
+        assert isinstance(with_special_field, DictNode)
+        assert isinstance(dynamic, DictNode)
+        assert isinstance(dynamic.children[0], AtomicNode)
+
+        data = list(JSONGenerator.generate(config.templates))
+        assert len(data) == 3
+        for index, data_unit in enumerate(data, start=1):
+            assert data_unit == {
+                "SomeEntity": {
+                    "Static": {
+                        "ChildNode1": "value-1",
+                        "ChildNode2": [1, 2, {"GrandChild": None}],
+                    },
+                    "WithReference": {
+                        "Referenced": "value-1",
+                    },
+                    "WithSpecialField": {
+                        "Special": "value-1",
+                    },
+                    "Dynamic": {
+                        "ChildNode1": "value-1",
+                        "ChildNode2": f"{index:05d}",
+                    },
+                },
+            }
+
+
+def test_json_unreferenced_special_fields_folding():
+    config = MimeoConfigFactory.parse({
+        "output": {
+            "format": "json",
+        },
+        "_templates_": [
+            {
+                "count": 2,
+                "model": {
+                    "SomeEntity": {
+                        "Unreferenced": {
+                            ":Special:": "value-1",
+                        },
+                        ":Referenced:": "{auto_increment}",
+                        "Dynamic": "{:Referenced:}",
+                    },
+                },
+            },
+        ],
+    })
+    with MimeoContextManager(config):
+        plan = JSONGenerator.compile_template(config.templates[0])
+        unreferenced, referenced, dynamic = plan.root.children
+        assert isinstance(unreferenced, StaticNode)
+        assert unreferenced.fragment == {"Special": "value-1"}
+        assert referenced.special is True
+        assert isinstance(dynamic.value, SpecialFieldValue)
+
+        data = list(JSONGenerator.generate(config.templates))
+        assert data == [
+            {
+                "SomeEntity": {
+                    "Unreferenced": {"Special": "value-1"},
+                    "Referenced": "00001",
+                    "Dynamic": "00001",
+                },
+            },
+            {
+                "SomeEntity": {
+                    "Unreferenced": {"Special": "value-1"},
+                    "Referenced": "00002",
+                    "Dynamic": "00002",
+                },
+            },
+        ]
+
+
+def test_xml_static_subtree_folding():
+    config = MimeoConfigFactory.parse({
+        "output": {
+            "format": "xml",
+        },
+        "_templates_": [
+            {
+                "count": 2,
+                "model": {
+                    "SomeEntity": {
+                        "Static": {
+                            "@attr": "value",
+                            "ChildNode1": True,
+                            "ChildNode2": None,
+                        },
+                        "Dynamic": "{auto_increment}",
+                    },
+                },
+            },
+        ],
+    })
+    with MimeoContextManager(config):
+        plan = XMLGenerator.compile_template(config.templates[0])
+        static, dynamic = plan.root.children
+        assert isinstance(static, StaticNode)
+        assert isinstance(dynamic, AtomicNode)
+
+        data = list(XMLGenerator.generate(config.templates))
+        assert len(data) == 2
+        static_elements = [data_unit.find("Static") for data_unit in data]
+        assert static_elements[0] is not static_elements[1]
+        for data_unit in data:
+            assert data_unit.find("Static").attrib == {"attr": "value"}
+            assert data_unit.find("Static/ChildNode1").text == "true"
+            assert data_unit.find("Static/ChildNode2").text == ""
+
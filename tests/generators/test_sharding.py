@@ -0,0 +1,389 @@
+import pytest
+
+from mimeo.config import MimeoConfigFactory
+from mimeo.context import MimeoContextManager
+from mimeo.database import MimeoDB
+from mimeo.database.exc import OutOfStockError
+from mimeo.generators import JSONGenerator
+from mimeo.generators.sharding import ShardedGenerator
+
+
+def _parse_json_config(templates: list, **kwargs):
+    return MimeoConfigFactory.parse({
+        "output": {
+            "format": "json",
+        },
+        **kwargs,
+        "_templates_": templates,
+    })
+
+
+def test_shards_planning():
+    config = _parse_json_config([
+        {
+            "count": 10,
+            "model": {
+                "SomeEntity": {
+                    "Id": "{auto_increment}",
+                    "Custom": {
+                        "_mimeo_util": {
+                            "_name": "auto_increment",
+                            "pattern": "{}",
+                        },
+                    },
+                    "Children": {
+                        "_templates_": [
+                            {
+                                "count": 3,
+                                "model": {
+                                    "Child": "{auto_increment}",
+                                },
+                            },
+                        ],
+                    },
+                },
+            },
+        },
+        {
+            "count": 3,
+            "model": {
+                "SomeEntity": "{auto_increment}",
+            },
+        },
+    ])
+    sharded_generator = ShardedGenerator(config, processes=2, shard_size=4)
+    assert sharded_generator.is_shardable()
+
+    shards = sharded_generator._shards
+    assert [(shard.template_index, shard.index, shard.start, shard.count)
+            for shard in shards] == [(0, 0, 0, 4),
+                                     (0, 1, 4, 4),
+                                     (0, 2, 8, 2),
+                                     (1, 3, 0, 3)]
+    assert [shard.id_offsets for shard in shards] == [
+        {"SomeEntity": 0, "Child": 0},
+        {"SomeEntity": 8, "Child": 12},
+        {"SomeEntity": 16, "Child": 24},
+        {"SomeEntity": 20},
+    ]
+
+
+def test_shards_planning_unique_slices():
+    config = _parse_json_config(
+        [
+            {
+                "count": 10,
+                "model": {
+                    "SomeEntity": {
+                        "Country": "{country}",
+                        "Currency": {
+                            "_mimeo_util": {
+                                "_name": "currency",
+                                "unique": True,
+                            },
+                        },
+                        "Children": {
+                            "_templates_": [
+                                {
+                                    "count": 3,
+                                    "model": {
+                                        "Child": "{NAME}",
+                                    },
+                                },
+                            ],
+                        },
+                    },
+                },
+            },
+            {
+                "count": 3,
+                "model": {
+                    "SomeEntity": {
+                        "Country": {
+                            "_mimeo_util": {
+                                "_name": "country",
+                                "unique": False,
+                            },
+                        },
+                        "Currency": "{currency}",
+                    },
+                },
+            },
+        ],
+        vars={
+            "NAME": {
+                "_mimeo_util": {
+                    "_name": "first_name",
+                },
+            },
+        })
+    sharded_generator = ShardedGenerator(config, processes=2, shard_size=4)
+
+    assert [shard.unique_slices for shard in sharded_generator._shards] == [
+        {"SomeEntity": {"countries": (0, 4, 10), "currencies": (0, 4, 10)},
+         "Child": {"first_names": (0, 12, 30)}},
+        {"SomeEntity": {"countries": (4, 8, 10), "currencies": (4, 8, 10)},
+         "Child": {"first_names": (12, 24, 30)}},
+        {"SomeEntity": {"countries": (8, 10, 10), "currencies": (8, 10, 10)},
+         "Child": {"first_names": (24, 30, 30)}},
+        {"SomeEntity": {}},
+    ]
+
+
+def test_single_shard():
+    config = _parse_json_config([
+        {
+            "count": 5,
+            "model": {
+                "SomeEntity": "{auto_increment}",
+            },
+        },
+    ])
+    assert not ShardedGenerator(config, processes=2).is_shardable()
+
+
+def test_non_shardable_configs():
+    non_shardable_values = [
+        "{custom_ref}",
+        {"_mimeo_util": {"_name": "key", "context": "OtherEntity"}},
+        {"_mimeo_util": {"_name": "curr_iter", "context": "OtherEntity"}},
+        {"_mimeo_util": {"_name": "key", "iteration": 1}},
+        {"_mimeo_util": {"_name": "random_item", "items": ["{auto_increment}"]}},
+        {"_mimeo_util": {"_name": "random_item", "items": ["{CUSTOM_VAR}"]}},
+        "{KEY_VAR}",
+    ]
+    for value in non_shardable_values:
+        config = _parse_json_config(
+            [
+                {
+                    "count": 5,
+                    "model": {
+                        "SomeEntity": {
+                            "ChildNode": value,
+                        },
+                    },
+                },
+            ],
+            vars={
+                "CUSTOM_VAR": "value",
+                "KEY_VAR": {"_mimeo_util": {"_name": "key", "context": "OtherEntity"}},
+            },
+            refs={
+                "custom_ref": {
+                    "context": "OtherEntity",
+                    "field": "ChildNode",
+                    "type": "any",
+                },
+            } if value == "{custom_ref}" else {})
+        assert not ShardedGenerator(config, processes=2, shard_size=1).is_shardable()
+
+
+def test_non_shardable_config_with_nested_sharded_context():
+    config = _parse_json_config([
+        {
+            "count": 5,
+            "model": {
+                "SomeEntity": {
+                    "Children": {
+                        "_templates_": [
+                            {
+                                "count": 2,
+                                "model": {
+                                    "context": "SomeEntity",
+                                    "Child": "{curr_iter}",
+                                },
+                            },
+                        ],
+                    },
+                },
+            },
+        },
+    ])
+    assert not ShardedGenerator(config, processes=2, shard_size=1).is_shardable()
+
+
+def test_generate_shard():
+    config = _parse_json_config(
+        [
+            {
+                "count": 10,
+                "model": {
+                    "SomeEntity": {
+                        "Id": "{auto_increment}",
+                        "Var": "{ID}",
+                        "Iteration": "{curr_iter}",
+                        "Children": {
+                            "_templates_": [
+                                {
+                                    "count": 2,
+                                    "model": {
+                                        "Child": {
+                                            "Id": "{auto_increment}",
+                                            "Iteration": "{curr_iter}",
+                                        },
+                                    },
+                                },
+                            ],
+                        },
+                    },
+                },
+            },
+        ],
+        vars={
+            "ID": "{auto_increment}",
+        })
+    sharded_generator = ShardedGenerator(config, processes=2, shard_size=3)
+    shard = sharded_generator._shards[2]
+    data = ShardedGenerator._generate_shard(config, shard, seed=1, stringify=False)
+    with MimeoContextManager(config):
+        expected_data = list(JSONGenerator.generate(config.templates))[6:9]
+    assert data == expected_data
+
+
+def test_generate_unique_values():
+    config = _parse_json_config([
+        {
+            "count": 100,
+            "model": {
+                "SomeEntity": {
+                    "_mimeo_util": {
+                        "_name": "country",
+                        "unique": True,
+                    },
+                },
+            },
+        },
+    ])
+    sharded_generator = ShardedGenerator(config, processes=2, shard_size=30)
+    data = list(sharded_generator.generate(stringify=True))
+    assert len(data) == 100
+    assert len(set(data)) == 100
+
+
+def test_generate_unique_values_with_templates_of_different_sizes():
+    config = _parse_json_config([
+        {
+            "count": 100,
+            "model": {
+                "SomeEntity": {
+                    "_mimeo_util": {
+                        "_name": "country",
+                        "unique": True,
+                    },
+                },
+            },
+        },
+        {
+            "count": 300,
+            "model": {
+                "SomeEntity": "{random_int}",
+            },
+        },
+    ])
+    sharded_generator = ShardedGenerator(config, processes=2, shard_size=30)
+    data = list(sharded_generator.generate(stringify=True))
+    assert len(data) == 400
+    assert len(set(data[:100])) == 100
+
+
+
+def test_generate_unique_values_of_country_and_sex_pools():
+    config = _parse_json_config([
+        {
+            "count": 1,
+            "model": {
+                "SomeEntity": {
+                    "City": {
+                        "_mimeo_util": {
+                            "_name": "city",
+                            "country": "ABW",
+                            "unique": True,
+                        },
+                    },
+                    "Name": {
+                        "_mimeo_util": {
+                            "_name": "first_name",
+                            "sex": "female",
+                        },
+                    },
+                },
+            },
+        },
+        {
+            "count": 300,
+            "model": {
+                "SomeEntity": {
+                    "City": "{city}",
+                    "Name": "{first_name}",
+                },
+            },
+        },
+    ])
+    sharded_generator = ShardedGenerator(config, processes=2, shard_size=100)
+    assert [shard.unique_slices for shard in sharded_generator._shards] == [
+        {"SomeEntity": {"cities:ABW": (0, 1, 1), "first_names:F": (0, 1, 1)}},
+        {"SomeEntity": {"cities": (0, 100, 300), "first_names": (0, 100, 300)}},
+        {"SomeEntity": {"cities": (100, 200, 300), "first_names": (100, 200, 300)}},
+        {"SomeEntity": {"cities": (200, 300, 300), "first_names": (200, 300, 300)}},
+    ]
+
+    data = list(sharded_generator.generate())
+    assert len(data) == 301
+
+def test_generate_propagates_shard_errors():
+    config = _parse_json_config([
+        {
+            "count": 300,
+            "model": {
+                "SomeEntity": {
+                    "_mimeo_util": {
+                        "_name": "country",
+                        "unique": True,
+                    },
+                },
+            },
+        },
+    ])
+    sharded_generator = ShardedGenerator(config, processes=2, shard_size=100)
+    with pytest.raises(OutOfStockError) as err:
+        list(sharded_generator.generate())
+
+    assert err.value.args[0] == ("No more unique values, database contain only "
+                                 f"{MimeoDB.NUM_OF_COUNTRIES} countries.")
+
+
+def test_generate_ids_of_vars_in_special_fields_and_nested_vars():
+    config = _parse_json_config(
+        [
+            {
+                "count": 25,
+                "model": {
+                    "SomeEntity": {
+                        ":Name:": "name",
+                        "Id": "{:Name:}-{ID}",
+                        "Nested": "{OUTER}",
+                    },
+                },
+            },
+        ],
+        vars={
+            "ID": {
+                "_mimeo_util": {
+                    "_name": "auto_increment",
+                },
+            },
+            "OUTER": "{INNER}",
+            "INNER": "{auto_increment}",
+        })
+    sharded_generator = ShardedGenerator(config, processes=2, shard_size=10)
+    assert [shard.id_offsets for shard in sharded_generator._shards] == [
+        {"SomeEntity": 0},
+        {"SomeEntity": 20},
+        {"SomeEntity": 40},
+    ]
+
+    data = list(sharded_generator.generate())
+    with MimeoContextManager(config):
+        expected_data = list(JSONGenerator.generate(config.templates))
+    assert data == expected_data
+    assert len({data_unit["SomeEntity"]["Id"] for data_unit in data}) == 25
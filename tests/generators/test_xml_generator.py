@@ -1735,6 +1735,44 @@ def test_stringify_with_indent_and_without_xml_declaration():
     _test(config_from_xml)
 
 
+
+def test_stringify_with_indent_and_special_characters():
+    config = MimeoConfigFactory.parse({
+        "output": {
+            "format": "xml",
+            "indent": 2,
+        },
+        "_templates_": [
+            {
+                "count": 1,
+                "model": {
+                    "SomeEntity": {
+                        "@attr": "<\"value\" & 'value'>",
+                        "@xmlns": "http://mimeo.arch.com/default-namespace",
+                        "ChildNode1": {
+                            "GrandChild": "<\"value\" & 'value'>",
+                        },
+                        "ChildNode2": "",
+                        "ChildNode3": None,
+                    },
+                },
+            },
+        ],
+    })
+    with MimeoContextManager(config):
+        generator = XMLGenerator(config)
+        data = next(generator.generate(config.templates))
+        assert generator.stringify(data) == (
+            '<SomeEntity'
+            ' xmlns="http://mimeo.arch.com/default-namespace"'
+            ' attr="&lt;&quot;value&quot; &amp; \'value\'&gt;">\n'
+            '  <ChildNode1>\n'
+            '    <GrandChild>&lt;&quot;value&quot; &amp; \'value\'&gt;</GrandChild>\n'
+            '  </ChildNode1>\n'
+            '  <ChildNode2/>\n'
+            '  <ChildNode3/>\n'
+            '</SomeEntity>\n')
+
 def test_stringify_without_indent_and_with_xml_declaration():
     config_from_dict = MimeoConfigFactory.parse({
         "output": {
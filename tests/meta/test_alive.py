@@ -1,4 +1,9 @@
 
+import asyncio
+import gc
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
 from mimeo.meta import Alive, OnlyOneAlive
 from mimeo.meta.exc import InstanceNotAliveError
 from tests.utils import assert_throws
@@ -50,3 +55,47 @@ def test_assert_alive_true():
 def test_assert_alive_false():
     instance = SomeClass()
     instance.assert_alive()
+
+
+def test_only_one_alive_per_thread():
+    def _enter_in_thread():
+        with SomeClass() as thread_instance:
+            assert thread_instance is SomeClass()
+            return thread_instance
+
+    with SomeClass() as instance1:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(_enter_in_thread) for _ in range(2)]
+            thread_instances = [future.result() for future in futures]
+        assert instance1 not in thread_instances
+        assert thread_instances[0] is not thread_instances[1]
+        assert instance1.is_alive()
+        assert SomeClass() is instance1
+
+
+def test_only_one_alive_not_alive_in_other_thread():
+    with SomeClass() as instance, ThreadPoolExecutor(max_workers=1) as executor:
+        assert not executor.submit(instance.is_alive).result()
+        assert instance.is_alive()
+
+
+def test_only_one_alive_inherited_by_asyncio_task():
+    async def _get_instance():
+        return SomeClass()
+
+    async def _main():
+        with SomeClass() as instance:
+            assert await asyncio.create_task(_get_instance()) is instance
+
+    asyncio.run(_main())
+
+
+def test_only_one_alive_releases_dead_instances():
+    with SomeClass() as instance:
+        assert OnlyOneAlive.get_alive_instances() == {SomeClass: instance}
+    assert OnlyOneAlive.get_alive_instances() == {}
+
+    instance_ref = weakref.ref(instance)
+    del instance
+    gc.collect()
+    assert instance_ref() is None
@@ -0,0 +1,66 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from mimeo.meta import LRUCache
+
+
+def test_get_and_put():
+    cache = LRUCache(2)
+    assert cache.get("a") is None
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    assert len(cache) == 1
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.evictions == 0
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_clear():
+    cache = LRUCache(1)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("b")
+    cache.get("a")
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == 0
+    assert cache.misses == 0
+    assert cache.evictions == 0
+
+
+def test_get_none_value():
+    cache = LRUCache(1)
+    cache.put("a", None)
+    assert cache.get("a", "default") is None
+    assert cache.get("b", "default") == "default"
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_shared_by_threads():
+    cache = LRUCache(10)
+
+    def use_cache(thread_index: int):
+        for i in range(1_000):
+            key = (thread_index + i) % 20
+            if cache.get(key) is None:
+                cache.put(key, i)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(use_cache, i) for i in range(8)]
+    for future in futures:
+        assert future.exception() is None
+    assert len(cache) == 10
+    assert cache.hits + cache.misses == 8_000
@@ -7,7 +7,7 @@ import pytest
 
 from mimeo import Mimeograph
 from mimeo.config import MimeoConfigFactory
-from mimeo.exc import NotRunningMimeographError
+from mimeo.exc import InvalidMimeographParameterError, NotRunningMimeographError
 from tests.utils import assert_throws
 
 
@@ -443,6 +443,259 @@ def test_submit_as_context_manager():
             assert file.readline() == "}"
 
 
+def test_submit_streaming_in_chunks():
+    config = {
+        "output": {
+            "direction": "file",
+            "format": "json",
+            "directory_path": "test_mimeograph-dir",
+            "file_name": "output",
+        },
+        "_templates_": [
+            {
+                "count": 10,
+                "model": {
+                    "SomeEntity": {
+                        "ChildNode": "{auto_increment}",
+                    },
+                },
+            },
+        ],
+    }
+    mimeo_config = MimeoConfigFactory.parse(config)
+    assert not Path("test_mimeograph-dir").exists()
+    with Mimeograph(chunk_size=3) as mimeo:
+        mimeo.submit(("json-config", mimeo_config))
+    assert mimeo._failed_configs == []
+    assert Path("test_mimeograph-dir").exists()
+    assert len(list(Path("test_mimeograph-dir").iterdir())) == 10
+    for i in range(1, 11):
+        file_path = f"test_mimeograph-dir/output-{i}.json"
+        with Path(file_path).open() as file:
+            assert file.readline() == f'{{"SomeEntity": {{"ChildNode": "{i:05d}"}}}}'
+
+
+def test_config_failed_at_generation_step_while_streaming():
+    config = {
+        "output": {
+            "direction": "file",
+            "format": "xml",
+            "directory_path": "test_mimeograph-dir",
+            "file_name": "output",
+        },
+        "_templates_": [
+            {
+                "count": 10,
+                "model": {
+                    "SomeEntity": {
+                        "ChildNode1": "Bolívar Soberano",  # Non-ascii character
+                    },
+                },
+            },
+        ],
+    }
+    mimeo_config = MimeoConfigFactory.parse(config)
+    with Mimeograph(chunk_size=3) as mimeo:
+        mimeo.submit(("non-ascii-character-config", mimeo_config))
+    assert mimeo._failed_configs == ["non-ascii-character-config"]
+    assert not Path("test_mimeograph-dir").exists()
+
+
+def test_generate_lazily():
+    config = {
+        "_templates_": [
+            {
+                "count": 1_000_000_000,
+                "model": {
+                    "SomeEntity": {
+                        "ChildNode": "{auto_increment}",
+                    },
+                },
+            },
+        ],
+    }
+    mimeo_config = MimeoConfigFactory.parse(config)
+    data = Mimeograph.generate(mimeo_config)
+    first_data_unit = next(data)
+    second_data_unit = next(data)
+    data.close()
+    assert first_data_unit.find("ChildNode").text == "00001"
+    assert second_data_unit.find("ChildNode").text == "00002"
+
+
+def test_generate_in_processes():
+    config = {
+        "output": {
+            "format": "json",
+        },
+        "_templates_": [
+            {
+                "count": 25_000,
+                "model": {
+                    "SomeEntity": {
+                        "Id": "{auto_increment}",
+                        "Iteration": "{curr_iter}",
+                    },
+                },
+            },
+        ],
+    }
+    mimeo_config = MimeoConfigFactory.parse(config)
+    data = list(Mimeograph.generate(mimeo_config, processes=2))
+    assert data == list(Mimeograph.generate(mimeo_config))
+
+
+def test_generate_in_processes_with_unique_values():
+    config = {
+        "output": {
+            "format": "json",
+        },
+        "_templates_": [
+            {
+                "count": 100,
+                "model": {
+                    "Country": {
+                        "Name": {
+                            "_mimeo_util": {
+                                "_name": "country",
+                                "unique": True,
+                            },
+                        },
+                    },
+                },
+            },
+            {
+                "count": 30_000,
+                "model": {
+                    "SomeEntity": {
+                        "Id": "{auto_increment}",
+                    },
+                },
+            },
+        ],
+    }
+    mimeo_config = MimeoConfigFactory.parse(config)
+    data = list(Mimeograph.generate(mimeo_config, processes=2))
+    assert len(data) == 30_100
+    assert len({data_unit["Country"]["Name"] for data_unit in data[:100]}) == 100
+
+
+def test_submit_generating_in_processes():
+    config = {
+        "output": {
+            "direction": "file",
+            "format": "json",
+            "directory_path": "test_mimeograph-dir",
+            "file_name": "output",
+        },
+        "_templates_": [
+            {
+                "count": 10,
+                "model": {
+                    "SomeEntity": {
+                        "ChildNode": "{auto_increment}",
+                    },
+                },
+            },
+        ],
+    }
+    mimeo_config = MimeoConfigFactory.parse(config)
+    with Mimeograph(processes=2) as mimeo:
+        mimeo.submit(("json-config", mimeo_config))
+    assert mimeo._failed_configs == []
+    assert len(list(Path("test_mimeograph-dir").iterdir())) == 10
+
+
+def test_submit_with_multiple_generator_workers():
+    mimeo_configs = [MimeoConfigFactory.parse({
+        "output": {
+            "direction": "file",
+            "format": "json",
+            "directory_path": f"test_mimeograph-dir/{config_id}",
+            "file_name": "output",
+        },
+        "_templates_": [
+            {
+                "count": 100,
+                "model": {
+                    "SomeEntity": {
+                        "Id": "{auto_increment}",
+                        "Iteration": "{curr_iter}",
+                    },
+                },
+            },
+        ],
+    }) for config_id in range(4)]
+    with Mimeograph(generator_workers=4) as mimeo:
+        for config_id, mimeo_config in enumerate(mimeo_configs):
+            mimeo.submit((f"config-{config_id}", mimeo_config))
+    assert mimeo._failed_configs == []
+    for config_id in range(4):
+        output_dir = Path(f"test_mimeograph-dir/{config_id}")
+        assert len(list(output_dir.iterdir())) == 100
+        for index in range(1, 101):
+            with Path(f"{output_dir}/output-{index}.json").open() as file_content:
+                assert file_content.read() == (
+                    f'{{"SomeEntity": {{"Id": "{index:05d}", "Iteration": {index}}}}}')
+
+
+def test_generate_with_seed():
+    config = {
+        "output": {
+            "format": "json",
+        },
+        "seed": 42,
+        "_templates_": [
+            {
+                "count": 20,
+                "model": {
+                    "SomeEntity": {
+                        "Key": "{key}",
+                        "String": "{random_str}",
+                        "Integer": "{random_int}",
+                        "City": "{city}",
+                        "UniqueCountry": {
+                            "_mimeo_util": {
+                                "_name": "country",
+                                "unique": True,
+                            },
+                        },
+                    },
+                },
+            },
+        ],
+    }
+    mimeo_config = MimeoConfigFactory.parse(config)
+    data = list(Mimeograph.generate(mimeo_config))
+    assert data == list(Mimeograph.generate(mimeo_config))
+
+    mimeo_config.seed = 43
+    assert data != list(Mimeograph.generate(mimeo_config))
+
+
+def test_generate_in_processes_with_seed():
+    config = {
+        "output": {
+            "format": "json",
+        },
+        "seed": 42,
+        "_templates_": [
+            {
+                "count": 25_000,
+                "model": {
+                    "SomeEntity": {
+                        "Key": "{key}",
+                        "String": "{random_str}",
+                    },
+                },
+            },
+        ],
+    }
+    mimeo_config = MimeoConfigFactory.parse(config)
+    data = list(Mimeograph.generate(mimeo_config, processes=2))
+    assert data == list(Mimeograph.generate(mimeo_config, processes=2))
+
+
 @assert_throws(err_type=NotRunningMimeographError,
                msg="The Mimeograph instance is not running!")
 def test_submit_when_non_running():
@@ -537,3 +790,15 @@ def test_config_failed_at_consuming_step():
         time.sleep(0.05)
         assert mimeo._failed_configs == ["no-connection-config"]
     assert not Path("test_mimeograph-dir").exists()
+
+
+@assert_throws(err_type=InvalidMimeographParameterError,
+               msg="Provided chunk_size [0] is not a positive integer!")
+def test_non_positive_chunk_size():
+    Mimeograph(chunk_size=0)
+
+
+@assert_throws(err_type=InvalidMimeographParameterError,
+               msg="Provided generator_workers [-1] is not a positive integer!")
+def test_non_positive_generator_workers():
+    Mimeograph(generator_workers=-1)
@@ -109,3 +109,32 @@ def test_city_parametrized_with_country(default_config):
         mimeo_util = {"_name": "city", "country": "GBR"}
         city = UtilsRenderer.render_parametrized(mimeo_util)
         assert city in gbr_cities
+
+
+def test_city_render_batch(default_config):
+    mimeo_db = MimeoDB()
+    gbr_cities = [city.name_ascii for city in iter(mimeo_db.get_cities_of("GBR"))]
+    with MimeoContextManager(default_config) as mimeo_manager:
+        context = mimeo_manager.get_context("SomeEntity")
+        mimeo_manager.set_current_context(context)
+
+        mimeo_util = UtilsRenderer.create_mimeo_util({
+            "_name": "city",
+            "unique": False,
+            "country": "GBR",
+        })
+        cities = mimeo_util.render_batch(100)
+        assert mimeo_util.is_batchable()
+        assert len(cities) == 100
+        assert all(city in gbr_cities for city in cities)
+
+
+def test_city_render_batch_with_unique(default_config):
+    with MimeoContextManager(default_config) as mimeo_manager:
+        context = mimeo_manager.get_context("SomeEntity")
+        mimeo_manager.set_current_context(context)
+
+        mimeo_util = UtilsRenderer.create_mimeo_util({"_name": "city"})
+        cities = mimeo_util.render_batch(100)
+        assert not mimeo_util.is_batchable()
+        assert len(set(cities)) == 100
@@ -141,3 +141,22 @@ def test_first_name_parametrized_with_sex(default_config):
         mimeo_util = {"_name": "first_name", "sex": "M"}
         first_name = UtilsRenderer.render_parametrized(mimeo_util)
         assert first_name in gbr_first_names
+
+
+def test_first_name_render_batch(default_config):
+    mimeo_db = MimeoDB()
+    female_names = [first_name.name
+                    for first_name in iter(mimeo_db.get_first_names_by_sex("F"))]
+    with MimeoContextManager(default_config) as mimeo_manager:
+        context = mimeo_manager.get_context("SomeEntity")
+        mimeo_manager.set_current_context(context)
+
+        mimeo_util = UtilsRenderer.create_mimeo_util({
+            "_name": "first_name",
+            "unique": False,
+            "sex": "F",
+        })
+        first_names = mimeo_util.render_batch(100)
+        assert mimeo_util.is_batchable()
+        assert len(first_names) == 100
+        assert all(first_name in female_names for first_name in first_names)
@@ -112,3 +112,16 @@ def test_key_parametrized_with_context_and_iteration(default_config):
         }
         key_outside_context = UtilsRenderer.render_parametrized(mimeo_util)
         assert key == key_outside_context
+
+
+def test_key_render_in_context(default_config):
+    with MimeoContextManager(default_config) as mimeo_manager:
+        context1 = mimeo_manager.get_context("SomeEntity")
+        context2 = mimeo_manager.get_context("SomeOtherEntity")
+        context1.next_iteration()
+        context2.next_iteration()
+        mimeo_manager.set_current_context(context1)
+
+        key_util = UtilsRenderer.create_mimeo_util({"_name": "key"})
+        assert key_util.render_in_context(context2) == context2.curr_iteration().key
+        assert key_util.render() == context1.curr_iteration().key
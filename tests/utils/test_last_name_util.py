@@ -57,3 +57,49 @@ def test_last_name_parametrized_with_unique(default_config):
         mimeo_util = {"_name": "last_name", "unique": False}
         last_name = UtilsRenderer.render_parametrized(mimeo_util)
         assert last_name in last_names
+
+
+def test_last_name_unique_beyond_first_names(default_config):
+    mimeo_db = MimeoDB()
+    last_names = set(mimeo_db.get_last_names())
+    with MimeoContextManager(default_config) as mimeo_manager:
+        context = mimeo_manager.get_context("SomeEntity")
+        mimeo_manager.set_current_context(context)
+
+        mimeo_util = UtilsRenderer.create_mimeo_util({"_name": "last_name"})
+        rendered_last_names = [mimeo_util.render()
+                               for _ in range(MimeoDB.NUM_OF_FIRST_NAMES + 1)]
+        assert all(last_name in last_names for last_name in rendered_last_names)
+
+
+def test_last_name_render_batch(default_config):
+    mimeo_db = MimeoDB()
+    last_names = list(mimeo_db.get_last_names())
+    with MimeoContextManager(default_config) as mimeo_manager:
+        context = mimeo_manager.get_context("SomeEntity")
+        mimeo_manager.set_current_context(context)
+
+        mimeo_util = UtilsRenderer.create_mimeo_util({
+            "_name": "last_name",
+            "unique": False,
+        })
+        rendered_last_names = mimeo_util.render_batch(100)
+        assert mimeo_util.is_batchable()
+        assert len(rendered_last_names) == 100
+        assert all(last_name in last_names for last_name in rendered_last_names)
+
+
+def test_last_name_render_batch_from_all_last_names(default_config):
+    mimeo_db = MimeoDB()
+    first_last_names = set(mimeo_db.get_last_names()[:MimeoDB.NUM_OF_FIRST_NAMES])
+    with MimeoContextManager(default_config) as mimeo_manager:
+        context = mimeo_manager.get_context("SomeEntity")
+        mimeo_manager.set_current_context(context)
+
+        mimeo_util = UtilsRenderer.create_mimeo_util({
+            "_name": "last_name",
+            "unique": False,
+        })
+        rendered_last_names = mimeo_util.render_batch(1_000)
+        assert any(last_name not in first_last_names
+                   for last_name in rendered_last_names)
@@ -5,6 +5,7 @@ import pytest
 from mimeo.config import MimeoConfigFactory
 from mimeo.context import MimeoContextManager
 from mimeo.context.exc import VarNotFoundError
+from mimeo.meta import LRUCache
 from mimeo.utils import MimeoRenderer
 from mimeo.utils.exc import InvalidValueError, NotASpecialFieldError
 from tests.utils import assert_throws
@@ -629,3 +630,73 @@ def test_special_fields_as_partial_values_bool(default_config):
 
         rendered_field = MimeoRenderer.render("custom-{:ChildNode1:}-value")
         assert rendered_field == "custom-true-value"
+
+
+def test_parse():
+    value = "{:Id:}-{ENV}-{:Id:}-{:ns:Name:}\n{OTHER}-{ENV}"
+    template = MimeoRenderer.parse(value)
+    assert template.segments == ["", "-", "-", "-", "\n{OTHER}-", ""]
+    assert template.placeholders == ["{:Id:}", "{ENV}", "{:Id:}",
+                                     "{:ns:Name:}", "{ENV}"]
+    assert template.special_fields == ["{:ns:Name:}", "{:Id:}"]
+    assert template.vars == ["{ENV}"]
+    assert template.is_ambiguous
+    assert not template.is_raw_mimeo_util
+    assert MimeoRenderer.parse(value) is template
+
+    template = MimeoRenderer.parse("{auto_increment}")
+    assert template.placeholders == []
+    assert template.is_raw_mimeo_util
+
+
+def test_special_fields_and_vars_as_partial_values(default_config):
+    with MimeoContextManager(default_config) as mimeo_manager:
+        context = mimeo_manager.get_context("SomeEntity")
+        mimeo_manager.set_current_context(context)
+        context.next_iteration()
+        context.curr_iteration().add_special_field("ChildNode1", 1)
+
+        rendered_value = MimeoRenderer.render("{:ChildNode1:}-{CUSTOM_VAR_1}-"
+                                              "{:ChildNode1:}-{CUSTOM_VAR_2}")
+        assert rendered_value == "1-2-1-2"
+
+
+def test_special_fields_as_partial_values_with_placeholders(default_config):
+    with MimeoContextManager(default_config) as mimeo_manager:
+        context = mimeo_manager.get_context("SomeEntity")
+        mimeo_manager.set_current_context(context)
+        context.next_iteration()
+        context.curr_iteration().add_special_field("ChildNode1", "{CUSTOM_VAR_1}")
+        context.curr_iteration().add_special_field("ChildNode2", "")
+
+        assert MimeoRenderer.render("{:ChildNode1:}-value") == "2-value"
+        assert MimeoRenderer.render("{:ChildNode2:}{CUSTOM_VAR_1}") == 2
+
+
+def test_vars_as_partial_values_with_parametrized_mimeo_util():
+    config = MimeoConfigFactory.parse({
+        "vars": {
+            "ID": {
+                "_mimeo_util": {
+                    "_name": "auto_increment",
+                },
+            },
+        },
+        "_templates_": [],
+    })
+    with MimeoContextManager(config) as mimeo_manager:
+        context = mimeo_manager.get_context("SomeEntity")
+        mimeo_manager.set_current_context(context)
+        assert MimeoRenderer.render("{ID}-{ID}") == "00001-00001"
+        assert MimeoRenderer.render("{ID}-{ID}") == "00002-00002"
+
+
+def test_parse_caches_recently_used_templates(monkeypatch):
+    monkeypatch.setattr(MimeoRenderer, "_TEMPLATES", LRUCache(2))
+    template = MimeoRenderer.parse("{ID}-1")
+    assert MimeoRenderer.parse("{ID}-1") is template
+
+    MimeoRenderer.parse("{ID}-2")
+    MimeoRenderer.parse("{ID}-3")
+    assert MimeoRenderer.parse("{ID}-1") is not template
+    assert MimeoRenderer._TEMPLATES.evictions == 2
@@ -1,6 +1,10 @@
 
+import pytest
+
 import tests.utils as test_utils
-from mimeo.utils import MimeoUtil
+from mimeo.context import MimeoContext
+from mimeo.utils import (CityUtil, CountryUtil, CurrencyUtil, FirstNameUtil,
+                         LastNameUtil, MimeoUtil)
 from tests.utils import assert_throws
 
 
@@ -62,3 +66,33 @@ def test_valid_class_instantiation():
                ))
 def test_invalid_class_instantiation():
     InvalidMimeoUtilWithoutRender()
+
+
+def test_render_in_context():
+    mimeo_util = ValidMimeoUtil()
+    mimeo_util.render = lambda: "value"
+    assert mimeo_util.render_in_context(None) == "value"
+
+
+def test_render_batch():
+    mimeo_util = ValidMimeoUtil()
+    mimeo_util.render = lambda: "value"
+    assert mimeo_util.render_batch(3) == ["value", "value", "value"]
+    assert not mimeo_util.is_batchable()
+
+
+@pytest.mark.parametrize("mimeo_util", [
+    CityUtil(unique=False),
+    CityUtil(unique=False, country="USA"),
+    CountryUtil(unique=False),
+    CurrencyUtil(unique=False),
+    FirstNameUtil(unique=False),
+    FirstNameUtil(unique=False, sex="F"),
+    LastNameUtil(unique=False),
+])
+def test_render_in_context_uses_context_random(mimeo_util):
+    context_1 = MimeoContext("SomeEntity", seed=1)
+    context_2 = MimeoContext("SomeEntity", seed=1)
+    values_1 = [mimeo_util.render_in_context(context_1) for _ in range(10)]
+    values_2 = [mimeo_util.render_in_context(context_2) for _ in range(10)]
+    assert values_1 == values_2
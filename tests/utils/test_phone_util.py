@@ -91,3 +91,24 @@ def test_phone_parametrized_with_format_with_no_placeholders():
     phone = UtilsRenderer.render_parametrized(mimeo_util)
     assert isinstance(phone, str)
     assert phone == "No placeholder"
+
+
+def test_phone_render_batch():
+    mimeo_util = UtilsRenderer.create_mimeo_util({
+        "_name": "phone",
+        "format": "+1 xx-X",
+    })
+    phones = mimeo_util.render_batch(100)
+    assert mimeo_util.is_batchable()
+    assert len(phones) == 100
+    for phone in phones:
+        assert len(phone) == 7
+        assert phone[:3] == "+1 "
+        assert phone[3:5].isnumeric()
+        assert phone[5] == "-"
+        assert phone[6].isnumeric()
+
+
+def test_phone_render_batch_with_format_with_no_placeholders():
+    mimeo_util = UtilsRenderer.create_mimeo_util({"_name": "phone", "format": "abc"})
+    assert mimeo_util.render_batch(2) == ["abc", "abc"]
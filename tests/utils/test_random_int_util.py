@@ -77,3 +77,15 @@ def test_random_int_parametrized_with_limit_same_as_start():
 def test_random_int_parametrized_with_limit_lower_than_start():
     mimeo_util = {"_name": "random_int", "start": 2, "limit": 1}
     UtilsRenderer.render_parametrized(mimeo_util)
+
+
+def test_random_int_render_batch():
+    mimeo_util = UtilsRenderer.create_mimeo_util({
+        "_name": "random_int",
+        "start": 5,
+        "limit": 7,
+    })
+    random_integers = mimeo_util.render_batch(100)
+    assert mimeo_util.is_batchable()
+    assert len(random_integers) == 100
+    assert set(random_integers) == {5, 6, 7}
@@ -24,3 +24,14 @@ def test_random_item_parametrized_with_non_empty_items():
     for _ in range(100):
         random_item = UtilsRenderer.render_parametrized(mimeo_util)
         assert random_item in items
+
+
+def test_random_item_render_batch():
+    mimeo_util = UtilsRenderer.create_mimeo_util({
+        "_name": "random_item",
+        "items": ["a", 1, 2.5],
+    })
+    random_items = mimeo_util.render_batch(100)
+    assert mimeo_util.is_batchable()
+    assert len(random_items) == 100
+    assert set(random_items) == {"a", 1, 2.5}
@@ -37,3 +37,26 @@ def test_random_str_parametrized_with_length_zero():
 def test_random_str_parametrized_with_negative_length():
     mimeo_util = {"_name": "random_str", "length": -1}
     UtilsRenderer.render_parametrized(mimeo_util)
+
+
+def test_random_str_render_batch():
+    mimeo_util = UtilsRenderer.create_mimeo_util({"_name": "random_str", "length": 3})
+    random_strings = mimeo_util.render_batch(100)
+    assert mimeo_util.is_batchable()
+    assert len(random_strings) == 100
+    assert all(len(random_str) == 3 for random_str in random_strings)
+    assert len(set(random_strings)) > 1
+
+
+def test_random_str_render_batch_with_length_zero():
+    mimeo_util = UtilsRenderer.create_mimeo_util({"_name": "random_str", "length": 0})
+    assert mimeo_util.render_batch(3) == ["", "", ""]
+
+
+@assert_throws(err_type=InvalidValueError,
+               msg=("The random_str Mimeo Util cannot be parametrized with negative "
+                    "length [{length}] value"),
+               length=-1)
+def test_random_str_render_batch_with_negative_length():
+    mimeo_util = UtilsRenderer.create_mimeo_util({"_name": "random_str", "length": -1})
+    mimeo_util.render_batch(3)